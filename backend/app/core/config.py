@@ -23,3 +23,298 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
 SMTP_FROM_NAME = os.getenv("SMTP_FROM_NAME", "KNU MLA")
 
 FRONTEND_BASE_URL = os.getenv("FRONTEND_BASE_URL", "http://localhost:3000")
+
+# ----------------------------
+# OpenAI 클라이언트 (워커당 1개, keep-alive 커넥션 풀)
+# 기능별 값은 OPENAI_<FEATURE>_<NAME> 으로 덮어쓸 수 있음
+#   예) OPENAI_TRANSLATE_READ_TIMEOUT=20, OPENAI_SPEECH_MAX_RETRIES=0
+# OPENAI_BASE_URL: 부하 테스트용 가짜 서버 등 다른 엔드포인트로 보낼 때 (예: http://127.0.0.1:8100/v1)
+# ----------------------------
+OPENAI_FEATURES = ("chat", "translate", "summarize", "term", "title", "speech")
+
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "") or None
+
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "10"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+OPENAI_READ_TIMEOUT = float(os.getenv("OPENAI_READ_TIMEOUT", "60"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+# 기능별 기본값 (env 미지정 시 사용)
+_OPENAI_FEATURE_DEFAULTS: dict[str, dict[str, float]] = {
+    "chat": {"read_timeout": 60},
+    "translate": {"read_timeout": 30},
+    "summarize": {"read_timeout": 60},
+    "term": {"read_timeout": 30},
+    "title": {"read_timeout": 10, "max_retries": 1},
+    "speech": {"read_timeout": 120},
+}
+
+
+def _openai_feature_env(feature: str, name: str, default, cast):
+    raw = os.getenv(f"OPENAI_{feature.upper()}_{name.upper()}")
+    if raw is None or raw == "":
+        return cast(_OPENAI_FEATURE_DEFAULTS.get(feature, {}).get(name, default))
+    return cast(raw)
+
+
+OPENAI_FEATURE_SETTINGS: dict[str, dict[str, float]] = {
+    feature: {
+        "max_connections": _openai_feature_env(feature, "max_connections", OPENAI_MAX_CONNECTIONS, int),
+        "max_keepalive_connections": _openai_feature_env(
+            feature, "max_keepalive_connections", OPENAI_MAX_KEEPALIVE_CONNECTIONS, int
+        ),
+        "keepalive_expiry": _openai_feature_env(feature, "keepalive_expiry", OPENAI_KEEPALIVE_EXPIRY, float),
+        "connect_timeout": _openai_feature_env(feature, "connect_timeout", OPENAI_CONNECT_TIMEOUT, float),
+        "read_timeout": _openai_feature_env(feature, "read_timeout", OPENAI_READ_TIMEOUT, float),
+        "max_retries": _openai_feature_env(feature, "max_retries", OPENAI_MAX_RETRIES, int),
+    }
+    for feature in OPENAI_FEATURES
+}
+
+# ----------------------------
+# LLM 라우팅 (기능별 model / temperature / max_tokens 정책 - 호출부에 값을 직접 쓰지 않음)
+#   max_tokens = clamp(overhead_tokens + 입력 토큰 추정 * output_ratio * 언어 확장 비율, min_tokens, max_tokens)
+#   입력 토큰이 large_input_tokens 이상이면 large_model 사용 (0이면 사용 안 함)
+#   기능별 값은 LLM_ROUTE_<FEATURE>_<NAME> 으로 덮어씀 (예: LLM_ROUTE_TRANSLATE_MAX_TOKENS=8192)
+#   LLM_LANG_TOKEN_WEIGHTS: 같은 내용을 쓸 때 언어별 상대 토큰 수 (번역 확장 비율 = target / source)
+# ----------------------------
+LLM_DEFAULT_MODEL = os.getenv("LLM_DEFAULT_MODEL", "gpt-4o-mini")
+
+_LLM_ROUTE_DEFAULTS: dict[str, dict] = {
+    "chat": {"temperature": 0.7, "overhead_tokens": 1000, "min_tokens": 1000, "max_tokens": 1000},
+    "translate": {"temperature": 0.3, "output_ratio": 1.25, "overhead_tokens": 48, "min_tokens": 64, "max_tokens": 4096},
+    "summarize": {"temperature": 0.3, "output_ratio": 0.05, "overhead_tokens": 200, "min_tokens": 256, "max_tokens": 1024},
+    "term": {"temperature": 0.3, "overhead_tokens": 512, "min_tokens": 512, "max_tokens": 512},
+    "title": {"temperature": 0.2, "overhead_tokens": 48, "min_tokens": 48, "max_tokens": 48},
+    "speech": {"model": "gpt-4o-mini-transcribe", "temperature": 0.0},
+}
+
+_LLM_ROUTE_FIELDS = (
+    ("model", LLM_DEFAULT_MODEL, str),
+    ("large_model", "", str),
+    ("large_input_tokens", 0, int),
+    ("temperature", 0.3, float),
+    ("output_ratio", 0.0, float),
+    ("overhead_tokens", 512, int),
+    ("min_tokens", 16, int),
+    ("max_tokens", 4096, int),
+)
+
+
+def _llm_route_env(feature: str, name: str, default, cast):
+    raw = os.getenv(f"LLM_ROUTE_{feature.upper()}_{name.upper()}")
+    if raw is None or raw == "":
+        return cast(_LLM_ROUTE_DEFAULTS.get(feature, {}).get(name, default))
+    return cast(raw)
+
+
+LLM_ROUTES: dict[str, dict] = {
+    feature: {name: _llm_route_env(feature, name, default, cast) for name, default, cast in _LLM_ROUTE_FIELDS}
+    for feature in OPENAI_FEATURES
+}
+
+LLM_LANG_TOKEN_WEIGHTS: dict[str, float] = {
+    lang.strip(): float(weight)
+    for lang, _, weight in (
+        item.partition("=") for item in os.getenv("LLM_LANG_TOKEN_WEIGHTS", "ko=1.0,en=0.75,uz=1.45").split(",")
+    )
+    if lang.strip() and weight.strip()
+}
+
+# ----------------------------
+# LLM 응답 캐시
+#   LLM_CACHE_BACKEND: memory(워커별) / db(워커 간 공유, 앞단에 memory L1) / off
+#   LLM_CACHE_DATABASE_URL: db 백엔드 전용 DB (미지정 시 DATABASE_URL 사용, 예: sqlite:///./llm_cache.db)
+# ----------------------------
+LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "memory").lower()
+LLM_CACHE_DATABASE_URL = os.getenv("LLM_CACHE_DATABASE_URL", "")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_DB_MAX_ENTRIES = int(os.getenv("LLM_CACHE_DB_MAX_ENTRIES", "200000"))
+LLM_CACHE_FEATURES = frozenset(
+    f.strip()
+    for f in os.getenv("LLM_CACHE_FEATURES", "translate,summarize,term,title").split(",")
+    if f.strip()
+)
+
+# ----------------------------
+# 동일 LLM 요청 single-flight (동시에 들어온 같은 프롬프트는 upstream 1회만 호출)
+#   LLM_SINGLEFLIGHT_ADVISORY_LOCK: Postgres advisory lock으로 워커 간에도 합치기 (db 캐시와 함께 사용)
+#   LLM_SINGLEFLIGHT_LOCK_POOL_SIZE: lock 전용 커넥션 풀 크기 (LLM 호출 동안 잡고 있으므로 앱 DB 풀과 분리, 다 쓰면 lock 없이 진행)
+# ----------------------------
+LLM_SINGLEFLIGHT_FEATURES = frozenset(
+    f.strip()
+    for f in os.getenv("LLM_SINGLEFLIGHT_FEATURES", "translate,summarize,term,title").split(",")
+    if f.strip()
+)
+LLM_SINGLEFLIGHT_ADVISORY_LOCK = os.getenv("LLM_SINGLEFLIGHT_ADVISORY_LOCK", "false").lower() in ("1", "true", "yes")
+LLM_SINGLEFLIGHT_LOCK_TIMEOUT_SECONDS = float(os.getenv("LLM_SINGLEFLIGHT_LOCK_TIMEOUT_SECONDS", "30"))
+LLM_SINGLEFLIGHT_LOCK_POOL_SIZE = int(os.getenv("LLM_SINGLEFLIGHT_LOCK_POOL_SIZE", "4"))
+
+# ----------------------------
+# OpenAI 호출 rate limit (워커 단위 값: 계정 한도 / 워커 수로 설정)
+#   - RPM/TPM 토큰 버킷 + AIMD 동시성 제한 + 재시도(Retry-After, jitter backoff)
+# ----------------------------
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "500"))
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "200000"))
+OPENAI_MIN_CONCURRENCY = int(os.getenv("OPENAI_MIN_CONCURRENCY", "2"))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "64"))
+OPENAI_QUEUE_MAX_WAIT_SECONDS = float(os.getenv("OPENAI_QUEUE_MAX_WAIT_SECONDS", "10"))
+OPENAI_RETRY_BASE_DELAY = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "0.5"))
+OPENAI_RETRY_MAX_DELAY = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "8"))
+
+# ----------------------------
+# LLM 사용량 / 메트릭
+#   ADMIN_USER_IDS: /metrics 조회 가능한 user_id 목록 (콤마 구분)
+#   LLM_USAGE_ROLLUP: 기능/모델별 일간 사용량을 llm_usage_daily 테이블에 누적 (워커별 주기 flush)
+# ----------------------------
+ADMIN_USER_IDS = frozenset(
+    u.strip()
+    for u in os.getenv("ADMIN_USER_IDS", "").split(",")
+    if u.strip()
+)
+LLM_USAGE_ROLLUP = os.getenv("LLM_USAGE_ROLLUP", "false").lower() in ("1", "true", "yes")
+LLM_USAGE_ROLLUP_INTERVAL_SECONDS = float(os.getenv("LLM_USAGE_ROLLUP_INTERVAL_SECONDS", "60"))
+
+# ----------------------------
+# 요청 deadline (라우트별 기본값, 가장 긴 prefix 우선. X-Request-Timeout 헤더(초)로 변경 가능)
+#   REQUEST_DEADLINES: "경로 prefix=초" 콤마 구분, 기본값에 덮어씀 (예: /translate=10,/pdf=180)
+#   REQUEST_DEADLINE_MAX_SECONDS: 헤더로 요청할 수 있는 최대값
+# ----------------------------
+_DEFAULT_REQUEST_DEADLINES = {
+    "/translate": 20.0,
+    "/translate/batch": 60.0,
+    "/term/explain": 25.0,
+    "/summarize": 60.0,
+    "/summarize/stream": 120.0,
+    "/chat/message": 60.0,
+    "/chat/message/stream": 120.0,
+    "/speech": 60.0,
+    "/translate/pdf": 180.0,
+    "/summarize/pdf": 180.0,
+    "/translate/pptx": 180.0,
+    "/summarize/pptx": 180.0,
+}
+
+
+def _parse_deadlines(raw: str) -> dict[str, float]:
+    deadlines = dict(_DEFAULT_REQUEST_DEADLINES)
+    for item in raw.split(","):
+        path, _, seconds = item.partition("=")
+        if path.strip() and seconds.strip():
+            deadlines[path.strip()] = float(seconds)
+    return deadlines
+
+
+REQUEST_DEADLINES = _parse_deadlines(os.getenv("REQUEST_DEADLINES", ""))
+REQUEST_DEADLINE_MAX_SECONDS = float(os.getenv("REQUEST_DEADLINE_MAX_SECONDS", "300"))
+
+# ----------------------------
+# LLM hedging (idempotent 기능만: translate / term / title)
+#   첫 요청이 최근 지연의 p(LLM_HEDGE_QUANTILE)를 넘기면 같은 요청을 하나 더 보내고 먼저 온 응답 사용
+#   LLM_HEDGE_FEATURES: 기본 off (예: translate,term,title)
+# ----------------------------
+LLM_HEDGE_FEATURES = frozenset(
+    f.strip()
+    for f in os.getenv("LLM_HEDGE_FEATURES", "").split(",")
+    if f.strip()
+) & frozenset({"translate", "term", "title"})
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_WINDOW = int(os.getenv("LLM_HEDGE_WINDOW", "500"))
+LLM_HEDGE_DEFAULT_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY_SECONDS", "3"))
+LLM_HEDGE_MIN_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "0.5"))
+
+# ----------------------------
+# 번역 메모리 (문장 단위로 이전 번역 재사용, translation_memory 테이블)
+# ----------------------------
+TRANSLATION_MEMORY_ENABLED = os.getenv("TRANSLATION_MEMORY_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# ----------------------------
+# 긴 문서 번역 (PDF / PPTX): 문단/문장 경계로 chunk를 나눠 병렬 번역
+#   TRANSLATE_CHUNK_TOKENS: chunk당 입력 토큰 예산 (chunk는 MAX_TEXT_LENGTH 글자도 넘지 않음)
+#   TRANSLATE_CHUNK_CONTEXT_CHARS: 용어/문체 일관성을 위해 프롬프트에 붙이는 앞 chunk 꼬리 (번역 대상 아님)
+# ----------------------------
+TRANSLATE_CHUNK_TOKENS = int(os.getenv("TRANSLATE_CHUNK_TOKENS", "600"))
+TRANSLATE_CHUNK_CONCURRENCY = int(os.getenv("TRANSLATE_CHUNK_CONCURRENCY", "8"))
+TRANSLATE_CHUNK_RETRIES = int(os.getenv("TRANSLATE_CHUNK_RETRIES", "2"))
+TRANSLATE_CHUNK_CONTEXT_CHARS = int(os.getenv("TRANSLATE_CHUNK_CONTEXT_CHARS", "200"))
+TRANSLATE_DOCUMENT_MAX_CHARS = int(os.getenv("TRANSLATE_DOCUMENT_MAX_CHARS", "200000"))
+
+# ----------------------------
+# 배치 번역 (/translate/batch): 짧은 텍스트 여러 개를 index JSON 배열로 묶어 LLM 호출 수를 줄임
+#   TRANSLATE_BATCH_TOKENS / TRANSLATE_BATCH_MAX_ITEMS: LLM 호출 1번에 묶는 입력 토큰 예산 / 항목 수
+#   TRANSLATE_BATCH_RETRIES: 응답에서 빠진 항목만 다시 묶어 재요청하는 횟수
+# ----------------------------
+TRANSLATE_BATCH_MAX_TEXTS = int(os.getenv("TRANSLATE_BATCH_MAX_TEXTS", "100"))
+TRANSLATE_BATCH_TOKENS = int(os.getenv("TRANSLATE_BATCH_TOKENS", "1500"))
+TRANSLATE_BATCH_MAX_ITEMS = int(os.getenv("TRANSLATE_BATCH_MAX_ITEMS", "40"))
+TRANSLATE_BATCH_RETRIES = int(os.getenv("TRANSLATE_BATCH_RETRIES", "2"))
+TRANSLATE_BATCH_CONCURRENCY = int(os.getenv("TRANSLATE_BATCH_CONCURRENCY", "4"))
+
+# ----------------------------
+# 긴 문서 요약 (map-reduce): 페이지/슬라이드(문단) 경계로 chunk를 나눠 병렬 요약 -> 합친 요약이 예산 안에 들 때까지 반복
+#   SUMMARIZE_CHUNK_TOKENS: chunk당 입력 토큰 예산 (이 예산 안의 텍스트는 LLM 1번으로 바로 요약)
+#   SUMMARIZE_MAX_DEPTH: reduce 단계 최대 횟수 (넘으면 남은 요약을 그대로 최종 요약에 사용)
+#   SUMMARIZE_CHUNK_CACHE_MAX_ENTRIES: chunk 요약 캐시(정규화한 chunk 내용 해시 기준, 워커별) 크기
+#   SUMMARY_CHUNK_STORE_ENABLED: chunk 요약을 summary_chunk 테이블에도 저장 (다시 올린 문서는 바뀐 chunk만 요약)
+# ----------------------------
+SUMMARIZE_CHUNK_TOKENS = int(os.getenv("SUMMARIZE_CHUNK_TOKENS", "2000"))
+SUMMARIZE_CHUNK_CONCURRENCY = int(os.getenv("SUMMARIZE_CHUNK_CONCURRENCY", "8"))
+SUMMARIZE_CHUNK_RETRIES = int(os.getenv("SUMMARIZE_CHUNK_RETRIES", "2"))
+SUMMARIZE_MAX_DEPTH = int(os.getenv("SUMMARIZE_MAX_DEPTH", "3"))
+SUMMARIZE_CHUNK_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARIZE_CHUNK_CACHE_MAX_ENTRIES", "2000"))
+SUMMARY_CHUNK_STORE_ENABLED = os.getenv("SUMMARY_CHUNK_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# ----------------------------
+# 요약 전 추출 단계 (TF-IDF + TextRank로 중요한 문장만 남겨 LLM 입력 토큰 절감, 요청별 mode)
+#   fast: SUMMARIZE_CHUNK_TOKENS 안으로 줄여 LLM 1번 / balanced: 입력의 SUMMARIZE_BALANCED_RATIO로 줄인 뒤 map-reduce
+#   full: 추출 없이 전체 map-reduce
+#   SUMMARIZE_EXTRACT_MAX_FEATURES: TF-IDF 특징 수 상한 (문서 빈도 상위)
+# ----------------------------
+SUMMARIZE_DEFAULT_MODE = os.getenv("SUMMARIZE_DEFAULT_MODE", "full").lower()
+SUMMARIZE_BALANCED_RATIO = float(os.getenv("SUMMARIZE_BALANCED_RATIO", "0.4"))
+SUMMARIZE_EXTRACT_MAX_FEATURES = int(os.getenv("SUMMARIZE_EXTRACT_MAX_FEATURES", "2048"))
+
+# ----------------------------
+# 메모리 용어 인덱스 (term / term_explanation -> dict + Aho-Corasick, 워커별)
+#   TERM_INDEX_REFRESH_SECONDS: 다른 워커의 용어 쓰기를 반영하는 주기 재구성 간격 (0이면 startup 때 한 번만)
+# ----------------------------
+TERM_INDEX_ENABLED = os.getenv("TERM_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+TERM_INDEX_REFRESH_SECONDS = float(os.getenv("TERM_INDEX_REFRESH_SECONDS", "300"))
+
+# ----------------------------
+# 용어 설명 (/term/explain)
+#   TERM_EXPLAIN_FUSED: 처음 보는 용어는 한국어 설명 + 용어 번역 + 설명 번역을 LLM 1번(JSON)으로 생성
+#                       (응답 형식이 맞지 않으면 설명 생성 -> 번역 2개 동시 호출로 처리)
+# ----------------------------
+TERM_EXPLAIN_FUSED = os.getenv("TERM_EXPLAIN_FUSED", "true").lower() in ("1", "true", "yes")
+
+# ----------------------------
+# 문맥별 용어 설명 (/term/explain의 context): context를 키워드 버킷으로 분류해 (term_id, 분류)별 설명을 저장 / 재사용
+#   분류되지 않는 context와 새 용어의 기본 설명은 context 없이 생성 (첫 요청의 context가 기본 설명에 남지 않도록)
+# ----------------------------
+TERM_CONTEXT_CACHE_ENABLED = os.getenv("TERM_CONTEXT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# ----------------------------
+# 용어 퍼지 조회 (/term/explain): 오타 / 띄어쓰기 / 덜 입력한 한글을 LLM 설명 생성과 term 행 추가 전에 기존 용어로 보정
+#   메모리 용어 인덱스의 자모 trigram 인덱스 사용 (인덱스를 아직 읽지 않았으면 Postgres pg_trgm)
+#   TERM_FUZZY_THRESHOLD: trigram 유사도(Jaccard) 하한. 가장 비슷한 용어가 하나로 정해질 때만 보정
+# ----------------------------
+TERM_FUZZY_ENABLED = os.getenv("TERM_FUZZY_ENABLED", "true").lower() in ("1", "true", "yes")
+TERM_FUZZY_THRESHOLD = float(os.getenv("TERM_FUZZY_THRESHOLD", "0.5"))
+
+# ----------------------------
+# 용어 주석 (/translate, /summarize 응답의 terms): 원문에서 찾은 알려진 용어 + 저장된 설명 (메모리 용어 인덱스만 사용, LLM 호출 없음)
+#   TERM_ANNOTATION_MAX_TERMS: 응답에 넣는 서로 다른 용어 수 상한 (원문 앞쪽부터)
+# ----------------------------
+TERM_ANNOTATION_ENABLED = os.getenv("TERM_ANNOTATION_ENABLED", "true").lower() in ("1", "true", "yes")
+TERM_ANNOTATION_MAX_TERMS = int(os.getenv("TERM_ANNOTATION_MAX_TERMS", "30"))
+
+# ----------------------------
+# 로컬 언어 감지 (app/services/lang_detect.py)
+#   이 값 이상이면 LLM auto-detect 없이 감지 결과를 원문 언어로 사용
+# ----------------------------
+LANG_DETECT_MIN_CONFIDENCE = float(os.getenv("LANG_DETECT_MIN_CONFIDENCE", "0.7"))
@@ -0,0 +1,69 @@
+"""
+요청 deadline 전파
+- 미들웨어가 라우트별 기본값(또는 X-Request-Timeout 헤더)으로 절대 시각(monotonic)을 설정
+- 서비스 레이어는 remaining_seconds()로 남은 시간을 읽어 OpenAI timeout / 대기열 대기 / 재시도에 반영
+"""
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import REQUEST_DEADLINES, REQUEST_DEADLINE_MAX_SECONDS
+
+DEADLINE_HEADER = "X-Request-Timeout"
+
+_deadline_ctx: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+# 가장 긴 prefix부터 매칭
+_ROUTE_DEADLINES = sorted(REQUEST_DEADLINES.items(), key=lambda item: len(item[0]), reverse=True)
+
+
+def route_deadline_seconds(path: str) -> Optional[float]:
+    for prefix, seconds in _ROUTE_DEADLINES:
+        if path == prefix or path.startswith(prefix + "/"):
+            return seconds
+    return None
+
+
+def _header_deadline_seconds(request: Request) -> Optional[float]:
+    raw = request.headers.get(DEADLINE_HEADER)
+    if not raw:
+        return None
+    try:
+        seconds = float(raw)
+    except ValueError:
+        return None
+    if seconds <= 0:
+        return None
+    return min(seconds, REQUEST_DEADLINE_MAX_SECONDS)
+
+
+def remaining_seconds() -> Optional[float]:
+    """
+    남은 시간(초). deadline이 없으면 None, 이미 지났으면 0 이하
+    """
+    deadline = _deadline_ctx.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_exceeded() -> bool:
+    remaining = remaining_seconds()
+    return remaining is not None and remaining <= 0
+
+
+class DeadlineMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next) -> Response:
+        seconds = _header_deadline_seconds(request) or route_deadline_seconds(request.url.path)
+        if seconds is None:
+            return await call_next(request)
+
+        token = _deadline_ctx.set(time.monotonic() + seconds)
+        try:
+            return await call_next(request)
+        finally:
+            _deadline_ctx.reset(token)
@@ -1,13 +1,23 @@
 import logging
+from contextvars import ContextVar
+from typing import Optional
 from fastapi import Request
 
     
 _base_logger = logging.getLogger("app")
 
+# Request 객체가 없는 서비스 레이어(LLM 사용량 기록 등)에서 request_id를 읽기 위한 컨텍스트 변수
+# RequestLoggingMiddleware에서 설정 (threadpool / asyncio.to_thread에도 복사되어 전달됨)
+request_id_ctx: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    return request_id_ctx.get()
+
 class ContextFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         if not hasattr(record, "request_id"):
-            record.request_id = "-"
+            record.request_id = request_id_ctx.get() or "-"
         if not hasattr(record, "user_idx"):
             record.user_idx = "-"
         return True
@@ -0,0 +1,173 @@
+"""
+프로세스 내부 메트릭 (Prometheus text format 출력)
+- Counter / Histogram: 라벨 조합별로 값 누적
+- collector: 렌더링 시점에 다른 모듈의 stats()를 gauge로 변환
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Callable, Iterable
+from typing import Optional
+
+LabelValues = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]  # (metric name, labels, value)
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [
+        f'{n}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), " ")}"'
+        for n, v in zip(names, values)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    if float(v).is_integer():
+        return str(int(v))
+    return repr(float(v))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0, 30.0, 60.0)
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [bucket counts..., +Inf count], sum
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[idx] += 1
+            self._sums[key] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key in sorted(self._counts):
+                counts = self._counts[key]
+                cumulative = 0
+                for upper, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    names = self.labelnames + ("le",)
+                    values = key + (_format_value(upper),)
+                    lines.append(f"{self.name}_bucket{_format_labels(names, values)} {cumulative}")
+                label_str = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{label_str} {_format_value(self._sums[key])}")
+                lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+        self._collectors: list[tuple[str, str, Callable[[], list[Sample]]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Optional[tuple[float, ...]] = None,
+    ) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets or Histogram.DEFAULT_BUCKETS)
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, prefix: str, help: str, collect: Callable[[], list[Sample]]) -> None:
+        """
+        collect()가 반환한 (name, labels, value)를 gauge로 출력 (name 앞에 prefix를 붙임)
+        """
+        with self._lock:
+            self._collectors.append((prefix, help, collect))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+
+        for metric in metrics:
+            lines.extend(metric.render())
+
+        for prefix, help, collect in collectors:
+            try:
+                samples = collect()
+            except Exception:
+                continue  # 수집 실패한 collector는 건너뜀
+            # 같은 metric의 샘플은 한 블록으로 모아서 출력 (text format 규칙)
+            grouped: dict[str, list[str]] = {}
+            for name, labels, value in samples:
+                full_name = f"{prefix}_{name}"
+                grouped.setdefault(full_name, []).append(
+                    f"{full_name}{_format_labels(labels.keys(), labels.values())} {_format_value(float(value))}"
+                )
+            for full_name, sample_lines in grouped.items():
+                lines.append(f"# HELP {full_name} {help}")
+                lines.append(f"# TYPE {full_name} gauge")
+                lines.extend(sample_lines)
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def stats_to_samples(stats: dict, labels: Optional[dict[str, str]] = None) -> list[Sample]:
+    """
+    {"hits": 1, "misses": 2} 형태의 stats dict를 숫자 항목만 gauge 샘플로 변환
+    """
+    labels = labels or {}
+    return [
+        (name, labels, float(value))
+        for name, value in stats.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
@@ -5,6 +5,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 from app.core.security import decode_token
+from app.core.logging import request_id_ctx
 
 logger = logging.getLogger("app")
 
@@ -24,6 +25,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
         request.state.request_id = request_id
         request.state.user_idx = None
+        request_id_token = request_id_ctx.set(request_id)
 
         start = time.perf_counter()
 
@@ -63,3 +65,4 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
             if response:
                 response.headers["X-Request-ID"] = request_id
+            request_id_ctx.reset(request_id_token)
@@ -0,0 +1,10 @@
+import json
+from typing import Any
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """
+    Server-Sent Events 한 건을 직렬화 (data는 JSON 한 줄)
+    """
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
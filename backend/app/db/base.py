@@ -2,9 +2,15 @@ from app.db.base_class import Base
 
 from app.models.term import Term
 from app.models.term_explanation import TermExplanation
+from app.models.term_explanation_translation import TermExplanationTranslation
+from app.models.term_explanation_context import TermExplanationContext
 from app.models.users import User
 from app.models.project import Project
 from app.models.chat_session import ChatSession
 from app.models.chat_message import ChatMessage
 from app.models.message_feedback import MessageFeedback
 from app.models.memo import Memo
+from app.models.llm_cache_entry import LLMCacheEntry
+from app.models.llm_usage_daily import LLMUsageDaily
+from app.models.translation_memory import TranslationMemory
+from app.models.summary_chunk import SummaryChunk
@@ -6,6 +6,7 @@ from app.db.session import get_db
 from app.models.users import User
 from app.exceptions.error import AppError, ErrorCode
 from app.core.security import decode_token
+from app.core.config import ADMIN_USER_IDS
 from app.services.user_service import get_user_by_idx
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -42,3 +43,14 @@ def get_current_user(
 
     
     return user
+
+
+def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    # 운영자 전용 엔드포인트 (ADMIN_USER_IDS에 등록된 user_id만 허용)
+    if user.user_id not in ADMIN_USER_IDS:
+        raise AppError(
+            error_code=ErrorCode.FORBIDDEN,
+            message="admin only"
+        )
+
+    return user
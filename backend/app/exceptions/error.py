@@ -74,6 +74,9 @@ class ErrorCode(str, Enum):
     # 503
     SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
 
+    # 504
+    REQUEST_TIMEOUT = "REQUEST_TIMEOUT"
+
 
 # ErrorCode -> HTTP status
 ERROR_CODE_TO_STATUS: dict[ErrorCode, int] = {
@@ -141,6 +144,7 @@ ERROR_CODE_TO_STATUS: dict[ErrorCode, int] = {
     ErrorCode.DB_ERROR: 500,
     ErrorCode.AI_REQUEST_FAILED: 502,
     ErrorCode.SERVICE_UNAVAILABLE: 503,
+    ErrorCode.REQUEST_TIMEOUT: 504,
 }
 
 class AppError(Exception):
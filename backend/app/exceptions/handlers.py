@@ -63,6 +63,16 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
     )
 
 
+def _validation_errors(exc: RequestValidationError) -> list[dict[str, Any]]:
+    # model_validator에서 raise한 ValueError 등은 ctx에 예외 객체로 들어가므로 문자열로 변환
+    errors = []
+    for error in exc.errors():
+        if "ctx" in error:
+            error = {**error, "ctx": {k: str(v) for k, v in error["ctx"].items()}}
+        errors.append(error)
+    return errors
+
+
 async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
     logger.warning(
         "validation_error request_id=%s method=%s path=%s",
@@ -75,7 +85,7 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         status_code=400,
         error_code=ErrorCode.INVALID_REQUEST,
         message="Invalid request.",
-        detail={"errors": exc.errors()},
+        detail={"errors": _validation_errors(exc)},
     )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -7,11 +8,17 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.request_logging import RequestLoggingMiddleware
+from app.core.deadline import DeadlineMiddleware
 from app.exceptions.handlers import register_exception_handlers
 from app.db.session import engine
 from app.db.base import Base
 from app.routes import router as api_router
 from app.core.logging import setup_logging
+from app.services.openai_service import close_openai_clients, aclose_openai_clients
+from app.services.llm_usage import run_usage_rollup, flush_usage_rollup
+from app.services.term_index import run_term_index_refresh
+from app.services.term_service import ensure_term_trgm_index
+from app.core.config import LLM_USAGE_ROLLUP, TERM_INDEX_ENABLED
 
 def create_app() -> FastAPI:
     setup_logging()
@@ -21,7 +28,35 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     def on_startup():
         Base.metadata.create_all(bind=engine)
+        ensure_term_trgm_index()
+
+    @app.on_event("startup")
+    async def start_usage_rollup():
+        if LLM_USAGE_ROLLUP:
+            app.state.usage_rollup_task = asyncio.create_task(run_usage_rollup())
+
+    @app.on_event("startup")
+    async def start_term_index():
+        if TERM_INDEX_ENABLED:
+            app.state.term_index_task = asyncio.create_task(run_term_index_refresh())
+
+    @app.on_event("shutdown")
+    async def on_shutdown():
+        close_openai_clients()
+        await aclose_openai_clients()
+
+        task = getattr(app.state, "usage_rollup_task", None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.to_thread(flush_usage_rollup)
+
+        term_index_task = getattr(app.state, "term_index_task", None)
+        if term_index_task is not None:
+            term_index_task.cancel()
+            await asyncio.gather(term_index_task, return_exceptions=True)
         
+    app.add_middleware(DeadlineMiddleware)
     app.add_middleware(RequestLoggingMiddleware)
     
     register_exception_handlers(app)
@@ -26,6 +26,12 @@ class Lang(str, Enum):
     uz = "uz"
     
     
+class SummarizeMode(str, Enum):
+    fast = "fast"
+    balanced = "balanced"
+    full = "full"
+
+
 class RatingEnum(str, Enum):
     like = "like"
     dislike = "dislike"
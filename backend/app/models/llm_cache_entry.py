@@ -0,0 +1,43 @@
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+class LLMCacheEntry(Base):
+    """
+    call_llm 응답 공유 캐시 (gunicorn 워커 간 공유용)
+    - cache_key: sha256(model, system_prompt, user_prompt, temperature, max_tokens)
+    """
+    __tablename__ = "llm_cache"
+
+    cache_key: Mapped[str] = mapped_column(
+        String(64), primary_key=True
+    )
+
+    feature: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+
+    response: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+
+    last_hit_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,46 @@
+from datetime import date
+from sqlalchemy import String, Date, BigInteger, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+class LLMUsageDaily(Base):
+    """
+    기능/모델별 일간 LLM 사용량 (LLM_USAGE_ROLLUP=true 일 때 각 워커가 주기적으로 누적)
+    """
+    __tablename__ = "llm_usage_daily"
+
+    usage_date: Mapped[date] = mapped_column(
+        Date, primary_key=True
+    )
+
+    feature: Mapped[str] = mapped_column(
+        String(20), primary_key=True
+    )
+
+    model: Mapped[str] = mapped_column(
+        String(50), primary_key=True
+    )
+
+    requests: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+
+    errors: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+
+    prompt_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+
+    completion_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+
+    cached_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+
+    latency_ms_total: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
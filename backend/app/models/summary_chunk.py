@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Text, Integer, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+class SummaryChunk(Base):
+    """
+    긴 문서 요약(map-reduce)의 chunk 요약 저장소
+    - chunk_hash: sha256(단계 종류 + 출력 언어 + 정규화된 chunk 내용)
+    - 다시 올라온 문서는 바뀐 chunk만 새로 요약
+    """
+    __tablename__ = "summary_chunk"
+
+    chunk_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True
+    )
+
+    chunk_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+
+    lang: Mapped[Optional[str]] = mapped_column(
+        String(5),
+        nullable=True,
+    )
+
+    summary: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    hit_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -1,3 +1,4 @@
+from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
@@ -6,6 +7,13 @@ class Term(Base):
 
     term_id: Mapped[int] = mapped_column(primary_key=True)
 
+    term_name: Mapped[str] = mapped_column(
+        String(100),
+        unique=True,
+        nullable=False,
+        index=True,
+    )
+
     explanations: Mapped[list["TermExplanation"]] = relationship(
         "TermExplanation",
         back_populates="term",
@@ -0,0 +1,36 @@
+from datetime import datetime
+from sqlalchemy import ForeignKey, Integer, String, Text, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+class TermExplanationContext(Base):
+    """
+    문맥 분류별 용어 설명 (한국어). context가 있는 /term/explain 요청에서 처음 생성될 때 채움
+    - context_class: app/services/term_context.py의 키워드 분류 (course / exam / admin / campus / student_life)
+    - 분류되지 않는 context는 문맥 없는 기본 설명(term_explanation)을 사용
+    """
+    __tablename__ = "term_explanation_context"
+
+    term_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("term.term_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+
+    context_class: Mapped[str] = mapped_column(
+        String(30),
+        primary_key=True,
+        nullable=False,
+    )
+
+    explanation: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
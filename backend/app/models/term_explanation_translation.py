@@ -0,0 +1,45 @@
+from datetime import datetime
+from sqlalchemy import ForeignKey, Integer, String, Text, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+class TermExplanationTranslation(Base):
+    """
+    용어 / 용어 설명의 언어별 번역 (처음 요청될 때 채움)
+    - source_hash: sha256(용어 + 한국어 설명). 한국어 설명이 바뀌면 행을 지우고, 남아 있더라도 해시가 다르면 무시
+    """
+    __tablename__ = "term_explanation_translation"
+
+    term_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("term.term_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+
+    lang: Mapped[str] = mapped_column(
+        String(5),
+        primary_key=True,
+        nullable=False,
+    )
+
+    translated_term: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    translated_explanation: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    source_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,63 @@
+from datetime import datetime
+from sqlalchemy import String, Text, Integer, DateTime, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+class TranslationMemory(Base):
+    """
+    문장 단위 번역 메모리
+    - source_hash: sha256(정규화된 원문 문장)
+    - (source_hash, source_lang, target_lang) 으로 조회
+    """
+    __tablename__ = "translation_memory"
+    __table_args__ = (
+        UniqueConstraint("source_hash", "source_lang", "target_lang", name="uq_translation_memory_key"),
+    )
+
+    tm_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True
+    )
+
+    source_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        index=True,
+    )
+
+    source_lang: Mapped[str] = mapped_column(
+        String(5),
+        nullable=False,
+    )
+
+    target_lang: Mapped[str] = mapped_column(
+        String(5),
+        nullable=False,
+    )
+
+    source_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    translated_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    hit_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -16,6 +16,7 @@ from .password_reset_router import router as password_reset_router
 from .pptx_router import router as pptx_router
 from .find_user_id_router import router as find_user_id_router
 from .file_router import router as file_router
+from .metrics_router import router as metrics_router
 
 router = APIRouter()
 router.include_router(health_router)
@@ -34,5 +35,6 @@ router.include_router(password_reset_router)
 router.include_router(pptx_router)
 router.include_router(find_user_id_router)
 router.include_router(file_router)
+router.include_router(metrics_router)
 from .general_chat_router import router as general_chat_router
 router.include_router(general_chat_router)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, UploadFile, File, Depends, Request
 from app.dependencies.auth import get_current_user
 from app.models.users import User
 from app.services.pdf_service import extract_text_from_pdf
-from app.services.summarize_service import summarize_text
+from app.services.summarize_service import summarize_document_async
 from app.exceptions.error import AppError, ErrorCode
 from app.core.logging import get_logger
 import uuid
@@ -61,7 +61,7 @@ async def upload_file(
             )
 
         # Summarize the content
-        summary = summarize_text(text=content)
+        summary = (await summarize_document_async(text=content))["summarized_text"]
 
         return {
             "request_id": request_id,
@@ -1,24 +1,29 @@
 """
 General chat router for ChatGPT-like conversations
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+import time
 import uuid
 
 from app.db.session import get_db
 from app.dependencies.auth import get_current_user
 from app.models.users import User
 from app.models.enums import FeatureType
-from app.services.chat_service import general_chat
-from app.services.chat_log_service import save_chat_messages
+from app.services.chat_service import general_chat_async, general_chat_stream
+from app.services.chat_log_service import save_chat_messages, save_chat_messages_detached
 from app.schemas.chat import ChatRequest, ChatResponse, ChatData
 from app.exceptions.error import AppError, ErrorCode
+from app.core.logging import get_logger
+from app.core.sse import format_sse
 
 router = APIRouter(prefix="/chat", tags=["General Chat"])
 
 
 @router.post("/message", response_model=ChatResponse)
-def chat_message(
+async def chat_message(
     request: ChatRequest,
     chat_session_id: int | None = Query(default=None),
     project_id: int | None = Query(default=None),
@@ -32,10 +37,11 @@ def chat_message(
     
     try:
         # Get AI response
-        ai_response = general_chat(request.message)
+        ai_response = await general_chat_async(request.message)
         
         # Save to chat history
-        session_id = save_chat_messages(
+        session_id = await run_in_threadpool(
+            save_chat_messages,
             db=db,
             chat_session_id=chat_session_id,
             user_idx=current_user.user_idx,
@@ -59,7 +65,77 @@ def chat_message(
         raise e
     except Exception as e:
         raise AppError(
-            error_code=ErrorCode.INTERNAL_ERROR,
+            error_code=ErrorCode.INTERNAL_SERVER_ERROR,
             message=f"Chat failed: {str(e)}",
-            status_code=500
         )
+
+
+@router.post("/message/stream")
+async def chat_message_stream(
+    http_request: Request,
+    request: ChatRequest,
+    chat_session_id: int | None = Query(default=None),
+    project_id: int | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Streaming variant of /chat/message (Server-Sent Events)
+    - event: delta  data: {"text": "..."}
+    - event: done   data: {"request_id", "chat_session_id", "ttft_ms"}
+    - event: error  data: {"error_code", "message"}
+    """
+    log = get_logger(http_request)
+    request_id = http_request.state.request_id
+    user_idx = current_user.user_idx
+    started = time.perf_counter()
+
+    log.info("CHAT_STREAM_REQUEST", extra={"chat_session_id": chat_session_id})
+
+    async def event_stream():
+        parts: list[str] = []
+        ttft_ms = None
+        try:
+            async for delta in general_chat_stream(request.message):
+                if ttft_ms is None:
+                    ttft_ms = int((time.perf_counter() - started) * 1000)
+                    log.info("CHAT_STREAM_FIRST_TOKEN", extra={"ttft_ms": ttft_ms})
+                parts.append(delta)
+                yield format_sse("delta", {"text": delta})
+
+        except AppError as e:
+            log.warning("CHAT_STREAM_FAILED", extra={"error_code": e.error_code})
+            yield format_sse("error", {"error_code": e.error_code, "message": e.message})
+            return
+        except Exception:
+            log.exception("CHAT_STREAM_INTERNAL_ERROR")
+            yield format_sse("error", {"error_code": ErrorCode.INTERNAL_SERVER_ERROR, "message": "Internal server error."})
+            return
+
+        log.info(
+            "CHAT_STREAM_SUCCESS",
+            extra={"ttft_ms": ttft_ms, "latency_ms": int((time.perf_counter() - started) * 1000)},
+        )
+
+        # Persist the assembled response once the stream has completed
+        session_id = chat_session_id
+        try:
+            session_id = await run_in_threadpool(
+                save_chat_messages_detached,
+                chat_session_id=chat_session_id,
+                user_idx=user_idx,
+                feature_type=FeatureType.chat,
+                user_content=request.message,
+                assistant_content="".join(parts).strip(),
+                request_id=request_id,
+                project_id=project_id,
+            )
+        except Exception:
+            log.exception("CHAT_STREAM_SAVE_ERROR")
+
+        yield format_sse("done", {"request_id": request_id, "chat_session_id": session_id, "ttft_ms": ttft_ms})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,7 +1,26 @@
 from fastapi import APIRouter
 
+from app.services.openai_service import get_client_pool_stats
+from app.services.llm_cache import get_cache_stats
+from app.services.llm_singleflight import get_singleflight_stats
+from app.services.llm_rate_limit import get_rate_limit_stats
+from app.services.llm_hedge import get_hedge_stats
+
 router = APIRouter()
 
 @router.get("/health")
 def health():
-    return {"ok": True}
\ No newline at end of file
+    return {"ok": True}
+
+
+@router.get("/health/openai")
+def health_openai():
+    # 워커별 OpenAI 클라이언트 재사용 / 응답 캐시 hit율 / single-flight 절감량 확인용
+    return {
+        "ok": True,
+        "client_pool": get_client_pool_stats(),
+        "llm_cache": get_cache_stats(),
+        "llm_singleflight": get_singleflight_stats(),
+        "rate_limiter": get_rate_limit_stats(),
+        "llm_hedge": get_hedge_stats(),
+    }
\ No newline at end of file
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import registry
+from app.dependencies.auth import get_admin_user
+from app.models.users import User
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(_: User = Depends(get_admin_user)):
+    # 기능별 LLM 토큰/지연/결과 + 클라이언트 풀/캐시/single-flight/rate limiter 상태 (워커 단위 값)
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
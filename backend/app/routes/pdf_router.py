@@ -2,13 +2,14 @@ from typing import Optional
 from fastapi import APIRouter, UploadFile, File, Form, Depends, Request
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.dependencies.auth import get_current_user
 from app.models.users import User
 from app.services.pdf_service import extract_text_from_pdf
-from app.services.summarize_service import summarize_text
-from app.services.translate_service import translate_text
+from app.services.summarize_service import summarize_document_async
+from app.services.translate_service import translate_document_async
 from app.services.chat_log_service import save_chat_messages
 from app.exceptions.error import AppError, ErrorCode
 from app.core.logging import get_logger
@@ -17,9 +18,10 @@ router = APIRouter(prefix="", tags=["PDF"])
 
 
 @router.post("/summarize/pdf")
-def summarize_pdf(
+async def summarize_pdf(
     request: Request,
     file: UploadFile = File(...),
+    mode: Optional[str] = Form(None),
     chat_session_id: int | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -33,13 +35,14 @@ def summarize_pdf(
             "chat_session_id": chat_session_id,
             "filename": file.filename,
             "content_type": file.content_type,
+            "mode": mode,
         },
     )
 
     # Parse
     log.info("PDF_SUMMARIZE_PARSE_REQUEST")
     try:
-        text = extract_text_from_pdf(file)
+        text = await run_in_threadpool(extract_text_from_pdf, file)
     except Exception as e:
         log.warning(
             "PDF_SUMMARIZE_PARSE_FAILED",
@@ -56,7 +59,8 @@ def summarize_pdf(
     # Process
     log.info("PDF_SUMMARIZE_PROCESS_REQUEST")
     try:
-        summarized = summarize_text(text=text)
+        result = await summarize_document_async(text=text, mode=mode)
+        summarized = result["summarized_text"]
     except AppError as e:
         log.warning("PDF_SUMMARIZE_PROCESS_FAILED", extra={"error_code": e.error_code})
         raise
@@ -64,12 +68,21 @@ def summarize_pdf(
         log.exception("PDF_SUMMARIZE_PROCESS_INTERNAL_ERROR")
         raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR)
 
-    log.info("PDF_SUMMARIZE_PROCESS_SUCCESS")
+    log.info(
+        "PDF_SUMMARIZE_PROCESS_SUCCESS",
+        extra={
+            "chunks": result["chunks"],
+            "reused_chunks": result["reused_chunks"],
+            "depth": result["depth"],
+            "compression_ratio": result["extractive"]["compression_ratio"],
+        },
+    )
 
     # chat save
     log.info("PDF_SUMMARIZE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,
             user_idx=current_user.user_idx,
             chat_session_id=chat_session_id,
@@ -87,12 +100,21 @@ def summarize_pdf(
     return {
         "request_id": getattr(request.state, "request_id", None),
         "success": True,
-        "data": {"summarized_text": summarized},
+        "data": {
+            "summarized_text": summarized,
+            # 긴 문서: "reused N of M chunks" (N = 이전 요약을 재사용한 chunk 수)
+            "summary_chunks": {
+                "total": result["chunks"],
+                "reused": result["reused_chunks"],
+                "depth": result["depth"],
+            },
+            "extractive": result["extractive"],
+        },
     }
 
 
 @router.post("/translate/pdf")
-def translate_pdf(
+async def translate_pdf(
     request: Request,
     file: UploadFile = File(...),
     target_lang: str = Form(...),
@@ -118,7 +140,7 @@ def translate_pdf(
     # parse
     log.info("PDF_TRANSLATE_PARSE_REQUEST")
     try:
-        text = extract_text_from_pdf(file)
+        text = await run_in_threadpool(extract_text_from_pdf, file)
     except Exception as e:
         log.warning(
             "PDF_TRANSLATE_PARSE_FAILED",
@@ -135,7 +157,7 @@ def translate_pdf(
     # Process
     log.info("PDF_TRANSLATE_PROCESS_REQUEST")
     try:
-        result = translate_text(
+        result = await translate_document_async(
             text=text,
             target_lang=target_lang,
             source_lang=source_lang,
@@ -151,12 +173,16 @@ def translate_pdf(
         log.exception("PDF_TRANSLATE_PROCESS_INTERNAL_ERROR")
         raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR)
 
-    log.info("PDF_TRANSLATE_PROCESS_SUCCESS", extra={"detected_lang": detected_lang})
+    log.info(
+        "PDF_TRANSLATE_PROCESS_SUCCESS",
+        extra={"detected_lang": detected_lang, "chunks": result.get("chunks")},
+    )
 
     # chat save
     log.info("PDF_TRANSLATE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,
             user_idx=current_user.user_idx,
             chat_session_id=chat_session_id,
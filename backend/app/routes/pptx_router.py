@@ -2,12 +2,13 @@ from typing import Optional
 from fastapi import APIRouter, UploadFile, File, Form, Depends, Request
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.dependencies.auth import get_current_user
 from app.services.pptx_service import extract_text_from_pptx
-from app.services.summarize_service import summarize_text
-from app.services.translate_service import translate_text
+from app.services.summarize_service import summarize_document_async
+from app.services.translate_service import translate_document_async
 from app.services.chat_log_service import save_chat_messages
 from app.exceptions.error import AppError, ErrorCode
 from app.core.logging import get_logger
@@ -16,9 +17,10 @@ router = APIRouter(prefix="", tags=["PPTX"], dependencies=[Depends(get_current_u
 
 
 @router.post("/summarize/pptx")
-def summarize_pptx(
+async def summarize_pptx(
     request: Request,
     file: UploadFile = File(...),
+    mode: Optional[str] = Form(None),
     chat_session_id: int | None = None,
     db: Session = Depends(get_db),
 ):
@@ -31,13 +33,14 @@ def summarize_pptx(
             "chat_session_id": chat_session_id,
             "filename": file.filename,
             "content_type": file.content_type,
+            "mode": mode,
         },
     )
 
     # parse
     log.info("PPTX_SUMMARIZE_PARSE_REQUEST")
     try:
-        text = extract_text_from_pptx(file)
+        text = await run_in_threadpool(extract_text_from_pptx, file)
     except Exception as e:
         log.warning(
             "PPTX_SUMMARIZE_PARSE_FAILED",
@@ -54,7 +57,8 @@ def summarize_pptx(
     # process - summarize
     log.info("PPTX_SUMMARIZE_PROCESS_REQUEST")
     try:
-        summarized = summarize_text(text=text)
+        result = await summarize_document_async(text=text, mode=mode)
+        summarized = result["summarized_text"]
     except AppError as e:
         log.warning("PPTX_SUMMARIZE_PROCESS_FAILED", extra={"error_code": e.error_code})
         raise
@@ -62,12 +66,21 @@ def summarize_pptx(
         log.exception("PPTX_SUMMARIZE_PROCESS_INTERNAL_ERROR")
         raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR)
 
-    log.info("PPTX_SUMMARIZE_PROCESS_SUCCESS")
+    log.info(
+        "PPTX_SUMMARIZE_PROCESS_SUCCESS",
+        extra={
+            "chunks": result["chunks"],
+            "reused_chunks": result["reused_chunks"],
+            "depth": result["depth"],
+            "compression_ratio": result["extractive"]["compression_ratio"],
+        },
+    )
 
     # chat save
     log.info("PPTX_SUMMARIZE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,
             chat_session_id=chat_session_id,
             feature_type="pptx_summarize",
@@ -82,15 +95,24 @@ def summarize_pptx(
     except Exception:
         log.exception("PPTX_SUMMARIZE_CHAT_SAVE_INTERNAL_ERROR")
 
-        return {
-            "request_id": request.state.request_id,
-            "success": True,
-            "data": {"summarized_text": summarized},
-        }
+    return {
+        "request_id": request.state.request_id,
+        "success": True,
+        "data": {
+            "summarized_text": summarized,
+            # 긴 문서: "reused N of M chunks" (N = 이전 요약을 재사용한 chunk 수)
+            "summary_chunks": {
+                "total": result["chunks"],
+                "reused": result["reused_chunks"],
+                "depth": result["depth"],
+            },
+            "extractive": result["extractive"],
+        },
+    }
 
 
 @router.post("/translate/pptx")
-def translate_pptx(
+async def translate_pptx(
     request: Request,
     file: UploadFile = File(...),
     target_lang: str = Form(...),
@@ -115,7 +137,7 @@ def translate_pptx(
     # Parse
     log.info("PPTX_TRANSLATE_PARSE_REQUEST")
     try:
-        text = extract_text_from_pptx(file)  # PPTX -> text
+        text = await run_in_threadpool(extract_text_from_pptx, file)  # PPTX -> text
     except Exception as e:
         log.warning(
             "PPTX_TRANSLATE_PARSE_FAILED",
@@ -132,7 +154,7 @@ def translate_pptx(
     # Process
     log.info("PPTX_TRANSLATE_PROCESS_REQUEST")
     try:
-        result = translate_text(
+        result = await translate_document_async(
             text=text,
             target_lang=target_lang,
             source_lang=source_lang,
@@ -148,12 +170,16 @@ def translate_pptx(
         log.exception("PPTX_TRANSLATE_PROCESS_INTERNAL_ERROR")
         raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR)
 
-    log.info("PPTX_TRANSLATE_PROCESS_SUCCESS", extra={"detected_lang": detected_lang})
+    log.info(
+        "PPTX_TRANSLATE_PROCESS_SUCCESS",
+        extra={"detected_lang": detected_lang, "chunks": result.get("chunks")},
+    )
 
     # chat save
     log.info("PPTX_TRANSLATE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,
             chat_session_id=chat_session_id,
             feature_type="pptx_translate",
@@ -169,9 +195,8 @@ def translate_pptx(
     except Exception:
         log.exception("PPTX_TRANSLATE_CHAT_SAVE_INTERNAL_ERROR")
 
-
-        return {
-            "request_id": request.state.request_id,
-            "success": True,
-            "data": {"translated_text": translated_text},
-        }
\ No newline at end of file
+    return {
+        "request_id": request.state.request_id,
+        "success": True,
+        "data": {"translated_text": translated_text},
+    }
\ No newline at end of file
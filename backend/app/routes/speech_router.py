@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.schemas.speech import SpeechData, SpeechResponse
 from app.services.speech_service import transcribe
+from app.services.lang_detect import confident_lang
 from app.services.chat_log_service import save_chat_messages
 
 router = APIRouter(prefix="/speech", tags=["Speech"])
@@ -31,6 +32,9 @@ def speech(
             auto_detect=auto_detect,
             lang=lang
         )
+
+        # lang을 받았으면 그대로, 없을 때만 인식 결과 텍스트로 언어 판별 (로컬, LLM 호출 없음)
+        detected_lang = lang or confident_lang(transcribed_text)
         
         save_chat_messages(
             db=db,
@@ -39,14 +43,14 @@ def speech(
             user_content=f"[voice file] {file.filename}",
             assistant_content=transcribed_text,
             request_id=request_id,
-            source_lang=lang,
+            source_lang=detected_lang,
         )
 
         
         return SpeechResponse(
             request_id=request_id,
             success=True,
-            data=SpeechData(text=transcribed_text)
+            data=SpeechData(text=transcribed_text, detected_lang=detected_lang)
         )
         
     except Exception as e:
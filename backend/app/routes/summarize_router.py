@@ -1,22 +1,28 @@
+import time
+
 from fastapi import APIRouter, Depends, Request, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.dependencies.auth import get_current_user
 from app.models.enums import FeatureType
 from app.models.users import User
 from app.schemas.summarize import SummarizeData, SummarizeRequest, SummarizeResponse
-from app.services.summarize_service import summarize_text
-from app.services.chat_log_service import save_chat_messages
+from app.services.summarize_service import summarize_document_async, summarize_text_stream
+from app.services.chat_log_service import save_chat_messages, save_chat_messages_detached
+from app.services.term_service import term_service
 from app.exceptions.error import AppError, ErrorCode
 from app.core.logging import get_logger
+from app.core.sse import format_sse
 
 router = APIRouter(prefix="/summarize", tags=["Summarize"])
 
 
 @router.post("", response_model=SummarizeResponse)
-def summarize(
+async def summarize(
     request: Request,
     req: SummarizeRequest,
     chat_session_id: int | None = Query(default=None),
@@ -32,11 +38,14 @@ def summarize(
         extra={
             "chat_session_id": chat_session_id,
             "text_length": len(req.text),
+            "mode": req.mode,
         },
     )
 
     try:
-        summarized_text = summarize_text(text=req.text)
+        result = await summarize_document_async(text=req.text, mode=req.mode)
+        summarized_text = result["summarized_text"]
+        terms = term_service.annotate_terms(req.text, current_user.user_lang)
     
     except AppError as e:
         log.warning("SUMMARIZE_FAILED", extra={"error_code": e.error_code})
@@ -45,10 +54,20 @@ def summarize(
         log.exception("SUMMARIZE_INTERNAL_ERROR")
         raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR)
 
+    log.info(
+        "SUMMARIZE_SUCCESS",
+        extra={
+            "compression_ratio": result["extractive"]["compression_ratio"],
+            "depth": result["depth"],
+            "terms": len(terms) if terms is not None else None,
+        },
+    )
+
     # 채팅 저장
     log.info("SUMMARIZE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,        
             chat_session_id=chat_session_id,
             user_idx=current_user.user_idx,
@@ -69,6 +88,97 @@ def summarize(
         request_id=request.state.request_id,
         success=True,
         data=SummarizeData(
-            summarized_text=summarized_text
+            summarized_text=summarized_text,
+            extractive=result["extractive"],
+            terms=terms,
         )
     )
+
+
+@router.post("/stream")
+async def summarize_stream(
+    request: Request,
+    req: SummarizeRequest,
+    chat_session_id: int | None = Query(default=None),
+    project_id: int | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    요약 결과를 SSE로 스트리밍
+    - event: delta  data: {"text": "..."}
+    - event: done   data: {"request_id", "chat_session_id", "ttft_ms", "terms"}
+    - event: error  data: {"error_code", "message"}
+    """
+    log = get_logger(request)
+    request_id = request.state.request_id
+    user_idx = current_user.user_idx
+    user_lang = current_user.user_lang
+    started = time.perf_counter()
+
+    log.info(
+        "SUMMARIZE_STREAM_REQUEST",
+        extra={
+            "chat_session_id": chat_session_id,
+            "text_length": len(req.text),
+            "mode": req.mode,
+        },
+    )
+
+    async def event_stream():
+        parts: list[str] = []
+        ttft_ms = None
+        try:
+            async for delta in summarize_text_stream(text=req.text, mode=req.mode):
+                if ttft_ms is None:
+                    ttft_ms = int((time.perf_counter() - started) * 1000)
+                    log.info("SUMMARIZE_STREAM_FIRST_TOKEN", extra={"ttft_ms": ttft_ms})
+                parts.append(delta)
+                yield format_sse("delta", {"text": delta})
+
+        except AppError as e:
+            log.warning("SUMMARIZE_STREAM_FAILED", extra={"error_code": e.error_code})
+            yield format_sse("error", {"error_code": e.error_code, "message": e.message})
+            return
+        except Exception:
+            log.exception("SUMMARIZE_STREAM_INTERNAL_ERROR")
+            yield format_sse("error", {"error_code": ErrorCode.INTERNAL_SERVER_ERROR, "message": "Internal server error."})
+            return
+
+        log.info(
+            "SUMMARIZE_STREAM_SUCCESS",
+            extra={"ttft_ms": ttft_ms, "latency_ms": int((time.perf_counter() - started) * 1000)},
+        )
+
+        # 스트림 완료 후 조립된 텍스트를 채팅으로 저장
+        session_id = chat_session_id
+        log.info("SUMMARIZE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
+        try:
+            session_id = await run_in_threadpool(
+                save_chat_messages_detached,
+                chat_session_id=chat_session_id,
+                user_idx=user_idx,
+                feature_type=FeatureType.summarize,
+                user_content=req.text,
+                assistant_content="".join(parts).strip(),
+                request_id=request_id,
+                project_id=project_id,
+            )
+            log.info("SUMMARIZE_CHAT_SAVE_SUCCESS")
+        except SQLAlchemyError:
+            log.exception("SUMMARIZE_CHAT_SAVE_DB_ERROR")
+        except Exception:
+            log.exception("SUMMARIZE_CHAT_SAVE_INTERNAL_ERROR")
+
+        terms = term_service.annotate_terms(req.text, user_lang)
+        yield format_sse("done", {
+            "request_id": request_id,
+            "chat_session_id": session_id,
+            "ttft_ms": ttft_ms,
+            "terms": [t.model_dump() for t in terms] if terms is not None else None,
+        })
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
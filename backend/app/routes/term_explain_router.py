@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Request, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.dependencies.auth import get_current_user
@@ -16,7 +17,7 @@ router = APIRouter(prefix="/term/explain", tags=["Term-Explain"])
 
 
 @router.post("", response_model=TermExplainResponse)
-def explain(
+async def explain(
     req_http: Request,
     payload: TermExplainRequest, 
     chat_session_id: int | None = Query(default=None),
@@ -38,7 +39,7 @@ def explain(
     
     
     try:
-        resp: TermExplainResponse = term_service.explain_term(db=db, request=payload)
+        resp: TermExplainResponse = await term_service.explain_term_async(db=db, request=payload)
         resp.request_id = req_http.state.request_id
         log.info("TERM_EXPLAIN_SUCCESS")
 
@@ -57,7 +58,8 @@ def explain(
 
     log.info("TERM_EXPLAIN_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,
             chat_session_id=chat_session_id,
             user_idx=current_user.user_idx,
@@ -2,14 +2,23 @@ import uuid
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.dependencies.auth import get_current_user
 from app.models.enums import FeatureType
 from app.models.users import User
-from app.schemas.translate import TranslateData, TranslateRequest, TranslateResponse
-from app.services.translate_service import translate_text
+from app.schemas.translate import (
+    TranslateBatchData,
+    TranslateBatchRequest,
+    TranslateBatchResponse,
+    TranslateData,
+    TranslateRequest,
+    TranslateResponse,
+)
+from app.services.translate_service import translate_many_async, translate_multi_async, translate_text_async
 from app.services.chat_log_service import save_chat_messages
+from app.services.term_service import term_service
 from app.exceptions.error import AppError, ErrorCode
 from app.core.logging import get_logger
 
@@ -17,7 +26,7 @@ router = APIRouter(prefix="/translate", tags=["Translate"])
 
 
 @router.post("", response_model=TranslateResponse)
-def translate(
+async def translate(
     req_http: Request,
     request: TranslateRequest,
     chat_session_id: int | None = None,
@@ -26,6 +35,7 @@ def translate(
     current_user: User = Depends(get_current_user),
 ) -> TranslateResponse:
     log = get_logger(req_http)
+    targets = request.targets()
 
     # 기능
     log.info(
@@ -33,21 +43,41 @@ def translate(
         extra={
             "chat_session_id": chat_session_id,
             "source_lang": request.source_lang,
-            "target_lang": request.target_lang,
+            "target_lang": targets[0] if len(targets) == 1 else ",".join(t.value for t in targets),
         },
     )
 
     try:
-        result = translate_text(
-            text=request.text,
-            source_lang=request.source_lang,
-            target_lang=request.target_lang,
-        )
+        if len(targets) > 1:
+            result = await translate_multi_async(
+                text=request.text,
+                source_lang=request.source_lang,
+                target_langs=targets,
+            )
+            translations = result["translations"]
+            translated_text = translations[targets[0].value]
+        else:
+            result = await translate_text_async(
+                text=request.text,
+                source_lang=request.source_lang,
+                target_lang=targets[0],
+            )
+            translations = None
+            translated_text = result["translated_text"]
 
         detected_lang = result.get("detected_lang")
-        translated_text = result["translated_text"]
+        translation_memory = result.get("translation_memory")
+        terms = term_service.annotate_terms(request.text, targets[0])
 
-        log.info("TRANSLATE_SUCCESS", extra={"detected_lang": detected_lang})
+        log.info(
+            "TRANSLATE_SUCCESS",
+            extra={
+                "detected_lang": detected_lang,
+                "tm_hit_ratio": translation_memory["hit_ratio"] if translation_memory else None,
+                "fused": result.get("fused"),
+                "terms": len(terms) if terms is not None else None,
+            },
+        )
 
     except AppError as e:
         log.warning("TRANSLATE_FAILED", extra={"error_code": e.error_code})
@@ -59,16 +89,22 @@ def translate(
     # 채팅 저장
     log.info("TRANSLATE_CHAT_SAVE_REQUEST", extra={"chat_session_id": chat_session_id})
     try:
-        save_chat_messages(
+        await run_in_threadpool(
+            save_chat_messages,
             db=db,
             user_idx=current_user.user_idx,
             chat_session_id=chat_session_id,
             feature_type=FeatureType.translate,
             user_content=request.text,
-            assistant_content=translated_text,
+            # 여러 언어는 한 턴(assistant 메시지 1개)에 언어별로 묶어서 저장
+            assistant_content=(
+                "\n\n".join(f"[{lang}]\n{text}" for lang, text in translations.items())
+                if translations
+                else translated_text
+            ),
             request_id=req_http.state.request_id,
             source_lang=request.source_lang,
-            target_lang=request.target_lang,
+            target_lang=targets[0] if len(targets) == 1 else None,
             project_id=project_id,
         )
         log.info("TRANSLATE_CHAT_SAVE_SUCCESS")
@@ -84,7 +120,59 @@ def translate(
         success=True,
         data=TranslateData(
             detected_lang=detected_lang,
-            translated_text=translated_text
+            translated_text=translated_text,
+            translations=translations,
+            translation_memory=translation_memory,
+            terms=terms,
         ),
     )
-        
\ No newline at end of file
+
+
+@router.post("/batch", response_model=TranslateBatchResponse)
+async def translate_batch(
+    req_http: Request,
+    request: TranslateBatchRequest,
+    current_user: User = Depends(get_current_user),
+) -> TranslateBatchResponse:
+    """
+    UI 문구 / 목록처럼 짧은 텍스트 여러 개를 한 번에 번역 (채팅 기록에는 저장하지 않음)
+    """
+    log = get_logger(req_http)
+
+    log.info(
+        "TRANSLATE_BATCH_REQUEST",
+        extra={
+            "count": len(request.texts),
+            "source_lang": request.source_lang,
+            "target_lang": request.target_lang,
+        },
+    )
+
+    try:
+        result = await translate_many_async(
+            texts=request.texts,
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+        )
+
+        log.info(
+            "TRANSLATE_BATCH_SUCCESS",
+            extra={
+                "detected_lang": result.get("detected_lang"),
+                "llm_calls": result["llm_calls"],
+                "tm_hit_ratio": result["translation_memory"]["hit_ratio"],
+            },
+        )
+
+    except AppError as e:
+        log.warning("TRANSLATE_BATCH_FAILED", extra={"error_code": e.error_code})
+        raise
+    except Exception:
+        log.exception("TRANSLATE_BATCH_INTERNAL_ERROR")
+        raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR)
+
+    return TranslateBatchResponse(
+        request_id=req_http.state.request_id,
+        success=True,
+        data=TranslateBatchData(**result),
+    )
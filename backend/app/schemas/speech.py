@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class SpeechData(BaseModel):
   text: str = Field(..., description="음성 인식된 텍스트")
+  detected_lang: Optional[str] = Field(None, description="인식된 텍스트의 언어 (ko, en, uz / 판별 불가면 null)")
 
 
 class SpeechResponse(BaseModel):
@@ -1,11 +1,29 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+from app.models.enums import SummarizeMode
+from app.schemas.term import TermAnnotation
+
 class SummarizeRequest(BaseModel):
   text: str = Field(..., min_length=1, max_length=1000, description="원문 텍스트")
+  mode: Optional[SummarizeMode] = Field(
+    default=None,
+    description="fast(문장 추출 후 LLM 1번) / balanced(추출 후 map-reduce) / full(추출 없음). 미지정 시 서버 기본값",
+  )
+
+
+class ExtractiveStats(BaseModel):
+  mode: SummarizeMode = Field(..., description="적용된 요약 mode")
+  sentences: int = Field(..., description="원문 문장 수 (추출하지 않았으면 0)")
+  kept_sentences: int = Field(..., description="추출 단계에서 남긴 문장 수")
+  compression_ratio: float = Field(..., description="추출 후 / 원문 추정 토큰 비율 (1.0 = 줄이지 않음)")
 
 
 class SummarizeData(BaseModel):
   summarized_text: str = Field(..., description="요약된 텍스트")
+  extractive: Optional[ExtractiveStats] = Field(default=None, description="추출 단계 통계")
+  terms: Optional[list[TermAnnotation]] = Field(default=None, description="원문에서 찾은 용어와 설명 (번역은 사용자 언어)")
 
 
 class SummarizeResponse(BaseModel):
@@ -49,13 +49,23 @@ class TermExplainRequest(BaseModel):
 
 class TermExplainData(BaseModel):
     term: str = Field(..., description="설명할 용어")  
+    input_term: Optional[str] = Field(default=None, description="입력이 기존 용어로 보정됐을 때 원래 입력 (예: '센 팍' -> '센팍')")
     source: Source = Field(..., description="설명 출처 (db 또는 ai_guess)")
     translated_term: str = Field(..., description= "번역된 용어")
     explanation: str = Field(..., description="용어 설명")
     translated_explanation: str = Field(..., description="번역된 용어 설명")
+    context_class: Optional[str] = Field(default=None, description="context 분류 (문맥별 설명을 썼을 때, 예: course / campus)")
 
 
 class TermExplainResponse(BaseModel):
     request_id: Optional[str] = Field(default=None, description="요청 ID")
     success: bool = Field(..., description="용어 설명 성공 여부")
     data: TermExplainData = Field(..., description="용어 설명 데이터")
+
+
+class TermAnnotation(BaseModel):
+    term: str = Field(..., description="원문에서 찾은 용어")
+    spans: list[tuple[int, int]] = Field(..., description="요청 원문 안의 [start, end) 위치 목록")
+    explanation: str = Field(..., description="용어 설명 (한국어)")
+    translated_term: Optional[str] = Field(default=None, description="번역된 용어 (target 언어 번역이 아직 없으면 null)")
+    translated_explanation: Optional[str] = Field(default=None, description="번역된 용어 설명 (target 언어 번역이 아직 없으면 null)")
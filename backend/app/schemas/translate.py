@@ -1,19 +1,52 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Literal, Optional
 
 from app.models.enums import Lang
+from app.schemas.term import TermAnnotation
 
 class TranslateRequest(BaseModel):
   text: str = Field(..., min_length=1, description="원문 텍스트")
   source_lang: Lang | None = Field(
     default=None, description="원문 언어(옵션). 예: ko, en, uz"
   )
-  target_lang: Lang = Field(..., min_length=1, description="번역할 언어. 예: ko, en, uz")
+  target_lang: Lang | None = Field(None, description="번역할 언어. 예: ko, en, uz")
+  target_langs: list[Lang] | None = Field(
+    default=None, description="여러 언어로 한 번에 번역할 때 (예: [\"en\", \"uz\"]). target_lang과 함께 쓰면 target_lang이 첫 번째"
+  )
+
+  @model_validator(mode="after")
+  def _require_target(self) -> "TranslateRequest":
+    if self.target_lang is None and not self.target_langs:
+      raise ValueError("target_lang or target_langs is required.")
+    return self
+
+  def targets(self) -> list[Lang]:
+    """
+    target_lang + target_langs (순서 유지, 중복 제거)
+    """
+    langs = ([self.target_lang] if self.target_lang is not None else []) + list(self.target_langs or [])
+    return list(dict.fromkeys(langs))
+
+
+class TranslationMemoryStats(BaseModel):
+  segments: int = Field(..., description="문장 수")
+  hits: int = Field(..., description="번역 메모리에서 찾은 문장 수")
+  hit_ratio: float = Field(..., description="hits / segments")
+  term_match: bool = Field(False, description="입력 전체가 용어 사전의 용어와 일치했는지")
 
 
 class TranslateData(BaseModel):
   detected_lang: Lang | None = Field(None, description="감지된 원문 언어")
-  translated_text: str = Field(..., description="번역된 텍스트")
+  translated_text: str = Field(..., description="번역된 텍스트 (target이 여러 개면 첫 번째 언어)")
+  translations: dict[str, str] | None = Field(
+    None, description="target_langs 요청 시 언어별 번역 결과"
+  )
+  translation_memory: TranslationMemoryStats | None = Field(
+    None, description="번역 메모리 적중 정보 (TRANSLATION_MEMORY_ENABLED일 때)"
+  )
+  terms: list[TermAnnotation] | None = Field(
+    None, description="원문에서 찾은 용어와 설명 (번역은 target이 여러 개면 첫 번째 언어)"
+  )
 
 
 class TranslateResponse(BaseModel):
@@ -21,3 +54,29 @@ class TranslateResponse(BaseModel):
   success: bool = Field(..., description="번역 성공 여부")
   data: TranslateData
   
+
+
+class TranslateBatchRequest(BaseModel):
+  texts: list[str] = Field(..., min_length=1, description="원문 텍스트 목록 (빈 문자열은 그대로 반환)")
+  source_lang: Lang | None = Field(
+    default=None, description="원문 언어(옵션). 예: ko, en, uz"
+  )
+  target_lang: Lang = Field(..., description="번역할 언어. 예: ko, en, uz")
+
+
+class TranslateBatchItem(BaseModel):
+  index: int = Field(..., description="texts에서의 위치")
+  translated_text: str = Field(..., description="번역된 텍스트")
+
+
+class TranslateBatchData(BaseModel):
+  detected_lang: Lang | None = Field(None, description="감지된 원문 언어")
+  items: list[TranslateBatchItem] = Field(..., description="입력 순서대로의 번역 결과")
+  llm_calls: int = Field(..., description="실제 LLM 호출 수")
+  translation_memory: TranslationMemoryStats | None = Field(None, description="번역 메모리 적중 정보")
+
+
+class TranslateBatchResponse(BaseModel):
+  request_id: str = Field(..., description="요청 ID")
+  success: bool = Field(..., description="번역 성공 여부")
+  data: TranslateBatchData
@@ -2,6 +2,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
+from app.db.session import SessionLocal
 from app.models.chat_session import ChatSession
 from app.schemas.chat_message import ChatMessageCreate
 from app.services.chat_session_service import get_chat_session
@@ -116,3 +117,18 @@ def save_chat_messages(
         pass
     
     return session_id
+
+
+def save_chat_messages_detached(**kwargs) -> int:
+    """
+    요청 DB 세션과 별개로 새 세션을 열어 save_chat_messages 실행.
+    SSE 스트리밍처럼 응답을 보내는 도중(=의존성 세션 수명 밖)에 저장해야 할 때 사용
+    """
+    db = SessionLocal()
+    try:
+        # 요청 경로(get_current_user 조회 후)와 같이 트랜잭션이 시작된 상태로 호출
+        # (create_message가 내부에서 commit 하므로 with db.begin() 경로를 타면 안 됨)
+        db.begin()
+        return save_chat_messages(db=db, **kwargs)
+    finally:
+        db.close()
@@ -1,10 +1,45 @@
 """
 General chat service for ChatGPT-like conversations
 """
-from app.services.openai_service import call_llm, OpenAIRateLimitError, OpenAIUpstreamError
+from typing import AsyncIterator
+
+from app.services.openai_service import (
+    call_llm,
+    call_llm_async,
+    stream_llm_async,
+    OpenAIServiceError,
+)
 from app.exceptions.error import AppError, ErrorCode
 
 
+SYSTEM_PROMPT = """You are a helpful AI assistant for KNU (Kyungnam University) students.
+You can help with:
+- Answering questions about university life
+- Explaining academic concepts  
+- Providing study tips
+- General conversation
+- Translation and language help
+- Summarizing information
+
+Be friendly, helpful, and concise. Respond in the same language as the user's question."""
+
+
+def _to_chat_error(e: Exception) -> AppError:
+    # e.error_code: RATE_LIMITED / DEADLINE_EXCEEDED / UPSTREAM_ERROR / OPENAI_ERROR / INTERNAL_ERROR
+    if isinstance(e, AppError):
+        return e
+    if isinstance(e, OpenAIServiceError):
+        if e.error_code == "RATE_LIMITED":
+            return AppError(error_code=ErrorCode.RATE_LIMITED, message=str(e))
+        if e.error_code == "DEADLINE_EXCEEDED":
+            return AppError(error_code=ErrorCode.REQUEST_TIMEOUT, message=str(e))
+        return AppError(error_code=ErrorCode.SERVICE_UNAVAILABLE, message=str(e))
+    return AppError(
+        error_code=ErrorCode.INTERNAL_SERVER_ERROR,
+        message=f"Failed to generate chat response: {str(e)}",
+    )
+
+
 def general_chat(message: str) -> str:
     """
     General chat function for free-form conversation with AI
@@ -16,40 +51,44 @@ def general_chat(message: str) -> str:
         AI's response
         
     Raises:
-        OpenAIRateLimitError: If rate limit exceeded
-        OpenAIUpstreamError: If OpenAI API error
-        AppError: For other errors
+        AppError: RATE_LIMITED / REQUEST_TIMEOUT / SERVICE_UNAVAILABLE for OpenAI errors,
+            INTERNAL_SERVER_ERROR for anything else
     """
-    
-    system_prompt = """You are a helpful AI assistant for KNU (Kyungnam University) students.
-You can help with:
-- Answering questions about university life
-- Explaining academic concepts  
-- Providing study tips
-- General conversation
-- Translation and language help
-- Summarizing information
+    try:
+        return call_llm(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=message,
+            feature="chat",
+        )
+    except Exception as e:
+        raise _to_chat_error(e)
 
-Be friendly, helpful, and concise. Respond in the same language as the user's question."""
 
+async def general_chat_async(message: str) -> str:
+    """
+    Async variant of general_chat (used by the async chat route)
+    """
     try:
-        response = call_llm(
-            system_prompt=system_prompt,
+        return await call_llm_async(
+            system_prompt=SYSTEM_PROMPT,
             user_prompt=message,
-            model="gpt-4o-mini",
-            temperature=0.7,  # More creative for general chat
-            max_tokens=1000   # Longer responses for chat
+            feature="chat",
         )
-        
-        return response
-        
-    except OpenAIRateLimitError:
-        raise
-    except OpenAIUpstreamError:
-        raise
     except Exception as e:
-        raise AppError(
-            error_code=ErrorCode.INTERNAL_ERROR,
-            message=f"Failed to generate chat response: {str(e)}",
-            status_code=500
-        )
+        raise _to_chat_error(e)
+
+
+async def general_chat_stream(message: str) -> AsyncIterator[str]:
+    """
+    Streaming variant of general_chat (yields response deltas as they arrive)
+    """
+    try:
+        async for delta in stream_llm_async(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=message,
+            feature="chat",
+        ):
+            yield delta
+    except Exception as e:
+        # 스트림 도중 에러는 SSE error 이벤트로 내려가므로 AppError로 변환
+        raise _to_chat_error(e)
@@ -5,6 +5,7 @@ from typing import List, Tuple
 from app.models.chat_session import ChatSession
 from app.models.chat_message import ChatMessage
 from app.services.openai_service import call_llm  # 너희 기존 함수
+from app.services.lang_detect import LANG_NAMES, confident_lang
 
 
 def _build_title_prompt(pairs: List[Tuple[str, str]], lang: str) -> tuple[str, str]:
@@ -15,17 +16,20 @@ def _build_title_prompt(pairs: List[Tuple[str, str]], lang: str) -> tuple[str, s
             user_message = content
             break
     
+    # 첫 메시지 언어를 로컬 감지, 불확실하면 사용자 설정 언어
+    title_lang = LANG_NAMES.get(confident_lang(user_message) or lang, "the user's language")
+
     system = (
         "You are a chat title generator.\n"
         "Create very short, clear titles for chats.\n"
-        "Use the SAME LANGUAGE as the user's message.\n"
+        f"Write the title in {title_lang}.\n"
         "Output ONLY the title text - no quotes, emojis, or extra formatting."
     )
 
     user = (
         "Task:\n"
         "- Create a very short, clear title for this chat\n"
-        "- Use the SAME LANGUAGE as the user's message (Korean → Korean, Uzbek → Uzbek, English → English)\n"
+        f"- Write it in {title_lang}\n"
         "- Maximum 6 words and 40 characters\n"
         "- Do NOT add quotes, emojis, numbers, or any extra text\n"
         "- Output ONLY the title text\n\n"
@@ -68,9 +72,7 @@ def auto_set_chat_title_if_empty(db: Session, *, chat_session_id: int) -> None:
         title = call_llm(
             system_prompt=system,
             user_prompt=user,
-            model="gpt-4o-mini",
-            temperature=0.2,
-            max_tokens=64,
+            feature="title",
         )
     except Exception:
         return
@@ -0,0 +1,146 @@
+"""
+LLM 요약 전 추출(extractive) 단계
+- 문장을 TF-IDF 벡터로 만들고 코사인 유사도 그래프에서 TextRank(PageRank) 점수 계산 (NumPy 행렬 연산)
+- 거의 같은 문장(반복되는 머리글 / 표 행 / 법적 고지)은 첫 문장만 남김
+- 점수 높은 문장부터 토큰 예산까지 고르고 원문 순서대로 이어붙임
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.core.config import SUMMARIZE_EXTRACT_MAX_FEATURES
+from app.services.openai_service import estimate_text_tokens
+from app.services.translation_memory import normalize_segment, split_segments
+
+# 라틴 / 키릴 단어는 그대로, 한글은 조사/어미가 붙어도 겹치도록 글자 bigram
+_WORD_RE = re.compile(r"[A-Za-zЀ-ӿ0-9]{2,}|[가-힣]+")
+
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+_DAMPING = 0.85
+_MAX_ITERATIONS = 50
+_TOLERANCE = 1e-6
+# 이 유사도 이상이면 같은 문장으로 보고 뒤 문장 제외
+_DUPLICATE_SIMILARITY = 0.9
+
+
+@dataclass(frozen=True)
+class Extraction:
+    text: str
+    sentences: int        # 원문 문장 수
+    kept: int             # 고른 문장 수
+    input_tokens: int
+    output_tokens: int
+
+    @property
+    def compression_ratio(self) -> float:
+        return round(self.output_tokens / self.input_tokens, 4) if self.input_tokens else 1.0
+
+
+def _features(sentence: str) -> list[str]:
+    features: list[str] = []
+    for word in _WORD_RE.findall(sentence.lower()):
+        if "가" <= word[0] <= "힣":
+            features.extend(word[i:i + 2] for i in range(max(1, len(word) - 1)))
+        else:
+            features.append(word)
+    return features
+
+
+def _tfidf(sentences: list[str]) -> np.ndarray:
+    """
+    (문장 수, 특징 수) L2 정규화 TF-IDF 행렬. 특징은 문서 빈도 상위 SUMMARIZE_EXTRACT_MAX_FEATURES개
+    """
+    tokenized = [Counter(_features(s)) for s in sentences]
+    df = Counter(f for counts in tokenized for f in counts)
+    vocab = {f: i for i, (f, _) in enumerate(df.most_common(SUMMARIZE_EXTRACT_MAX_FEATURES))}
+
+    matrix = np.zeros((len(sentences), len(vocab)), dtype=np.float32)
+    for row, counts in enumerate(tokenized):
+        for f, count in counts.items():
+            col = vocab.get(f)
+            if col is not None:
+                matrix[row, col] = count
+
+    doc_freq = np.count_nonzero(matrix, axis=0).astype(np.float32)
+    idf = np.log((1.0 + len(sentences)) / (1.0 + doc_freq)) + 1.0
+    matrix = np.log1p(matrix) * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def _textrank(similarity: np.ndarray) -> np.ndarray:
+    n = similarity.shape[0]
+    weights = similarity.copy()
+    np.fill_diagonal(weights, 0.0)
+    out_degree = weights.sum(axis=1, keepdims=True)
+    # 다른 문장과 전혀 겹치지 않는 문장은 모든 문장에 고르게 연결
+    transition = np.where(out_degree > 0, weights / np.where(out_degree > 0, out_degree, 1.0), 1.0 / n)
+
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(_MAX_ITERATIONS):
+        updated = (1.0 - _DAMPING) / n + _DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < _TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def _duplicates(similarity: np.ndarray) -> np.ndarray:
+    """
+    앞 문장과 거의 같은 문장 표시 (bool 배열)
+    """
+    earlier = np.tril(similarity >= _DUPLICATE_SIMILARITY, k=-1)
+    return earlier.any(axis=1)
+
+
+def extract_sentences(text: str, *, token_budget: int) -> Extraction:
+    """
+    token_budget(추정 토큰) 안에서 중요한 문장만 원문 순서대로 남긴 텍스트 반환
+    - 원문이 예산 안이면 그대로
+    """
+    input_tokens = estimate_text_tokens(text)
+    segments, separators = split_segments(text)
+    if input_tokens <= token_budget or len(segments) < 2:
+        return Extraction(text=text, sentences=len(segments), kept=len(segments),
+                          input_tokens=input_tokens, output_tokens=input_tokens)
+
+    matrix = _tfidf([normalize_segment(s) for s in segments])
+    similarity = matrix @ matrix.T
+    scores = _textrank(similarity)
+    scores[_duplicates(similarity)] = -1.0
+
+    kept: list[int] = []
+    used = 0
+    for index in np.argsort(-scores, kind="stable"):
+        if scores[index] < 0:
+            break
+        tokens = estimate_text_tokens(segments[index])
+        if used + tokens > token_budget:
+            continue
+        kept.append(int(index))
+        used += tokens
+
+    # 남긴 문장을 원래 문단(빈 줄 = 페이지 / 슬라이드)끼리 묶어 문단 사이는 빈 줄로 -> 뒤 map-reduce가 페이지 단위로 나눌 수 있게
+    paragraphs: list[int] = []
+    paragraph = 0
+    for sep in separators[:-1]:
+        if paragraphs and _PARAGRAPH_BREAK_RE.search(sep):
+            paragraph += 1
+        paragraphs.append(paragraph)
+
+    groups: dict[int, list[str]] = {}
+    for i in sorted(kept):
+        groups.setdefault(paragraphs[i], []).append(segments[i])
+    extracted = "\n\n".join("\n".join(group) for group in groups.values())
+    return Extraction(
+        text=extracted,
+        sentences=len(segments),
+        kept=len(kept),
+        input_tokens=input_tokens,
+        output_tokens=estimate_text_tokens(extracted),
+    )
@@ -0,0 +1,130 @@
+"""
+로컬 언어 감지 (ko / en / uz, LLM 호출 없음)
+- 문자 체계: 한글 -> ko, 키릴 -> uz
+- 라틴 문자는 우즈베크어 표기(oʻ / gʻ, q 빈도)와 기능어(va, uchun / the, and ...)로 en / uz 구분
+- 섞인 텍스트는 문자 수 비율로 점수를 나누고, 가장 높은 언어의 비율을 confidence로 반환
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.core.config import LANG_DETECT_MIN_CONFIDENCE
+
+LANG_NAMES = {"ko": "Korean", "en": "English", "uz": "Uzbek"}
+
+# 긴 문서는 앞부분만 봐도 충분
+_SAMPLE_CHARS = 4000
+
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㆎ]")
+_CYRILLIC_RE = re.compile(r"[Ѐ-ӿ]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+_WORD_RE = re.compile(r"[A-Za-z]+(?:[ʻ‘’'`][A-Za-z]+)*")
+
+# oʻ / gʻ (영어 소유격 "dog's"는 제외)
+_UZ_MARKER_RE = re.compile(r"[oOgG][ʻ‘’'`](?![sS]\b)[A-Za-z]")
+# 우즈베크어는 q 뒤에 u가 오지 않는 경우가 흔함 (영어는 거의 qu)
+_UZ_Q_RE = re.compile(r"[qQ](?![uU])")
+
+_UZ_WORDS = frozenset({
+    "va", "bu", "uchun", "emas", "bilan", "ham", "lekin", "yoki", "edi", "men", "siz", "biz",
+    "ular", "nima", "qanday", "kerak", "mumkin", "juda", "yaxshi", "bor", "haqida", "ekan",
+    "shu", "uning", "bizning", "kabi", "keyin", "hamma", "bir", "ikki", "salom", "rahmat",
+})
+# 교착어 어미/접미사 (5글자 이상 단어에서만; 영어의 began / agenda 같은 예외는 기능어 증거로 상쇄)
+_UZ_SUFFIXES = (
+    "lar", "larni", "larga", "larda", "lari", "ning", "ga", "da", "dan", "dagi", "gan",
+    "moqda", "yapti", "miz", "imiz", "ingiz", "sizlar", "man", "dir", "lik", "chi",
+)
+_UZ_SUFFIX_RE = re.compile(r"(?:" + "|".join(sorted(_UZ_SUFFIXES, key=len, reverse=True)) + r")$")
+_EN_WORDS = frozenset({
+    "the", "and", "is", "are", "of", "to", "in", "for", "with", "on", "that", "this", "it",
+    "was", "be", "as", "by", "you", "not", "have", "from", "at", "we", "can", "will", "an",
+    "or", "what", "how", "please", "hello", "thank", "thanks", "a", "i", "my", "your", "our",
+    "they", "he", "she", "his", "her", "their", "there", "were", "has", "had", "do", "does",
+    "if", "but", "all", "so", "which", "who", "when", "about", "more", "many", "one", "after",
+})
+
+# 한글 1글자는 라틴 2~3글자 정도의 정보량
+_HANGUL_WEIGHT = 2.0
+# 라틴 텍스트 길이 자체를 영어 쪽 약한 증거로 (우즈베크어 표시가 전혀 없는 긴 라틴 텍스트)
+_EN_LENGTH_PRIOR = 0.02
+
+
+@dataclass(frozen=True)
+class LangDetection:
+    lang: Optional[str]                 # ko / en / uz, 문자가 없으면 None
+    confidence: float                   # 0~1
+    scores: dict[str, float] = field(default_factory=dict)  # 언어별 비율
+    mixed: bool = False                 # 두 번째 언어 비율이 0.2 이상
+
+    @property
+    def confident(self) -> bool:
+        return self.lang is not None and self.confidence >= LANG_DETECT_MIN_CONFIDENCE
+
+
+def _latin_split(sample: str, latin: int) -> tuple[float, float]:
+    """
+    라틴 문자 중 우즈베크어 비율, en/uz 판단의 확실성(0.5~1) 반환
+    """
+    words = [w.lower() for w in _WORD_RE.findall(sample)]
+    uz_evidence = (
+        3.0 * len(_UZ_MARKER_RE.findall(sample))
+        + 2.0 * sum(1 for w in words if w in _UZ_WORDS)
+        + 1.0 * len(_UZ_Q_RE.findall(sample))
+        + 1.0 * sum(1 for w in words if len(w) >= 5 and w not in _EN_WORDS and _UZ_SUFFIX_RE.search(w))
+    )
+    en_evidence = 2.0 * sum(1 for w in words if w in _EN_WORDS) + _EN_LENGTH_PRIOR * latin
+
+    total = uz_evidence + en_evidence
+    uz_share = uz_evidence / total if total else 0.0
+    certainty = 0.5 + 0.5 * abs(uz_evidence - en_evidence) / (total + 1.0)
+    return uz_share, certainty
+
+
+def detect_lang(text: str) -> LangDetection:
+    sample = (text or "")[:_SAMPLE_CHARS]
+    hangul = len(_HANGUL_RE.findall(sample))
+    cyrillic = len(_CYRILLIC_RE.findall(sample))
+    latin = len(_LATIN_RE.findall(sample))
+    if hangul + cyrillic + latin == 0:
+        return LangDetection(lang=None, confidence=0.0)
+
+    uz_share, certainty = _latin_split(sample, latin) if latin else (0.0, 1.0)
+    raw = {
+        "ko": hangul * _HANGUL_WEIGHT,
+        "uz": cyrillic + latin * uz_share,
+        "en": latin * (1.0 - uz_share),
+    }
+    total = sum(raw.values())
+    scores = {lang: round(value / total, 4) for lang, value in raw.items()}
+
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    lang = ranked[0]
+    confidence = scores[lang]
+    # 라틴 문자로 정한 en / uz는 en-uz 구분의 확실성만큼 낮춤
+    if lang == "en" or (lang == "uz" and latin * uz_share > cyrillic):
+        confidence *= certainty
+
+    return LangDetection(
+        lang=lang,
+        confidence=round(confidence, 4),
+        scores=scores,
+        mixed=scores[ranked[1]] >= 0.2,
+    )
+
+
+def guess_lang(text: str) -> str:
+    """
+    항상 언어 코드 하나를 반환 (판단 불가면 en). 토큰 추정 / TM 키처럼 근사치로 충분한 곳에서 사용
+    """
+    return detect_lang(text).lang or "en"
+
+
+def confident_lang(text: str) -> Optional[str]:
+    """
+    LANG_DETECT_MIN_CONFIDENCE 이상일 때만 언어 코드, 아니면 None (LLM 감지에 맡김)
+    """
+    detection = detect_lang(text)
+    return detection.lang if detection.confident else None
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import create_engine, delete, select, func
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import (
+    LLM_CACHE_BACKEND,
+    LLM_CACHE_DATABASE_URL,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_DB_MAX_ENTRIES,
+    LLM_CACHE_FEATURES,
+)
+from app.core.metrics import registry, stats_to_samples
+from app.models.llm_cache_entry import LLMCacheEntry
+
+logger = logging.getLogger("app")
+
+# db 백엔드: 만료/용량 정리는 N번 저장마다 1번만
+_DB_EVICT_EVERY = 200
+# db 백엔드: last_hit_at 갱신은 이 간격보다 오래된 경우만 (hit마다 write 방지)
+_DB_TOUCH_INTERVAL = timedelta(hours=1)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def make_cache_key(
+    *,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """
+    (model, system_prompt, user_prompt, temperature, max_tokens) 의 content hash
+    """
+    material = json.dumps(
+        [model, system_prompt, user_prompt, round(float(temperature), 3), int(max_tokens)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# -----------------------------
+# 백엔드
+# -----------------------------
+class MemoryCacheBackend:
+    """
+    워커 프로세스 내부 LRU + TTL 캐시
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: int) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DatabaseCacheBackend:
+    """
+    llm_cache 테이블 기반 공유 캐시 (Postgres 테이블 또는 SQLite 파일)
+    - 모든 gunicorn 워커가 같은 테이블을 보므로 한 워커의 응답을 다른 워커도 재사용
+    - 용량 초과 시 last_hit_at 오래된 순으로 삭제
+    """
+
+    def __init__(self, *, session_factory: sessionmaker, max_entries: int, ttl_seconds: int) -> None:
+        self.session_factory = session_factory
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        now = _now()
+        with self.session_factory() as db:
+            row = db.get(LLMCacheEntry, key)
+            if row is None:
+                return None
+            if _as_aware(row.expires_at) <= now:
+                return None
+            if now - _as_aware(row.last_hit_at) > _DB_TOUCH_INTERVAL:
+                row.last_hit_at = now
+                db.commit()
+            return row.response
+
+    def set(self, key: str, value: str, feature: str, ttl_seconds: Optional[int] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = _now()
+        with self.session_factory() as db:
+            db.merge(
+                LLMCacheEntry(
+                    cache_key=key,
+                    feature=feature,
+                    response=value,
+                    expires_at=now + timedelta(seconds=ttl),
+                    last_hit_at=now,
+                )
+            )
+            db.commit()
+
+        with self._lock:
+            self._writes += 1
+            should_evict = self._writes % _DB_EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> None:
+        with self.session_factory() as db:
+            db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= _now()))
+
+            total = db.execute(select(func.count()).select_from(LLMCacheEntry)).scalar_one()
+            overflow = total - self.max_entries
+            if overflow > 0:
+                oldest = (
+                    select(LLMCacheEntry.cache_key)
+                    .order_by(LLMCacheEntry.last_hit_at.asc())
+                    .limit(overflow)
+                    .scalar_subquery()
+                )
+                db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.cache_key.in_(oldest)))
+            db.commit()
+
+    def clear(self) -> None:
+        with self.session_factory() as db:
+            db.execute(delete(LLMCacheEntry))
+            db.commit()
+
+
+def _as_aware(dt: datetime) -> datetime:
+    # SQLite는 tzinfo 없이 저장되므로 UTC로 간주
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+# -----------------------------
+# 캐시 (memory L1 + 선택적 shared L2)
+# -----------------------------
+class LLMCache:
+    def __init__(
+        self,
+        *,
+        local: Optional[MemoryCacheBackend],
+        shared: Optional[DatabaseCacheBackend] = None,
+        features: frozenset[str] = frozenset(),
+    ) -> None:
+        self.local = local
+        self.shared = shared
+        self.features = features
+        self._stats: dict[str, dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
+    def is_enabled(self, feature: str) -> bool:
+        return self.local is not None and feature in self.features
+
+    def _count(self, feature: str, name: str) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(feature, {"hits": 0, "shared_hits": 0, "misses": 0})
+            stats[name] += 1
+
+    def get(self, feature: str, key: str) -> Optional[str]:
+        value = self.local.get(key)
+        if value is not None:
+            self._count(feature, "hits")
+            return value
+
+        if self.shared is not None:
+            value = self._get_shared(key)
+            if value is not None:
+                self.local.set(key, value)
+                self._count(feature, "shared_hits")
+                return value
+
+        self._count(feature, "misses")
+        return None
+
+    async def aget(self, feature: str, key: str) -> Optional[str]:
+        """
+        L1은 루프에서 바로 조회, L2(DB)는 threadpool에서 조회
+        """
+        value = self.local.get(key)
+        if value is not None:
+            self._count(feature, "hits")
+            return value
+
+        if self.shared is not None:
+            value = await asyncio.to_thread(self._get_shared, key)
+            if value is not None:
+                self.local.set(key, value)
+                self._count(feature, "shared_hits")
+                return value
+
+        self._count(feature, "misses")
+        return None
+
+    def set(self, feature: str, key: str, value: str) -> None:
+        self.local.set(key, value)
+        if self.shared is not None:
+            self._set_shared(key, value, feature)
+
+    async def aset(self, feature: str, key: str, value: str) -> None:
+        self.local.set(key, value)
+        if self.shared is not None:
+            await asyncio.to_thread(self._set_shared, key, value, feature)
+
+    # 공유 캐시 장애는 캐시 miss로 취급 (기능 자체는 계속 동작)
+    def _get_shared(self, key: str) -> Optional[str]:
+        try:
+            return self.shared.get(key)
+        except Exception:
+            logger.warning("llm_cache_shared_get_failed", exc_info=True)
+            return None
+
+    def _set_shared(self, key: str, value: str, feature: str) -> None:
+        try:
+            self.shared.set(key, value, feature)
+        except Exception:
+            logger.warning("llm_cache_shared_set_failed", exc_info=True)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            features = {}
+            for feature, s in self._stats.items():
+                lookups = s["hits"] + s["shared_hits"] + s["misses"]
+                features[feature] = {
+                    **s,
+                    "hit_rate": round((s["hits"] + s["shared_hits"]) / lookups, 4) if lookups else 0.0,
+                }
+        return {
+            "backend": LLM_CACHE_BACKEND,
+            "entries": len(self.local) if self.local is not None else 0,
+            "features": features,
+        }
+
+
+def _build_cache() -> LLMCache:
+    if LLM_CACHE_BACKEND == "off":
+        return LLMCache(local=None)
+
+    local = MemoryCacheBackend(max_entries=LLM_CACHE_MAX_ENTRIES, ttl_seconds=LLM_CACHE_TTL_SECONDS)
+    shared = None
+
+    if LLM_CACHE_BACKEND == "db":
+        if LLM_CACHE_DATABASE_URL:
+            cache_engine = create_engine(LLM_CACHE_DATABASE_URL, pool_pre_ping=True)
+            LLMCacheEntry.__table__.create(bind=cache_engine, checkfirst=True)
+        else:
+            from app.db.session import engine as cache_engine
+
+        shared = DatabaseCacheBackend(
+            session_factory=sessionmaker(bind=cache_engine, autoflush=False, class_=Session),
+            max_entries=LLM_CACHE_DB_MAX_ENTRIES,
+            ttl_seconds=LLM_CACHE_TTL_SECONDS,
+        )
+
+    return LLMCache(local=local, shared=shared, features=LLM_CACHE_FEATURES)
+
+
+llm_cache = _build_cache()
+
+
+def get_cache_stats() -> dict:
+    return llm_cache.stats()
+
+
+def _cache_samples() -> list:
+    stats = get_cache_stats()
+    samples = [("entries", {}, stats["entries"])]
+    for feature, s in stats["features"].items():
+        samples.extend(stats_to_samples(s, {"feature": feature}))
+    return samples
+
+
+registry.register_collector("llm_cache", "LLM response cache in this worker", _cache_samples)
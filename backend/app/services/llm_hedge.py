@@ -0,0 +1,198 @@
+"""
+LLM hedged request
+- 첫 요청이 최근 지연의 p95(LLM_HEDGE_QUANTILE)를 넘기면 같은 요청을 하나 더 보내고 먼저 성공한 응답 사용
+- 결과가 같아도 되는(idempotent) 기능에만 사용 (translate / term / title)
+- 남은 deadline이 threshold보다 짧으면 hedge 하지 않음
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+
+from app.core.config import (
+    LLM_HEDGE_FEATURES,
+    LLM_HEDGE_QUANTILE,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_WINDOW,
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS,
+    LLM_HEDGE_MIN_DELAY_SECONDS,
+)
+from app.core.deadline import remaining_seconds
+from app.core.metrics import registry, stats_to_samples
+
+# 동기 경로(threadpool에서 호출되는 call_llm)용. 진 쪽 요청은 취소할 수 없어 끝날 때까지 스레드를 점유
+_HEDGE_THREADS = 32
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def is_hedge_enabled(feature: str) -> bool:
+    return feature in LLM_HEDGE_FEATURES
+
+
+# -----------------------------
+# 기능별 최근 지연 (p95 threshold 계산용)
+# -----------------------------
+class LatencyWindow:
+    def __init__(self, *, size: int, min_samples: int) -> None:
+        self.size = size
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, feature: str, seconds: float) -> None:
+        with self._lock:
+            window = self._samples.get(feature)
+            if window is None:
+                window = self._samples[feature] = deque(maxlen=self.size)
+            window.append(seconds)
+
+    def quantile(self, feature: str, q: float) -> Optional[float]:
+        with self._lock:
+            window = self._samples.get(feature)
+            if window is None or len(window) < self.min_samples:
+                return None
+            ordered = sorted(window)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+latency_window = LatencyWindow(size=LLM_HEDGE_WINDOW, min_samples=LLM_HEDGE_MIN_SAMPLES)
+
+
+def observe_latency(feature: str, seconds: float) -> None:
+    if is_hedge_enabled(feature):
+        latency_window.observe(feature, seconds)
+
+
+def hedge_delay(feature: str) -> float:
+    threshold = latency_window.quantile(feature, LLM_HEDGE_QUANTILE)
+    if threshold is None:
+        threshold = LLM_HEDGE_DEFAULT_DELAY_SECONDS
+    return max(LLM_HEDGE_MIN_DELAY_SECONDS, threshold)
+
+
+def _hedge_delay_within_deadline(feature: str) -> Optional[float]:
+    delay = hedge_delay(feature)
+    remaining = remaining_seconds()
+    if remaining is not None and remaining <= delay:
+        return None
+    return delay
+
+
+# -----------------------------
+# 통계
+# -----------------------------
+_stats: dict[str, dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _count(feature: str, name: str) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(feature, {"calls": 0, "hedged": 0, "hedge_wins": 0})
+        stats[name] += 1
+
+
+def get_hedge_stats() -> dict:
+    with _stats_lock:
+        snapshot = {feature: dict(s) for feature, s in _stats.items()}
+    features = {}
+    for feature, s in snapshot.items():
+        features[feature] = {
+            **s,
+            "hedge_rate": round(s["hedged"] / s["calls"], 4) if s["calls"] else 0.0,
+            "win_rate": round(s["hedge_wins"] / s["hedged"], 4) if s["hedged"] else 0.0,
+            "threshold_seconds": round(hedge_delay(feature), 3),
+        }
+    return {"features": sorted(LLM_HEDGE_FEATURES), "stats": features}
+
+
+def _hedge_samples() -> list:
+    samples = []
+    for feature, s in get_hedge_stats()["stats"].items():
+        samples.extend(stats_to_samples(s, {"feature": feature}))
+    return samples
+
+
+registry.register_collector("llm_hedge", "Hedged LLM requests in this worker", _hedge_samples)
+
+
+# -----------------------------
+# hedged 호출
+# -----------------------------
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_HEDGE_THREADS, thread_name_prefix="llm-hedge")
+        return _executor
+
+
+def _submit(fn: Callable[[], Any]) -> Future:
+    # request_id / deadline 컨텍스트 변수를 워커 스레드로 전달
+    return _get_executor().submit(contextvars.copy_context().run, fn)
+
+
+def hedged_call(feature: str, fn: Callable[[], Any]) -> Any:
+    """
+    동기 버전. fn은 같은 요청을 한 번 보내는 함수 (여러 번 호출될 수 있음)
+    """
+    delay = _hedge_delay_within_deadline(feature)
+    if delay is None:
+        return fn()
+
+    _count(feature, "calls")
+    primary = _submit(fn)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    _count(feature, "hedged")
+    backup = _submit(fn)
+    pending = {primary, backup}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                if future is backup:
+                    _count(feature, "hedge_wins")
+                return future.result()
+    # 둘 다 실패하면 원래 요청의 에러
+    return primary.result()
+
+
+async def hedged_call_async(feature: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    async 버전. 먼저 성공한 쪽을 쓰고 나머지 요청은 취소
+    """
+    delay = _hedge_delay_within_deadline(feature)
+    if delay is None:
+        return await fn()
+
+    _count(feature, "calls")
+    primary = asyncio.ensure_future(fn())
+    backup: Optional[asyncio.Future] = None
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        _count(feature, "hedged")
+        backup = asyncio.ensure_future(fn())
+        pending = {primary, backup}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is backup:
+                        _count(feature, "hedge_wins")
+                    return task.result()
+        return primary.result()
+    finally:
+        for task in (primary, backup):
+            if task is not None and not task.done():
+                task.cancel()
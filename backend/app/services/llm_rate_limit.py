@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+from app.core.metrics import registry, stats_to_samples
+from app.core.config import (
+    OPENAI_RPM_LIMIT,
+    OPENAI_TPM_LIMIT,
+    OPENAI_MIN_CONCURRENCY,
+    OPENAI_MAX_CONCURRENCY,
+    OPENAI_QUEUE_MAX_WAIT_SECONDS,
+    OPENAI_RETRY_BASE_DELAY,
+    OPENAI_RETRY_MAX_DELAY,
+)
+
+# 동시성 한도에 걸렸을 때 재확인 간격
+_CONCURRENCY_POLL_SECONDS = 0.02
+# AIMD: 성공 시 limit 당 +1 (한 "윈도우"에 +1), 429 시 곱셈 감소
+_AIMD_DECREASE_FACTOR = 0.5
+
+
+class RateLimitQueueTimeout(Exception):
+    """
+    대기열에서 OPENAI_QUEUE_MAX_WAIT_SECONDS 이상 기다려도 슬롯을 얻지 못함
+    """
+
+
+class TokenBucket:
+    """
+    분당 한도(capacity)를 초당 capacity/60 으로 채우는 토큰 버킷 (lock은 호출 측에서 잡음)
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # 한 요청이 capacity보다 크면 가득 찬 상태에서 통과시킴 (영원히 대기 방지)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        # 실제 사용량이 예약량과 다르면 보정 (음수면 추가 차감)
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class LLMRateLimiter:
+    """
+    OpenAI 호출 전 슬롯 확보
+    - RPM / TPM 토큰 버킷
+    - AIMD 동시성 제한: 성공하면 천천히(+), 429면 크게(x0.5) 줄임
+    - Retry-After 수신 시 그 시간 동안 전체 호출 일시 정지
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: int,
+        tpm: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        max_wait: float,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._rpm = TokenBucket(rpm)
+        self._tpm = TokenBucket(tpm)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._stats = {
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "acquired": 0,
+            "queued": 0,
+            "wait_seconds_total": 0.0,
+            "max_wait_seconds": 0.0,
+            "queue_timeouts": 0,
+            "throttled": 0,
+            "retries": 0,
+        }
+
+    # ---------- 슬롯 확보 ----------
+
+    def _try_acquire(self, tokens: float) -> float:
+        """
+        슬롯을 얻으면 0, 아니면 다시 시도하기까지 기다릴 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._in_flight >= int(self._limit):
+                return _CONCURRENCY_POLL_SECONDS
+
+            wait = max(self._rpm.wait_time(1, now), self._tpm.wait_time(tokens, now))
+            if wait > 0:
+                return wait
+
+            self._rpm.take(1)
+            self._tpm.take(tokens)
+            self._in_flight += 1
+            self._stats["acquired"] += 1
+            return 0.0
+
+    def _enter_queue(self) -> None:
+        with self._lock:
+            self._stats["queued"] += 1
+            self._stats["queue_depth"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._stats["queue_depth"])
+
+    def _leave_queue(self, waited: float, timed_out: bool) -> None:
+        with self._lock:
+            self._stats["queue_depth"] -= 1
+            self._stats["wait_seconds_total"] += waited
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+            if timed_out:
+                self._stats["queue_timeouts"] += 1
+
+    def acquire(self, tokens: float, max_wait: Optional[float] = None) -> None:
+        wait = self._try_acquire(tokens)
+        if wait == 0:
+            return
+
+        max_wait = self.max_wait if max_wait is None else min(self.max_wait, max_wait)
+        start = time.monotonic()
+        self._enter_queue()
+        timed_out = False
+        try:
+            while wait > 0:
+                elapsed = time.monotonic() - start
+                if elapsed >= max_wait:
+                    timed_out = True
+                    raise RateLimitQueueTimeout()
+                time.sleep(min(wait, max_wait - elapsed))
+                wait = self._try_acquire(tokens)
+        finally:
+            self._leave_queue(time.monotonic() - start, timed_out)
+
+    async def aacquire(self, tokens: float, max_wait: Optional[float] = None) -> None:
+        wait = self._try_acquire(tokens)
+        if wait == 0:
+            return
+
+        max_wait = self.max_wait if max_wait is None else min(self.max_wait, max_wait)
+        start = time.monotonic()
+        self._enter_queue()
+        timed_out = False
+        try:
+            while wait > 0:
+                elapsed = time.monotonic() - start
+                if elapsed >= max_wait:
+                    timed_out = True
+                    raise RateLimitQueueTimeout()
+                await asyncio.sleep(min(wait, max_wait - elapsed))
+                wait = self._try_acquire(tokens)
+        finally:
+            self._leave_queue(time.monotonic() - start, timed_out)
+
+    # ---------- 결과 반영 ----------
+
+    def release(
+        self,
+        *,
+        reserved_tokens: float,
+        used_tokens: Optional[int] = None,
+        throttled: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if used_tokens is not None:
+                self._tpm.refund(reserved_tokens - used_tokens)
+
+            if throttled:
+                self._stats["throttled"] += 1
+                self._limit = max(float(self.min_concurrency), self._limit * _AIMD_DECREASE_FACTOR)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            else:
+                self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._stats["retries"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = self._in_flight
+            stats["concurrency_limit"] = round(self._limit, 2)
+            stats["avg_wait_seconds"] = (
+                round(stats["wait_seconds_total"] / stats["queued"], 4) if stats["queued"] else 0.0
+            )
+            return stats
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    full-jitter exponential backoff. Retry-After가 있으면 그보다 짧게 기다리지 않음
+    """
+    delay = random.uniform(0, min(OPENAI_RETRY_MAX_DELAY, OPENAI_RETRY_BASE_DELAY * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def estimate_request_tokens(messages: list[dict], max_tokens: int) -> int:
+    """
+    TPM 예약용 대략치: 입력 문자수/3 + 출력 최대 토큰
+    """
+    chars = sum(len(m.get("content") or "") for m in messages)
+    return chars // 3 + int(max_tokens)
+
+
+rate_limiter = LLMRateLimiter(
+    rpm=OPENAI_RPM_LIMIT,
+    tpm=OPENAI_TPM_LIMIT,
+    min_concurrency=OPENAI_MIN_CONCURRENCY,
+    max_concurrency=OPENAI_MAX_CONCURRENCY,
+    max_wait=OPENAI_QUEUE_MAX_WAIT_SECONDS,
+)
+
+
+def get_rate_limit_stats() -> dict:
+    return rate_limiter.stats()
+
+
+registry.register_collector(
+    "llm_rate_limiter",
+    "OpenAI client-side rate limiter state in this worker",
+    lambda: stats_to_samples(get_rate_limit_stats()),
+)
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator, AsyncIterator
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.metrics import registry, stats_to_samples
+from app.core.config import (
+    LLM_SINGLEFLIGHT_FEATURES,
+    LLM_SINGLEFLIGHT_ADVISORY_LOCK,
+    LLM_SINGLEFLIGHT_LOCK_TIMEOUT_SECONDS,
+    LLM_SINGLEFLIGHT_LOCK_POOL_SIZE,
+)
+
+logger = logging.getLogger("app")
+
+_LOCK_POLL_SECONDS = 0.05
+# lock 전용 풀이 다 찼을 때 기다리는 시간 (넘으면 lock 없이 진행)
+_LOCK_POOL_TIMEOUT_SECONDS = 0.1
+
+_stats = {
+    "leaders": 0,            # 실제 upstream 호출을 수행한 요청 수
+    "coalesced_waiters": 0,  # 같은 워커 안에서 leader 결과를 기다린 요청 수
+    "advisory_lock_waits": 0,  # 다른 워커가 같은 요청을 처리 중이라 대기한 횟수
+    "advisory_lock_timeouts": 0,
+    "advisory_lock_pool_full": 0,  # lock 전용 풀이 다 차서 lock 없이 진행한 횟수
+}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def is_singleflight_enabled(feature: str) -> bool:
+    return feature in LLM_SINGLEFLIGHT_FEATURES
+
+
+def get_singleflight_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+registry.register_collector(
+    "llm_singleflight",
+    "Coalesced identical LLM requests in this worker",
+    lambda: stats_to_samples(get_singleflight_stats()),
+)
+
+
+# -----------------------------
+# 워커 내부 single-flight
+# -----------------------------
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    동기(threadpool) 호출용. 같은 key로 동시에 들어온 호출은 첫 호출(leader)의 결과/에러를 공유
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            _count("coalesced_waiters")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        _count("leaders")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+
+class AsyncSingleFlight:
+    """
+    async 호출용. leader 코루틴을 Task로 띄워서 한 호출자가 취소돼도 나머지는 결과를 받음
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is not None and not task.done():
+            _count("coalesced_waiters")
+            return await asyncio.shield(task)
+
+        _count("leaders")
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda t: self._on_done(key, t))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리던 호출자가 모두 취소된 경우 "exception never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+
+singleflight = SingleFlight()
+async_singleflight = AsyncSingleFlight()
+
+
+# -----------------------------
+# 워커 간 single-flight (Postgres advisory lock)
+# - lock 커넥션은 LLM 호출이 끝날 때까지 잡고 있으므로 앱 DB 풀이 아닌 작은 전용 풀에서
+# -----------------------------
+_lock_engine: Optional[Engine] = None
+_lock_engine_lock = threading.Lock()
+
+
+def _get_lock_engine() -> Engine:
+    global _lock_engine
+    with _lock_engine_lock:
+        if _lock_engine is None:
+            from app.db.session import engine
+            _lock_engine = create_engine(
+                engine.url,
+                pool_pre_ping=True,
+                pool_size=LLM_SINGLEFLIGHT_LOCK_POOL_SIZE,
+                max_overflow=0,
+                pool_timeout=_LOCK_POOL_TIMEOUT_SECONDS,
+            )
+        return _lock_engine
+
+
+def _lock_connect() -> Optional[Connection]:
+    """
+    lock 전용 커넥션 (풀이 다 찼거나 연결 실패면 None -> lock 없이 진행)
+    """
+    try:
+        return _get_lock_engine().connect()
+    except PoolTimeoutError:
+        _count("advisory_lock_pool_full")
+    except Exception:
+        logger.warning("llm_advisory_lock_connect_failed", exc_info=True)
+    return None
+
+
+def _lock_id(key: str) -> int:
+    # sha256 hex key 앞 8바이트 -> signed bigint
+    return int.from_bytes(bytes.fromhex(key[:16]), "big", signed=True)
+
+
+def _advisory_lock_available() -> bool:
+    if not LLM_SINGLEFLIGHT_ADVISORY_LOCK:
+        return False
+    from app.db.session import engine
+    return engine.dialect.name == "postgresql"
+
+
+def _try_lock(conn, lock_id: int) -> bool:
+    return bool(conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": lock_id}).scalar())
+
+
+def _unlock(conn, lock_id: int) -> None:
+    try:
+        conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": lock_id})
+    finally:
+        conn.close()
+
+
+@contextmanager
+def advisory_lock(key: str) -> Iterator[bool]:
+    """
+    같은 key의 요청을 다른 워커가 처리 중이면 끝날 때까지 대기.
+    yield 값: True면 대기 후 lock을 얻은 것(=다른 워커가 방금 처리했을 수 있으니 캐시 재조회 필요)
+    lock을 쓸 수 없거나 타임아웃이면 lock 없이 진행
+    """
+    if not _advisory_lock_available():
+        yield False
+        return
+
+    lock_id = _lock_id(key)
+    conn = _lock_connect()
+    if conn is None:
+        yield False
+        return
+
+    waited = False
+    deadline = time.monotonic() + LLM_SINGLEFLIGHT_LOCK_TIMEOUT_SECONDS
+    try:
+        while not _try_lock(conn, lock_id):
+            if not waited:
+                waited = True
+                _count("advisory_lock_waits")
+            if time.monotonic() >= deadline:
+                _count("advisory_lock_timeouts")
+                conn.close()
+                conn = None
+                break
+            time.sleep(_LOCK_POLL_SECONDS)
+    except Exception:
+        logger.warning("llm_advisory_lock_failed", exc_info=True)
+        conn.close()
+        conn = None
+
+    try:
+        yield waited
+    finally:
+        if conn is not None:
+            _unlock(conn, lock_id)
+
+
+@asynccontextmanager
+async def advisory_lock_async(key: str) -> AsyncIterator[bool]:
+    """
+    advisory_lock의 async 버전 (DB 호출은 threadpool, 대기는 asyncio.sleep)
+    """
+    if not _advisory_lock_available():
+        yield False
+        return
+
+    lock_id = _lock_id(key)
+    conn = await asyncio.to_thread(_lock_connect)
+    if conn is None:
+        yield False
+        return
+
+    waited = False
+    deadline = time.monotonic() + LLM_SINGLEFLIGHT_LOCK_TIMEOUT_SECONDS
+    try:
+        while not await asyncio.to_thread(_try_lock, conn, lock_id):
+            if not waited:
+                waited = True
+                _count("advisory_lock_waits")
+            if time.monotonic() >= deadline:
+                _count("advisory_lock_timeouts")
+                await asyncio.to_thread(conn.close)
+                conn = None
+                break
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+    except Exception:
+        logger.warning("llm_advisory_lock_failed", exc_info=True)
+        await asyncio.to_thread(conn.close)
+        conn = None
+
+    try:
+        yield waited
+    finally:
+        if conn is not None:
+            await asyncio.to_thread(_unlock, conn, lock_id)
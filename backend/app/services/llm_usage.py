@@ -0,0 +1,190 @@
+"""
+LLM 호출별 사용량 기록
+- 기능(FeatureType + title) / 모델 / 결과(ok 또는 error_code) 별 counter, latency histogram
+- 호출 1건마다 request_id와 함께 llm_usage 로그 1줄
+- LLM_USAGE_ROLLUP=true 이면 일간 합계를 메모리에 모았다가 llm_usage_daily 테이블에 주기적으로 누적
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from datetime import date, datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import LLM_USAGE_ROLLUP, LLM_USAGE_ROLLUP_INTERVAL_SECONDS
+from app.core.logging import get_request_id
+from app.core.metrics import registry
+from app.models.llm_usage_daily import LLMUsageDaily
+
+logger = logging.getLogger("app")
+
+OUTCOME_OK = "ok"
+
+_requests = registry.counter(
+    "llm_requests_total",
+    "LLM calls by feature, model and outcome",
+    ("feature", "model", "outcome"),
+)
+_prompt_tokens = registry.counter(
+    "llm_prompt_tokens_total",
+    "Prompt (input) tokens reported by OpenAI",
+    ("feature", "model"),
+)
+_completion_tokens = registry.counter(
+    "llm_completion_tokens_total",
+    "Completion (output) tokens reported by OpenAI",
+    ("feature", "model"),
+)
+_cached_tokens = registry.counter(
+    "llm_cached_prompt_tokens_total",
+    "Prompt tokens served from OpenAI prompt cache",
+    ("feature", "model"),
+)
+_latency = registry.histogram(
+    "llm_request_duration_seconds",
+    "LLM call latency including rate-limit queueing and retries",
+    ("feature", "model", "outcome"),
+)
+_ttft = registry.histogram(
+    "llm_time_to_first_token_seconds",
+    "Time to first streamed token",
+    ("feature", "model"),
+)
+
+
+def _usage_counts(usage: Any) -> tuple[int, int, int]:
+    """
+    (prompt, completion, cached) 토큰 수.
+    chat completions(prompt/completion_tokens)와 transcription(input/output_tokens) 형식 모두 처리
+    """
+    if usage is None:
+        return 0, 0, 0
+    prompt = getattr(usage, "prompt_tokens", None) or getattr(usage, "input_tokens", None) or 0
+    completion = getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", None) or 0
+    details = getattr(usage, "prompt_tokens_details", None) or getattr(usage, "input_token_details", None)
+    cached = getattr(details, "cached_tokens", None) or 0
+    return int(prompt), int(completion), int(cached)
+
+
+# -----------------------------
+# 일간 rollup 버퍼
+# -----------------------------
+_ROLLUP_FIELDS = ("requests", "errors", "prompt_tokens", "completion_tokens", "cached_tokens", "latency_ms_total")
+
+_pending: dict[tuple[date, str, str], dict[str, int]] = {}
+_pending_lock = threading.Lock()
+
+
+def _buffer_rollup(feature: str, model: str, outcome: str, latency_ms: int, tokens: tuple[int, int, int]) -> None:
+    key = (datetime.now(timezone.utc).date(), feature, model)
+    with _pending_lock:
+        row = _pending.setdefault(key, dict.fromkeys(_ROLLUP_FIELDS, 0))
+        row["requests"] += 1
+        row["errors"] += 0 if outcome == OUTCOME_OK else 1
+        row["prompt_tokens"] += tokens[0]
+        row["completion_tokens"] += tokens[1]
+        row["cached_tokens"] += tokens[2]
+        row["latency_ms_total"] += latency_ms
+
+
+def record_llm_usage(
+    *,
+    feature: str,
+    model: Optional[str],
+    latency: float,
+    outcome: str = OUTCOME_OK,
+    usage: Any = None,
+    request_id: Optional[str] = None,
+) -> None:
+    """
+    LLM 호출 1건 기록 (latency: 초, outcome: "ok" 또는 OpenAIServiceError.error_code)
+    """
+    model = model or "unknown"
+    outcome = outcome.lower()
+    prompt, completion, cached = _usage_counts(usage)
+
+    _requests.inc(feature=feature, model=model, outcome=outcome)
+    _latency.observe(latency, feature=feature, model=model, outcome=outcome)
+    if prompt:
+        _prompt_tokens.inc(prompt, feature=feature, model=model)
+    if completion:
+        _completion_tokens.inc(completion, feature=feature, model=model)
+    if cached:
+        _cached_tokens.inc(cached, feature=feature, model=model)
+
+    latency_ms = int(latency * 1000)
+    logger.info(
+        f"llm_usage feature={feature} model={model} outcome={outcome} latency_ms={latency_ms} "
+        f"prompt_tokens={prompt} completion_tokens={completion} cached_tokens={cached}",
+        extra={"request_id": request_id or get_request_id() or "-"},
+    )
+
+    if LLM_USAGE_ROLLUP:
+        _buffer_rollup(feature, model, outcome, latency_ms, (prompt, completion, cached))
+
+
+def record_time_to_first_token(*, feature: str, model: Optional[str], seconds: float) -> None:
+    _ttft.observe(seconds, feature=feature, model=model or "unknown")
+
+
+def flush_usage_rollup() -> int:
+    """
+    버퍼에 모인 일간 합계를 llm_usage_daily에 더한다 (여러 워커가 같은 행을 증가시킬 수 있도록 UPDATE += 후 없으면 INSERT).
+    반영한 행 수를 반환. 실패하면 버퍼에 되돌려 다음 flush에서 재시도
+    """
+    with _pending_lock:
+        pending = dict(_pending)
+        _pending.clear()
+    if not pending:
+        return 0
+
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        for (usage_date, feature, model), values in pending.items():
+            _add_usage_row(db, usage_date, feature, model, values)
+        db.commit()
+        return len(pending)
+    except Exception:
+        db.rollback()
+        logger.warning("llm_usage_rollup_failed", exc_info=True)
+        with _pending_lock:
+            for key, values in pending.items():
+                row = _pending.setdefault(key, dict.fromkeys(_ROLLUP_FIELDS, 0))
+                for name, value in values.items():
+                    row[name] += value
+        return 0
+    finally:
+        db.close()
+
+
+def _add_usage_row(db, usage_date: date, feature: str, model: str, values: dict[str, int]) -> None:
+    where = (
+        (LLMUsageDaily.usage_date == usage_date)
+        & (LLMUsageDaily.feature == feature)
+        & (LLMUsageDaily.model == model)
+    )
+    increment = {name: getattr(LLMUsageDaily, name) + value for name, value in values.items()}
+
+    if db.execute(update(LLMUsageDaily).where(where).values(**increment)).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.add(LLMUsageDaily(usage_date=usage_date, feature=feature, model=model, **values))
+    except IntegrityError:
+        # 다른 워커가 방금 같은 행을 만든 경우
+        db.execute(update(LLMUsageDaily).where(where).values(**increment))
+
+
+async def run_usage_rollup() -> None:
+    """
+    startup 훅에서 띄우는 주기 flush 루프 (shutdown 시 cancel 후 마지막으로 한 번 더 flush)
+    """
+    while True:
+        await asyncio.sleep(LLM_USAGE_ROLLUP_INTERVAL_SECONDS)
+        await asyncio.to_thread(flush_usage_rollup)
@@ -1,6 +1,31 @@
-import os, openai, logging
-from typing import Optional
-from openai import OpenAI
+import os, re, openai, logging, threading, time, asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+from app.core.config import OPENAI_FEATURE_SETTINGS, OPENAI_BASE_URL, LLM_ROUTES, LLM_LANG_TOKEN_WEIGHTS
+from app.core.logging import get_request_id
+from app.core.deadline import remaining_seconds, deadline_exceeded
+from app.core.metrics import registry, stats_to_samples
+from app.services.llm_cache import llm_cache, make_cache_key
+from app.services.llm_rate_limit import (
+    rate_limiter,
+    backoff_delay,
+    estimate_request_tokens,
+    RateLimitQueueTimeout,
+)
+from app.services.llm_singleflight import (
+    singleflight,
+    async_singleflight,
+    advisory_lock,
+    advisory_lock_async,
+    is_singleflight_enabled,
+)
+from app.services.llm_usage import record_llm_usage, record_time_to_first_token, OUTCOME_OK
+from app.services.llm_hedge import is_hedge_enabled, hedged_call, hedged_call_async, observe_latency
+from app.services.lang_detect import guess_lang
 
 logger = logging.getLogger("app")
 
@@ -19,77 +44,807 @@ class OpenAIUpstreamError(OpenAIServiceError):
         super().__init__("UPSTREAM_ERROR", message)
         
         
-def call_openai_safety(client, request_id: str, **kwargs):
+def _openai_error(e: Exception, request_id: Optional[str]) -> OpenAIServiceError:
+    msg = str(e).lower()
+    
+    # 429 - Rate limit
+    if "rate limit" in msg or "429" in msg:
+        logger.warning("openai_rate_limited", extra={"request_id": request_id})
+        return OpenAIServiceError("RATE_LIMITED", "OpenAI rate limit exceeded")
+
+    # timeout / network 계열 (요청 deadline 때문에 줄어든 timeout이면 DEADLINE_EXCEEDED)
+    if "timeout" in msg or "timed out" in msg:
+        logger.warning("openai_timeout", extra={"request_id": request_id})
+        if deadline_exceeded():
+            return _deadline_error(request_id)
+        return OpenAIServiceError("OPENAI_ERROR", "OpenAI request timeout")
+
+    # 인증 / 키 문제
+    if "401" in msg or "403" in msg or "api key" in msg:
+        logger.error("openai_auth_failed", extra={"request_id": request_id})
+        return OpenAIServiceError("OPENAI_ERROR", "OpenAI authentication failed")
+
+    # 그 외 OpenAI 에러
+    logger.error("openai_upstream_error", extra={"request_id": request_id})
+    return OpenAIServiceError("UPSTREAM_ERROR", "Upstream service error")
+
+
+def _retry_after_seconds(e: Exception) -> Optional[float]:
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value:
+            try:
+                return max(0.0, float(value) * scale)
+            except ValueError:
+                continue  # HTTP-date 형식은 무시하고 backoff 사용
+    return None
+
+
+def _is_throttled(e: Exception) -> bool:
+    return isinstance(e, openai.RateLimitError) or getattr(e, "status_code", None) == 429
+
+
+def _is_retryable(e: Exception) -> bool:
+    # 크레딧 소진(insufficient_quota)은 기다려도 풀리지 않음
+    if getattr(e, "code", None) == "insufficient_quota":
+        return False
+    if _is_throttled(e):
+        return True
+    if isinstance(e, (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)):
+        return True
+    status = getattr(e, "status_code", None)
+    return status in (408, 409) or (status is not None and status >= 500)
+
+
+def _usage_total(response) -> Optional[int]:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", None)
+
+
+def _queue_timeout(request_id: Optional[str]) -> OpenAIServiceError:
+    if deadline_exceeded():
+        return _deadline_error(request_id)
+    logger.warning("openai_queue_timeout", extra={"request_id": request_id})
+    return OpenAIServiceError("RATE_LIMITED", "OpenAI request queue is full")
+
+
+def _deadline_error(request_id: Optional[str]) -> OpenAIServiceError:
+    logger.warning("openai_deadline_exceeded", extra={"request_id": request_id})
+    return OpenAIServiceError("DEADLINE_EXCEEDED", "Request deadline exceeded")
+
+
+def request_timeout(feature: str) -> httpx.Timeout:
+    """
+    이번 시도에 쓸 timeout: 기능별 설정과 요청의 남은 deadline 중 짧은 쪽
+    """
+    settings = get_client_settings(feature)
+    remaining = remaining_seconds()
+    if remaining is None:
+        return settings.timeout
+    remaining = max(remaining, 0.001)
+    return httpx.Timeout(min(settings.read_timeout, remaining), connect=min(settings.connect_timeout, remaining))
+
+
+def _retry_fits_deadline(delay: float) -> bool:
+    remaining = remaining_seconds()
+    return remaining is None or remaining > delay
+
+
+def _retry_delay(
+    e: Exception,
+    *,
+    attempt: int,
+    max_retries: int,
+    reserved_tokens: int,
+    request_id: Optional[str],
+) -> Optional[float]:
+    """
+    실패한 시도의 슬롯을 반납하고, 다시 시도하면 기다릴 시간 (None이면 재시도 없이 원래 예외를 올림)
+    run_with_retry / run_with_retry_async 공용
+    """
+    retry_after = _retry_after_seconds(e)
+    rate_limiter.release(
+        reserved_tokens=reserved_tokens,
+        throttled=_is_throttled(e),
+        retry_after=retry_after,
+    )
+    if attempt >= max_retries or not _is_retryable(e):
+        return None
+    delay = backoff_delay(attempt, retry_after)
+    if not _retry_fits_deadline(delay):
+        return None
+    rate_limiter.record_retry()
+    logger.warning("openai_retry", extra={"request_id": request_id, "attempt": attempt + 1, "delay": delay})
+    return delay
+
+
+def run_with_retry(fn, *, feature: str, reserved_tokens: int, request_id: Optional[str] = None):
+    """
+    rate limiter 슬롯을 얻은 뒤 fn() 실행. 재시도 가능한 에러(429/5xx/timeout)는
+    Retry-After 또는 jitter backoff 후 기능별 max_retries 만큼 다시 시도.
+    재시도 후에도 실패하면 원래 예외를 그대로 올림 (대기열 초과는 RATE_LIMITED)
+    """
+    max_retries = get_client_settings(feature).max_retries
+    attempt = 0
+    while True:
+        if deadline_exceeded():
+            raise _deadline_error(request_id)
+        try:
+            rate_limiter.acquire(reserved_tokens, max_wait=remaining_seconds())
+        except RateLimitQueueTimeout:
+            raise _queue_timeout(request_id)
+
+        try:
+            response = fn()
+        except Exception as e:
+            delay = _retry_delay(
+                e, attempt=attempt, max_retries=max_retries, reserved_tokens=reserved_tokens, request_id=request_id
+            )
+            if delay is None:
+                raise
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        rate_limiter.release(reserved_tokens=reserved_tokens, used_tokens=_usage_total(response))
+        return response
+
+
+async def run_with_retry_async(
+    fn,
+    *,
+    feature: str,
+    reserved_tokens: int,
+    request_id: Optional[str] = None,
+    hold_slot: bool = False,
+):
+    """
+    run_with_retry의 async 버전 (fn은 코루틴을 반환하는 함수)
+    - hold_slot=True: 성공하면 슬롯 / TPM 예약을 반납하지 않고 그대로 반환 (스트림 -> 호출한 쪽이 끝날 때 release)
+    """
+    max_retries = get_client_settings(feature).max_retries
+    attempt = 0
+    while True:
+        if deadline_exceeded():
+            raise _deadline_error(request_id)
+        try:
+            await rate_limiter.aacquire(reserved_tokens, max_wait=remaining_seconds())
+        except RateLimitQueueTimeout:
+            raise _queue_timeout(request_id)
+
+        try:
+            response = await fn()
+        except asyncio.CancelledError:
+            # hedge에서 진 요청 / 클라이언트 연결 끊김: 슬롯만 반납
+            rate_limiter.release(reserved_tokens=reserved_tokens)
+            raise
+        except Exception as e:
+            delay = _retry_delay(
+                e, attempt=attempt, max_retries=max_retries, reserved_tokens=reserved_tokens, request_id=request_id
+            )
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+
+        if not hold_slot:
+            rate_limiter.release(reserved_tokens=reserved_tokens, used_tokens=_usage_total(response))
+        return response
+
+
+def call_openai_safety(client, request_id: str, feature: str = "chat", **kwargs):
+    """
+    chat.completions.create 호출 (rate limit + 재시도 + 에러 매핑).
+    호출마다 토큰/지연/결과를 기록 (stream=True 는 스트림이 끝날 때 stream_llm_async에서 기록)
+    """
+    request_id = request_id or get_request_id()
+    start = time.perf_counter()
     try:
-        return client.chat.completions.create(**kwargs)
-      
+        response = run_with_retry(
+            lambda: client.chat.completions.create(**kwargs, timeout=request_timeout(feature)),
+            feature=feature,
+            reserved_tokens=_reserved_tokens(kwargs),
+            request_id=request_id,
+        )
     except Exception as e:
-        msg = str(e).lower()
-        
-        # 429 - Rate limit
-        if "rate limit" in msg or "429" in msg:
-            logger.warning("openai_rate_limited", extra={"request_id": request_id})
-            raise OpenAIServiceError("RATE_LIMITED", "OpenAI rate limit exceeded")
-
-        # timeout / network 계열
-        if "timeout" in msg or "timed out" in msg:
-            logger.warning("openai_timeout", extra={"request_id": request_id})
-            raise OpenAIServiceError("OPENAI_ERROR", "OpenAI request timeout")
-
-        # 인증 / 키 문제
-        if "401" in msg or "403" in msg or "api key" in msg:
-            logger.error("openai_auth_failed", extra={"request_id": request_id})
-            raise OpenAIServiceError("OPENAI_ERROR", "OpenAI authentication failed")
-
-        # 그 외 OpenAI 에러
-        logger.error("openai_upstream_error", extra={"request_id": request_id})
-        raise OpenAIServiceError("UPSTREAM_ERROR", "Upstream service error")
-  
-def get_openai_client() -> OpenAI:
-    """
-    OpenAI 클라이언트 인스턴스를 반환하는 함수
+        error = _failed_call(e, feature, kwargs, start, request_id)
+        if error is e:
+            raise
+        raise error
 
-    Returns:
-        OpenAI: OpenAI 클라이언트 인스턴스
+    _finished_call(response, feature, kwargs, start, request_id)
+    return response
+
+
+async def call_openai_safety_async(client, request_id: str, feature: str = "chat", **kwargs):
     """
+    call_openai_safety의 async 버전
+    - stream=True 는 rate limiter 슬롯을 잡은 채 스트림을 반환 -> stream_llm_async가 스트림이 끝날 때 반납
+    """
+    request_id = request_id or get_request_id()
+    start = time.perf_counter()
+    try:
+        response = await run_with_retry_async(
+            lambda: client.chat.completions.create(**kwargs, timeout=request_timeout(feature)),
+            feature=feature,
+            reserved_tokens=_reserved_tokens(kwargs),
+            request_id=request_id,
+            hold_slot=bool(kwargs.get("stream")),
+        )
+    except Exception as e:
+        error = _failed_call(e, feature, kwargs, start, request_id)
+        if error is e:
+            raise
+        raise error
+
+    _finished_call(response, feature, kwargs, start, request_id)
+    return response
+
+
+def _reserved_tokens(kwargs: dict) -> int:
+    return estimate_request_tokens(kwargs.get("messages") or [], kwargs.get("max_tokens") or 0)
+
+
+def _failed_call(e: Exception, feature: str, kwargs: dict, start: float, request_id: Optional[str]) -> OpenAIServiceError:
+    # OpenAIServiceError로 바꾸고 실패 결과 기록 (e가 이미 OpenAIServiceError면 그대로 반환)
+    error = e if isinstance(e, OpenAIServiceError) else _openai_error(e, request_id)
+    _record_call(feature, kwargs, start, request_id, outcome=error.error_code)
+    return error
+
+
+def _finished_call(response, feature: str, kwargs: dict, start: float, request_id: Optional[str]) -> None:
+    # stream=True 는 스트림이 끝날 때 stream_llm_async에서 기록
+    if not kwargs.get("stream"):
+        _record_call(feature, kwargs, start, request_id, usage=getattr(response, "usage", None))
+
+
+def _record_call(feature: str, kwargs: dict, start: float, request_id: Optional[str], *, outcome: str = OUTCOME_OK, usage=None) -> None:
+    latency = time.perf_counter() - start
+    if outcome == OUTCOME_OK:
+        observe_latency(feature, latency)
+    record_llm_usage(
+        feature=feature,
+        model=kwargs.get("model"),
+        latency=latency,
+        outcome=outcome,
+        usage=usage,
+        request_id=request_id,
+    )
+
+# ----------------------------
+# 클라이언트 풀 (워커 프로세스당 1회 생성 후 재사용)
+# ----------------------------
+@dataclass(frozen=True)
+class OpenAIClientSettings:
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    connect_timeout: float
+    read_timeout: float
+    max_retries: int
+
+    @property
+    def pool_key(self) -> tuple:
+        # 커넥션 풀 설정이 같은 기능끼리는 httpx 풀(=TLS 커넥션)을 공유
+        return (self.max_connections, self.max_keepalive_connections, self.keepalive_expiry)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+
+_client_lock = threading.Lock()
+_client_pid: Optional[int] = None
+_http_clients: dict[tuple, httpx.Client] = {}
+_clients: dict[str, OpenAI] = {}
+_async_http_clients: dict[tuple, httpx.AsyncClient] = {}
+_async_clients: dict[str, AsyncOpenAI] = {}
+_pool_stats = {"hits": 0, "misses": 0}
+
+
+def get_client_settings(feature: str) -> OpenAIClientSettings:
+    settings = OPENAI_FEATURE_SETTINGS.get(feature) or OPENAI_FEATURE_SETTINGS["chat"]
+    return OpenAIClientSettings(**settings)
+
+
+def _get_api_key() -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise OpenAIServiceError(
           "INTERNAL_ERROR",
           "OPENAI_API_KEY is not set.",
         )
-    
-    return OpenAI(api_key=api_key)
+    return api_key
+
+
+def _reset_if_forked() -> None:
+    """
+    gunicorn fork 이후 부모 프로세스의 커넥션을 물려받지 않도록,
+    pid가 바뀌었으면 캐시된 클라이언트를 버리고 새로 만든다. (_client_lock 안에서 호출)
+    """
+    global _client_pid
+    pid = os.getpid()
+    if _client_pid != pid:
+        _http_clients.clear()
+        _clients.clear()
+        _async_http_clients.clear()
+        _async_clients.clear()
+        _client_pid = pid
+
+
+def get_openai_client(feature: str = "chat") -> OpenAI:
+    """
+    기능별 OpenAI 클라이언트를 반환하는 함수
+    - 워커 프로세스당 lazy하게 1번만 생성하고 이후 재사용 (keep-alive)
+    - 타임아웃/재시도 횟수는 기능별 설정(OPENAI_FEATURE_SETTINGS)을 따름
+
+    Args:
+        feature (str): chat / translate / summarize / term / title / speech
+
+    Returns:
+        OpenAI: OpenAI 클라이언트 인스턴스
+    """
+    with _client_lock:
+        _reset_if_forked()
+
+        client = _clients.get(feature)
+        if client is not None:
+            _pool_stats["hits"] += 1
+            return client
+
+        settings = get_client_settings(feature)
+        http_client = _http_clients.get(settings.pool_key)
+        if http_client is None:
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+                timeout=settings.timeout,
+            )
+            _http_clients[settings.pool_key] = http_client
+
+        client = OpenAI(
+            api_key=_get_api_key(),
+            base_url=OPENAI_BASE_URL,
+            http_client=http_client,
+            timeout=settings.timeout,
+            max_retries=0,  # 재시도는 run_with_retry에서 (rate limiter와 함께)
+        )
+        _clients[feature] = client
+        _pool_stats["misses"] += 1
+        return client
+
+
+def get_async_openai_client(feature: str = "chat") -> AsyncOpenAI:
+    """
+    get_openai_client의 AsyncOpenAI 버전 (async 라우트용)
+    - 워커의 이벤트 루프 하나에서 커넥션 풀을 공유하며, 설정은 동기 클라이언트와 동일
+    """
+    with _client_lock:
+        _reset_if_forked()
+
+        client = _async_clients.get(feature)
+        if client is not None:
+            _pool_stats["hits"] += 1
+            return client
+
+        settings = get_client_settings(feature)
+        http_client = _async_http_clients.get(settings.pool_key)
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+                timeout=settings.timeout,
+            )
+            _async_http_clients[settings.pool_key] = http_client
+
+        client = AsyncOpenAI(
+            api_key=_get_api_key(),
+            base_url=OPENAI_BASE_URL,
+            http_client=http_client,
+            timeout=settings.timeout,
+            max_retries=0,  # 재시도는 run_with_retry에서 (rate limiter와 함께)
+        )
+        _async_clients[feature] = client
+        _pool_stats["misses"] += 1
+        return client
+
+
+def get_client_pool_stats() -> dict:
+    with _client_lock:
+        return {
+            "hits": _pool_stats["hits"],
+            "misses": _pool_stats["misses"],
+            "clients": len(_clients) + len(_async_clients),
+            "http_pools": len(_http_clients) + len(_async_http_clients),
+        }
+
+
+registry.register_collector(
+    "openai_client_pool",
+    "OpenAI client reuse in this worker",
+    lambda: stats_to_samples(get_client_pool_stats()),
+)
+
+
+def close_openai_clients() -> None:
+    with _client_lock:
+        for http_client in _http_clients.values():
+            http_client.close()
+        _http_clients.clear()
+        _clients.clear()
+        # AsyncClient는 shutdown 훅(async)에서 aclose_openai_clients로 닫음
+
+
+async def aclose_openai_clients() -> None:
+    with _client_lock:
+        http_clients = list(_async_http_clients.values())
+        _async_http_clients.clear()
+        _async_clients.clear()
+    for http_client in http_clients:
+        await http_client.aclose()
   
   
+# ----------------------------
+# model / max_tokens 라우팅 (정책 테이블: config.LLM_ROUTES)
+# ----------------------------
+@dataclass(frozen=True)
+class LLMRoute:
+    model: str
+    temperature: float
+    max_tokens: int
+
+
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㆎ]")
+_CYRILLIC_RE = re.compile(r"[Ѐ-ӿ]")
+
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    tokenizer 없이 쓰는 입력 토큰 추정치
+    - 한글: 글자당 ~0.7 토큰, 키릴: ~0.5, 그 외(라틴/숫자/기호): ~3.5자당 1 토큰
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL_RE.findall(text))
+    cyrillic = len(_CYRILLIC_RE.findall(text))
+    other = len(text) - hangul - cyrillic - text.count(" ")
+    return int(hangul * 0.7 + cyrillic * 0.5 + max(other, 0) / 3.5) + 1
+
+
+def _lang_expansion(text: str, source_lang: Optional[str], target_lang: Optional[str]) -> float:
+    if not target_lang:
+        return 1.0
+    source = source_lang or guess_lang(text)
+    source_weight = LLM_LANG_TOKEN_WEIGHTS.get(source, 1.0)
+    target_weight = LLM_LANG_TOKEN_WEIGHTS.get(target_lang, 1.0)
+    return target_weight / source_weight if source_weight > 0 else 1.0
+
+
+def route_llm(
+  feature: str,
+  *,
+  text: str = "",
+  source_lang: Optional[str] = None,
+  target_lang: Optional[str] = None,
+) -> LLMRoute:
+    """
+    기능 + 입력 크기 + (번역이면) 언어 확장 비율로 model / temperature / max_tokens 결정
+
+    Args:
+        feature (str): chat / translate / summarize / term / title / speech
+        text (str): 출력 길이를 좌우하는 입력 (번역이면 원문)
+        source_lang (Optional[str]): 원문 언어 (None이면 문자 종류로 추정)
+        target_lang (Optional[str]): 출력 언어 (번역일 때만)
+    """
+    policy = LLM_ROUTES.get(feature) or LLM_ROUTES["chat"]
+    input_tokens = estimate_text_tokens(text)
+
+    model = policy["model"]
+    if policy["large_model"] and policy["large_input_tokens"] and input_tokens >= policy["large_input_tokens"]:
+        model = policy["large_model"]
+
+    expected = input_tokens * policy["output_ratio"] * _lang_expansion(text, source_lang, target_lang)
+    max_tokens = int(policy["overhead_tokens"] + expected)
+    max_tokens = max(policy["min_tokens"], min(policy["max_tokens"], max_tokens))
+
+    return LLMRoute(model=model, temperature=policy["temperature"], max_tokens=max_tokens)
+
+
+def _build_messages(system_prompt: str, user_prompt: str) -> list[dict]:
+  return [
+    {"role": "system", "content": system_prompt},
+    {"role": "user", "content": user_prompt},
+  ]
+
+
+def _extract_content(response) -> str:
+  content = response.choices[0].message.content
+  if not content or not content.strip():
+      raise OpenAIServiceError(
+        "UPSTREAM_ERROR",
+        "Empty content returned from OpenAI.",
+      )
+
+  return content.strip()
+
+
+def _resolve_route(
+  feature: str,
+  user_prompt: str,
+  model: Optional[str],
+  temperature: Optional[float],
+  max_tokens: Optional[int],
+) -> tuple[str, float, int]:
+  if model is not None and temperature is not None and max_tokens is not None:
+    return model, temperature, max_tokens
+  route = route_llm(feature, text=user_prompt)
+  return (
+    route.model if model is None else model,
+    route.temperature if temperature is None else temperature,
+    route.max_tokens if max_tokens is None else max_tokens,
+  )
+
+
+@dataclass(frozen=True)
+class _LLMRequest:
+  """
+  call_llm / call_llm_async / stream_llm_async 공용: route를 채운 요청 값 + 캐시 키 + 캐시 사용 여부
+  """
+  model: str
+  temperature: float
+  max_tokens: int
+  messages: list
+  key: str
+  use_cache: bool
+
+  def create_kwargs(self) -> dict:
+    return {
+      "model": self.model,
+      "messages": self.messages,
+      "temperature": self.temperature,
+      "max_tokens": self.max_tokens,
+    }
+
+
+def _prepare_llm_request(
+  *,
+  feature: str,
+  system_prompt: str,
+  user_prompt: str,
+  model: Optional[str],
+  temperature: Optional[float],
+  max_tokens: Optional[int],
+  use_cache: bool,
+) -> _LLMRequest:
+  model, temperature, max_tokens = _resolve_route(feature, user_prompt, model, temperature, max_tokens)
+  return _LLMRequest(
+    model=model,
+    temperature=temperature,
+    max_tokens=max_tokens,
+    messages=_build_messages(system_prompt, user_prompt),
+    key=make_cache_key(
+      model=model,
+      system_prompt=system_prompt,
+      user_prompt=user_prompt,
+      temperature=temperature,
+      max_tokens=max_tokens,
+    ),
+    use_cache=use_cache and llm_cache.is_enabled(feature),
+  )
+
+
 def call_llm(
   *,
   system_prompt: str,
   user_prompt: str,
-  model: str = "gpt-4o-mini",
-  temperature: float = 0.3,
-  max_tokens: int = 512,
+  model: Optional[str] = None,
+  temperature: Optional[float] = None,
+  max_tokens: Optional[int] = None,
   request_id: Optional[str] = None,
+  feature: str = "chat",
+  use_cache: bool = True,
 ) -> str:
-  client = get_openai_client()
-    
-  response = call_openai_safety(
-    client,
-    request_id=request_id,
+  """
+  LLM 호출
+  1) 기능별로 opt-in 된 경우 응답 캐시를 먼저 조회 (use_cache=False 면 해당 호출만 건너뜀)
+  2) 같은 프롬프트가 동시에 들어오면 upstream 호출 1번의 결과를 공유 (single-flight)
+  3) hedge 대상 기능이면 느린 요청에 같은 요청을 하나 더 보내고 먼저 온 응답 사용
+  timeout은 요청 deadline(app.core.deadline)을 넘지 않도록 시도마다 줄어든다
+  model / temperature / max_tokens를 생략하면 route_llm(feature, text=user_prompt) 값을 사용
+  """
+  req = _prepare_llm_request(
+    feature=feature,
+    system_prompt=system_prompt,
+    user_prompt=user_prompt,
     model=model,
-    messages=[
-      {"role": "system", "content": system_prompt},
-      {"role": "user", "content": user_prompt},
-    ],
     temperature=temperature,
     max_tokens=max_tokens,
+    use_cache=use_cache,
   )
+  if req.use_cache:
+    cached = llm_cache.get(feature, req.key)
+    if cached is not None:
+      return cached
 
-  content = response.choices[0].message.content
-  if not content or not content.strip():
-      raise OpenAIServiceError(
-        "UPSTREAM_ERROR",
-        "Empty content returned from OpenAI.",
-      )
+  def _fetch() -> str:
+    with advisory_lock(req.key) as waited:
+      # 다른 워커가 같은 요청을 방금 끝냈으면 공유 캐시에 들어 있음
+      if waited and req.use_cache:
+        cached = llm_cache.get(feature, req.key)
+        if cached is not None:
+          return cached
+
+      client = get_openai_client(feature)
+
+      def _create():
+        return call_openai_safety(client, request_id=request_id, feature=feature, **req.create_kwargs())
+
+      response = hedged_call(feature, _create) if is_hedge_enabled(feature) else _create()
+
+      content = _extract_content(response)
+      if req.use_cache:
+        llm_cache.set(feature, req.key, content)
+      return content
+
+  if is_singleflight_enabled(feature):
+    return singleflight.do(req.key, _fetch)
+  return _fetch()
+
+
+async def call_llm_async(
+  *,
+  system_prompt: str,
+  user_prompt: str,
+  model: Optional[str] = None,
+  temperature: Optional[float] = None,
+  max_tokens: Optional[int] = None,
+  request_id: Optional[str] = None,
+  feature: str = "chat",
+  use_cache: bool = True,
+) -> str:
+  """
+  call_llm의 async 버전. 응답을 기다리는 동안 이벤트 루프를 막지 않는다.
+  """
+  req = _prepare_llm_request(
+    feature=feature,
+    system_prompt=system_prompt,
+    user_prompt=user_prompt,
+    model=model,
+    temperature=temperature,
+    max_tokens=max_tokens,
+    use_cache=use_cache,
+  )
+  if req.use_cache:
+    cached = await llm_cache.aget(feature, req.key)
+    if cached is not None:
+      return cached
+
+  async def _fetch() -> str:
+    async with advisory_lock_async(req.key) as waited:
+      if waited and req.use_cache:
+        cached = await llm_cache.aget(feature, req.key)
+        if cached is not None:
+          return cached
+
+      client = get_async_openai_client(feature)
+
+      def _create():
+        return call_openai_safety_async(client, request_id=request_id, feature=feature, **req.create_kwargs())
+
+      if is_hedge_enabled(feature):
+        response = await hedged_call_async(feature, _create)
+      else:
+        response = await _create()
+
+      content = _extract_content(response)
+      if req.use_cache:
+        await llm_cache.aset(feature, req.key, content)
+      return content
+
+  if is_singleflight_enabled(feature):
+    return await async_singleflight.do(req.key, _fetch)
+  return await _fetch()
+
+
+async def stream_llm_async(
+  *,
+  system_prompt: str,
+  user_prompt: str,
+  model: Optional[str] = None,
+  temperature: Optional[float] = None,
+  max_tokens: Optional[int] = None,
+  request_id: Optional[str] = None,
+  feature: str = "chat",
+  use_cache: bool = True,
+) -> AsyncIterator[str]:
+  """
+  LLM 응답을 토큰(delta) 단위로 흘려보내는 async generator (SSE 라우트용)
+  - 캐시 hit이면 전체 텍스트를 한 번에 yield
+  - 스트림이 끝까지 완료되면 조립된 텍스트를 캐시에 저장
+  - 재시도는 스트림 연결 단계에서만 (첫 토큰 이후 실패는 그대로 에러)
+  """
+  req = _prepare_llm_request(
+    feature=feature,
+    system_prompt=system_prompt,
+    user_prompt=user_prompt,
+    model=model,
+    temperature=temperature,
+    max_tokens=max_tokens,
+    use_cache=use_cache,
+  )
+  if req.use_cache:
+    cached = await llm_cache.aget(feature, req.key)
+    if cached is not None:
+      yield cached
+      return
+
+  request_id = request_id or get_request_id()
+  start = time.perf_counter()
+  client = get_async_openai_client(feature)
+  kwargs = req.create_kwargs()
+  # call_openai_safety_async와 같은 예약량 -> 스트림이 끝날 때 실제 사용량과의 차이를 환불
+  reserved = _reserved_tokens(kwargs)
+  stream = await call_openai_safety_async(
+    client,
+    request_id=request_id,
+    feature=feature,
+    **kwargs,
+    stream=True,
+    stream_options={"include_usage": True},  # 마지막 chunk에 usage 포함
+  )
+
+  parts: list[str] = []
+  usage = None
+  outcome = "cancelled"  # 클라이언트가 중간에 끊으면 GeneratorExit
+  try:
+    async for chunk in stream:
+      if getattr(chunk, "usage", None) is not None:
+        usage = chunk.usage
+      if not chunk.choices:
+        continue
+      delta = chunk.choices[0].delta.content
+      if delta:
+        if not parts:
+          record_time_to_first_token(feature=feature, model=req.model, seconds=time.perf_counter() - start)
+        parts.append(delta)
+        yield delta
+    outcome = OUTCOME_OK
+  except OpenAIServiceError as e:
+    outcome = e.error_code
+    raise
+  except Exception as e:
+    error = _openai_error(e, request_id)
+    outcome = error.error_code
+    raise error
+  finally:
+    # 슬롯은 마지막 chunk까지 잡고 있다가 반납 (usage가 없으면 예약량 그대로 차감)
+    rate_limiter.release(reserved_tokens=reserved, used_tokens=getattr(usage, "total_tokens", None))
+    await stream.close()
+    record_llm_usage(
+      feature=feature,
+      model=req.model,
+      latency=time.perf_counter() - start,
+      outcome=outcome,
+      usage=usage,
+      request_id=request_id,
+    )
 
-  return content.strip()
\ No newline at end of file
+  content = "".join(parts).strip()
+  if not content:
+    raise OpenAIServiceError(
+      "UPSTREAM_ERROR",
+      "Empty content returned from OpenAI.",
+    )
+  if req.use_cache:
+    await llm_cache.aset(feature, req.key, content)
@@ -24,13 +24,17 @@ def extract_text_from_pptx(file: UploadFile) -> str:
     
     prs = Presentation(BytesIO(data))
 
-    lines: list[str] = []
+    # 슬라이드 사이는 빈 줄로 구분 (긴 문서 요약/번역의 chunk 경계)
+    slides: list[str] = []
     for slide_idx, slide in enumerate(prs.slides, start=1):
         # 슬라이드 제목/본문 등 텍스트
+        lines: list[str] = []
         for shape in slide.shapes:
             if hasattr(shape, "text") and shape.text:
                 t = shape.text.strip()
                 if t:
                     lines.append(f"[Slide {slide_idx}] {t}")
+        if lines:
+            slides.append("\n".join(lines))
 
-    return "\n".join(lines).strip()
+    return "\n\n".join(slides).strip()
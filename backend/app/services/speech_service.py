@@ -3,11 +3,13 @@ from __future__ import annotations
 from typing import Optional
 from io import BytesIO
 import os
+import time
 
 import openai
 from fastapi import UploadFile
 
-from app.services.openai_service import get_openai_client
+from app.services.openai_service import get_openai_client, run_with_retry, request_timeout, route_llm, OpenAIServiceError
+from app.services.llm_usage import record_llm_usage, OUTCOME_OK
 from app.exceptions.error import AppError, ErrorCode
 
 
@@ -111,15 +113,29 @@ def transcribe(
     audio_file = BytesIO(audio_bytes)
     audio_file.name = file.filename  # Set filename for OpenAI API
     
+    model = route_llm("speech").model
+    start = time.perf_counter()
+    outcome = "INTERNAL_SERVER_ERROR"
+    usage = None
     try:
-        client = get_openai_client()
+        client = get_openai_client("speech")
 
         # Whisper(STT) 호출
-        response = client.audio.transcriptions.create(
-            model="gpt-4o-mini-transcribe",
-            file=audio_file,
-            language=None if auto_detect else lang,
+        def _transcribe():
+            audio_file.seek(0)  # 재시도 시 처음부터 다시 업로드
+            return client.audio.transcriptions.create(
+                model=model,
+                file=audio_file,
+                language=None if auto_detect else lang,
+                timeout=request_timeout("speech"),
+            )
+
+        response = run_with_retry(
+            _transcribe,
+            feature="speech",
+            reserved_tokens=int(_estimate_audio_duration(audio_bytes) * 10),
         )
+        usage = getattr(response, "usage", None)
         
         text = getattr(response, "text", None)
         if not text or not text.strip():
@@ -129,10 +145,23 @@ def transcribe(
                 status_code=502,
             )
 
+        outcome = OUTCOME_OK
         return text.strip()
 
     # ----------------- OpenAI 에러 -----------------
+    except OpenAIServiceError as e:
+        # rate limiter 대기열 초과 / 요청 deadline 초과
+        outcome = e.error_code
+        if e.error_code == "DEADLINE_EXCEEDED":
+            raise AppError(error_code=ErrorCode.REQUEST_TIMEOUT, message=str(e))
+        raise AppError(
+            error_code=ErrorCode.RATE_LIMITED,
+            message="Too many requests. Please try again later.",
+            detail={"reason": str(e)},
+        )
+
     except openai.RateLimitError as e:
+        outcome = "RATE_LIMITED"
         raise AppError(
             error_code=ErrorCode.RATE_LIMITED,
             message="Too many requests. Please try again later.",
@@ -141,6 +170,7 @@ def transcribe(
         )
     
     except (openai.APIConnectionError, openai.APIStatusError) as e:
+        outcome = "UPSTREAM_ERROR"
         raise AppError(
             error_code=ErrorCode.UPSTREAM_ERROR,
             message="Failed to transcribe audio via OpenAI.",
@@ -148,7 +178,8 @@ def transcribe(
             detail=str(e),
         )
 
-    except AppError:
+    except AppError as e:
+        outcome = e.error_code.value
         raise
 
     except Exception as e:
@@ -157,4 +188,13 @@ def transcribe(
             message="Internal server error.",
             status_code=500,
             detail=str(e),
-        )
\ No newline at end of file
+        )
+
+    finally:
+        record_llm_usage(
+            feature="speech",
+            model=model,
+            latency=time.perf_counter() - start,
+            outcome=outcome,
+            usage=usage,
+        )
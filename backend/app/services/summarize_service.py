@@ -1,25 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
 import openai
-from app.services.openai_service import call_llm, OpenAIServiceError
-from app.exceptions.error import AppError, ErrorCode
+from sqlalchemy.exc import SQLAlchemyError
 
-MAX_TEXT_LENGTH = 50000  # 최대 텍스트 길이 제한 (50k for larger files)
+from app.core.config import (
+    LLM_CACHE_TTL_SECONDS,
+    SUMMARIZE_CHUNK_TOKENS,
+    SUMMARIZE_CHUNK_CONCURRENCY,
+    SUMMARIZE_CHUNK_RETRIES,
+    SUMMARIZE_MAX_DEPTH,
+    SUMMARIZE_CHUNK_CACHE_MAX_ENTRIES,
+    SUMMARY_CHUNK_STORE_ENABLED,
+    SUMMARIZE_DEFAULT_MODE,
+    SUMMARIZE_BALANCED_RATIO,
+)
+from app.core.deadline import remaining_seconds
+from app.db.session import SessionLocal
+from app.services.openai_service import (
+    call_llm_async,
+    stream_llm_async,
+    estimate_text_tokens,
+    OpenAIServiceError,
+)
+from app.services.llm_cache import MemoryCacheBackend
+from app.services.extractive_summary import Extraction, extract_sentences
+from app.services.lang_detect import LANG_NAMES, confident_lang
+from app.services.summary_chunk_store import lookup_summaries, save_summaries, record_document
+from app.services.text_chunking import chunk_text_by_content
+from app.services.translation_memory import normalize_segment
+from app.exceptions.error import AppError, ErrorCode
+from app.models.enums import SummarizeMode
 
+logger = logging.getLogger("app")
 
-def summarize_text(
-  *,
-  text: str,
-) -> str:
-    """
-    주어진 텍스트를 지정된 언어로 번역하는 함수
+MAX_TEXT_LENGTH = 50000  # 최대 텍스트 길이 제한 (50k for larger files)
 
-    Args:
-        text (str): 요약할 원본 텍스트
 
-    Returns:
-        str: 요약된 텍스트
-    """
-    
-    # --------------- 입력 검증 -----------------
+def _validate_summary_text(text: str) -> None:
     # 빈 텍스트 검증
     if not text:
         raise AppError(
@@ -33,17 +57,53 @@ def summarize_text(
             error_code=ErrorCode.INPUT_TOO_LONG,
             message=f"Text length exceeds the maximum limit of {MAX_TEXT_LENGTH} characters."
         )
-    
-    
-    system_prompt = (
+
+
+def _validate_mode(mode: Optional[str | SummarizeMode]) -> SummarizeMode:
+    if mode is None or mode == "":
+        mode = SUMMARIZE_DEFAULT_MODE
+    try:
+        return SummarizeMode(mode)
+    except ValueError:
+        raise AppError(
+            error_code=ErrorCode.INVALID_REQUEST,
+            message="Invalid summarize mode. Supported: fast, balanced, full.",
+        )
+
+
+def _system_prompt(lang: Optional[str]) -> str:
+    # 입력 언어를 로컬에서 확실히 알면 출력 언어를 직접 지정 (섞인 텍스트에서 엉뚱한 언어로 요약하는 것 방지)
+    language_rule = (
+        f"Always write the summary in {LANG_NAMES[lang]}.\n"
+        if lang is not None
+        else "Always output the summary in the SAME language as the user's input text.\n"
+    )
+    return (
         "You are a friendly assistant for university students.\n"
-        "Always output the summary in the SAME language as the user's input text.\n"
+        f"{language_rule}"
         "Do not translate the content."
+    )
+
 
+def _build_summary_prompts(
+  text: str,
+  *,
+  lang: Optional[str] = None,
+  partial: bool = False,
+) -> tuple[str, str]:
+    """
+    최종 요약 프롬프트 생성. (system_prompt, user_prompt) 반환
+    - partial=True: 입력이 긴 문서 각 부분의 요약을 이어붙인 것 (map-reduce 마지막 단계)
+    """
+    source_note = (
+        "The text below consists of summaries of consecutive parts of one long document. "
+        "Summarize the whole document.\n\n"
+        if partial
+        else ""
     )
-    
     user_prompt = (
         "Please summarize the following text.\n\n"
+        f"{source_note}"
         "Rules:\n"
         "- Write a clear and concise summary suitable for a university student.\n"
         "- Keep it short (2–3 sentences).\n"
@@ -52,18 +112,318 @@ def summarize_text(
         f"{text}"
         )
 
-    # --------------- OpenAI 호출 -----------------
+    return _system_prompt(lang), user_prompt
+
+
+def _build_chunk_prompts(text: str, *, lang: Optional[str], merge: bool) -> tuple[str, str]:
+    """
+    map 단계 프롬프트. 위치 정보는 넣지 않음 (같은 내용의 chunk는 어느 문서/위치에 있든 같은 프롬프트 -> 캐시 재사용)
+    - merge=True: 입력이 앞 단계 요약들 (reduce 중간 단계)
+    """
+    if merge:
+        task = (
+            "The text below consists of summaries of consecutive parts of one long document.\n"
+            "Merge them into a single shorter summary.\n\n"
+        )
+    else:
+        task = "The text below is one part of a longer document. Summarize this part.\n\n"
+
+    user_prompt = (
+        f"{task}"
+        "Rules:\n"
+        "- Keep the key points, definitions, names, numbers, dates and deadlines.\n"
+        "- At most 5 sentences, no bullet points.\n"
+        "- Do NOT add labels like 'Summary' or 'Part'.\n"
+        "- Do NOT mention that this is a part of a document.\n\n"
+        f"{text}"
+    )
+    return _system_prompt(lang), user_prompt
+
+
+def _to_summarize_error(e: OpenAIServiceError) -> AppError:
+    # e.error_code: RATE_LIMITED / UPSTREAM_ERROR / OPENAI_ERROR / INTERNAL_ERROR
+    if e.error_code == "RATE_LIMITED":
+        return AppError(error_code=ErrorCode.RATE_LIMITED, message=str(e))
+    if e.error_code == "DEADLINE_EXCEEDED":
+        return AppError(error_code=ErrorCode.REQUEST_TIMEOUT, message=str(e))
+    return AppError(error_code=ErrorCode.SERVICE_UNAVAILABLE, message=str(e))
+
+
+async def summarize_text_async(
+  *,
+  text: str,
+  mode: Optional[str | SummarizeMode] = None,
+) -> str:
+    """
+    주어진 텍스트를 요약 (async 라우트에서 사용). 긴 텍스트는 map-reduce로 요약
+    """
+    result = await summarize_document_async(text=text, mode=mode)
+    return result["summarized_text"]
+
+
+async def summarize_text_stream(
+  *,
+  text: str,
+  mode: Optional[str | SummarizeMode] = None,
+) -> AsyncIterator[str]:
+    """
+    summarize_text_async의 스트리밍 버전 (요약 텍스트 조각을 생성되는 대로 yield)
+    - 긴 텍스트는 추출 / map / reduce 단계를 먼저 끝내고 최종 요약만 스트리밍
+    """
+    _validate_summary_text(text)
+    mode = _validate_mode(mode)
+    lang = confident_lang(text)
+    extraction = await asyncio.to_thread(_extract, text, mode)
+    reduced = await _map_reduce(extraction.text, lang=lang)
+    system_prompt, user_prompt = _build_summary_prompts(reduced.text, lang=lang, partial=reduced.depth > 0)
+
     try:
-        return call_llm(
+        async for delta in stream_llm_async(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
-            model="gpt-4o-mini",
-            temperature=0.3,
-            max_tokens=512,
-        )
+            feature="summarize",
+        ):
+            yield delta
     
     except OpenAIServiceError as e:
-        # e.error_code: RATE_LIMITED / UPSTREAM_ERROR / OPENAI_ERROR / INTERNAL_ERROR
-        if e.error_code == "RATE_LIMITED":
-            raise AppError(error_code=ErrorCode.RATE_LIMITED, message=str(e))
-        raise AppError(error_code=ErrorCode.SERVICE_UNAVAILABLE, message=str(e))
+        raise _to_summarize_error(e)
+
+
+# -----------------------------
+# 긴 문서 요약 (map-reduce)
+# -----------------------------
+# chunk 단위로 다시 시도할 만한 에러 (일시적 upstream 장애 / rate limit)
+_RETRYABLE_CHUNK_ERRORS = frozenset({ErrorCode.SERVICE_UNAVAILABLE, ErrorCode.RATE_LIMITED})
+_CHUNK_RETRY_BACKOFF_SECONDS = 0.5
+
+# chunk 요약 캐시 (워커별, summary_chunk 테이블 앞단). 키는 정규화한 chunk 내용 + 출력 언어 + 단계 종류
+_chunk_cache = MemoryCacheBackend(
+    max_entries=SUMMARIZE_CHUNK_CACHE_MAX_ENTRIES,
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+)
+
+
+def _chunk_key(text: str, *, lang: Optional[str], merge: bool) -> str:
+    # 위치 번호는 키에서만 제거 (프롬프트에는 원문 chunk 그대로)
+    material = f"{'merge' if merge else 'map'}\x1f{lang or ''}\x1f{normalize_segment(_strip_numbering(text))}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+async def _summarize_chunk(text: str, *, lang: Optional[str], merge: bool) -> str:
+    """
+    chunk 1개 요약. 재시도 가능한 에러는 SUMMARIZE_CHUNK_RETRIES번까지 다시 시도 (남은 deadline 안에서만)
+    """
+    system_prompt, user_prompt = _build_chunk_prompts(text, lang=lang, merge=merge)
+    attempt = 0
+    while True:
+        try:
+            return (await call_llm_async(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                feature="summarize",
+            )).strip()
+        except OpenAIServiceError as e:
+            error = _to_summarize_error(e)
+            if error.error_code not in _RETRYABLE_CHUNK_ERRORS or attempt >= SUMMARIZE_CHUNK_RETRIES:
+                raise error
+            backoff = _CHUNK_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+            remaining = remaining_seconds()
+            if remaining is not None and remaining <= backoff:
+                raise error
+            attempt += 1
+            logger.warning(
+                "summarize_chunk_retry",
+                extra={"attempt": attempt, "error_code": error.error_code, "chunk_length": len(text)},
+            )
+            await asyncio.sleep(backoff)
+
+
+def _store_lookup(keys: list[str]) -> dict[str, str]:
+    if not keys or not SUMMARY_CHUNK_STORE_ENABLED:
+        return {}
+    db = SessionLocal()
+    try:
+        return lookup_summaries(db, keys)
+    except SQLAlchemyError:
+        # 저장소 장애는 요약 실패로 이어지지 않도록 LLM 요약으로 진행
+        db.rollback()
+        logger.warning("summary_chunk_lookup_failed", exc_info=True)
+        return {}
+    finally:
+        db.close()
+
+
+def _store_save(summaries: dict[str, str], lang: Optional[str]) -> None:
+    if not summaries or not SUMMARY_CHUNK_STORE_ENABLED:
+        return
+    db = SessionLocal()
+    try:
+        save_summaries(db, summaries, lang=lang)
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("summary_chunk_save_failed", exc_info=True)
+    finally:
+        db.close()
+
+
+async def _summarize_level(texts: list[str], *, lang: Optional[str], merge: bool) -> tuple[list[str], int]:
+    """
+    한 단계의 chunk들을 요약. (요약 목록, 재사용한 chunk 수) 반환
+    - 워커 캐시 -> summary_chunk 테이블 -> LLM 순서. 같은 내용의 chunk는 한 번만 요약
+    - LLM 요약은 최대 SUMMARIZE_CHUNK_CONCURRENCY개씩 병렬. 하나라도 최종 실패하면 나머지 취소
+    """
+    keys = [_chunk_key(t, lang=lang, merge=merge) for t in texts]
+    found: dict[str, str] = {}
+    for key in keys:
+        cached = _chunk_cache.get(key)
+        if cached is not None:
+            found[key] = cached
+
+    stored = await asyncio.to_thread(_store_lookup, [k for k in set(keys) if k not in found])
+    for key, summary in stored.items():
+        _chunk_cache.set(key, summary)
+    found.update(stored)
+    reused = sum(1 for key in keys if key in found)
+
+    missing = {key: text for key, text in zip(keys, texts) if key not in found}
+    semaphore = asyncio.Semaphore(max(1, SUMMARIZE_CHUNK_CONCURRENCY))
+
+    async def run(text: str) -> str:
+        async with semaphore:
+            return await _summarize_chunk(text, lang=lang, merge=merge)
+
+    tasks = [asyncio.ensure_future(run(t)) for t in missing.values()]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    new = {key: summary for key, summary in zip(missing, results) if summary}
+    for key, summary in new.items():
+        _chunk_cache.set(key, summary)
+    await asyncio.to_thread(_store_save, new, lang)
+    found.update(new)
+
+    return [found.get(key, "") for key in keys], reused
+
+
+# 위치 번호: pptx_service가 줄마다 붙이는 '[Slide N] ' 접두어 (pdf_service는 페이지를 빈 줄로만 구분)
+_SLIDE_PREFIX_RE = re.compile(r"^\[Slide \d+\] ", re.MULTILINE)
+
+
+def _strip_numbering(text: str) -> str:
+    # 슬라이드를 지우거나 끼워 넣어도 뒤쪽 chunk의 경계 / 요약 키가 그대로 남도록 위치 번호 제거
+    return _SLIDE_PREFIX_RE.sub("", text)
+
+
+def _split(text: str) -> list[str]:
+    # 문단(빈 줄 = PDF 페이지 / PPTX 슬라이드) 단위, 경계는 내용으로 결정 -> 한 곳을 고쳐도 나머지 chunk는 그대로
+    chunks = chunk_text_by_content(
+        text,
+        max_tokens=SUMMARIZE_CHUNK_TOKENS,
+        max_chars=MAX_TEXT_LENGTH,
+        target_tokens=max(1, SUMMARIZE_CHUNK_TOKENS // 2),
+        anchor_key=_strip_numbering,
+    )
+    return [c.text for c in chunks]
+
+
+@dataclass(frozen=True)
+class _Reduced:
+    text: str      # 최종 요약 프롬프트에 넣을 텍스트
+    depth: int     # map / reduce 단계 수 (0이면 원문 그대로)
+    chunks: int    # 첫 단계 chunk 수
+    reused: int    # 첫 단계에서 저장된 요약을 재사용한 chunk 수
+
+
+async def _map_reduce(text: str, *, lang: Optional[str]) -> _Reduced:
+    """
+    최종 요약 프롬프트 하나에 들어갈 때까지 chunk 요약을 반복
+    - 예산 안의 텍스트는 그대로 (단계 0)
+    - 단계마다 chunk들을 병렬로 요약하므로 지연은 문서 길이가 아니라 단계 수에 비례
+    """
+    if estimate_text_tokens(text) <= SUMMARIZE_CHUNK_TOKENS:
+        return _Reduced(text=text, depth=0, chunks=1, reused=0)
+
+    texts = _split(text)
+    chunks = len(texts)
+    reused = 0
+    depth = 0
+    while True:
+        summaries, level_reused = await _summarize_level(texts, lang=lang, merge=depth > 0)
+        if depth == 0:
+            reused = level_reused
+            record_document(chunks=chunks, reused=reused)
+        depth += 1
+        reduced = "\n\n".join(s for s in summaries if s)
+        if estimate_text_tokens(reduced) <= SUMMARIZE_CHUNK_TOKENS or depth >= SUMMARIZE_MAX_DEPTH:
+            break
+
+        next_texts = _split(reduced)
+        if len(next_texts) >= len(texts):
+            # 요약이 줄어들지 않으면 더 반복해도 소용없음
+            break
+        texts = next_texts
+
+    return _Reduced(text=reduced, depth=depth, chunks=chunks, reused=reused)
+
+
+def _extract(text: str, mode: SummarizeMode) -> Extraction:
+    """
+    mode별 추출 단계. full은 원문 그대로
+    """
+    if mode == SummarizeMode.fast:
+        budget = SUMMARIZE_CHUNK_TOKENS
+    elif mode == SummarizeMode.balanced:
+        budget = max(SUMMARIZE_CHUNK_TOKENS, int(estimate_text_tokens(text) * SUMMARIZE_BALANCED_RATIO))
+    else:
+        tokens = estimate_text_tokens(text)
+        return Extraction(text=text, sentences=0, kept=0, input_tokens=tokens, output_tokens=tokens)
+    return extract_sentences(text, token_budget=budget)
+
+
+async def summarize_document_async(
+  *,
+  text: str,
+  mode: Optional[str | SummarizeMode] = None,
+) -> dict:
+    """
+    길이에 상관없이 (MAX_TEXT_LENGTH까지) 요약
+    {"summarized_text", "chunks", "reused_chunks", "depth", "extractive"} 반환
+    - mode가 fast / balanced면 먼저 TF-IDF + TextRank로 중요한 문장만 남김 (extractive에 압축률)
+    - SUMMARIZE_CHUNK_TOKENS 안의 텍스트는 LLM 1번
+    - 넘으면 페이지/슬라이드(문단) 경계로 나눈 chunk를 병렬 요약(map)하고, 합친 요약이 예산 안에 들 때까지
+      다시 나눠 요약(reduce)한 뒤 최종 2~3문장 요약
+    - chunk 요약은 내용 해시로 저장되므로 일부만 바뀐 문서는 바뀐 chunk와 reduce 단계만 다시 실행
+    """
+    _validate_summary_text(text)
+    mode = _validate_mode(mode)
+    lang = confident_lang(text)
+    # 문장 수천 개의 행렬 연산은 이벤트 루프 밖에서
+    extraction = await asyncio.to_thread(_extract, text, mode)
+    reduced = await _map_reduce(extraction.text, lang=lang)
+    system_prompt, user_prompt = _build_summary_prompts(reduced.text, lang=lang, partial=reduced.depth > 0)
+
+    try:
+        summarized_text = await call_llm_async(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            feature="summarize",
+        )
+    except OpenAIServiceError as e:
+        raise _to_summarize_error(e)
+
+    return {
+        "summarized_text": summarized_text,
+        "chunks": reduced.chunks,
+        "reused_chunks": reduced.reused,
+        "depth": reduced.depth,
+        "extractive": {
+            "mode": mode.value,
+            "sentences": extraction.sentences,
+            "kept_sentences": extraction.kept,
+            "compression_ratio": extraction.compression_ratio,
+        },
+    }
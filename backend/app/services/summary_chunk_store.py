@@ -0,0 +1,83 @@
+"""
+chunk 요약 저장소 (summary_chunk 테이블)
+- 긴 문서 요약의 chunk별 요약을 내용 해시로 저장해서, 일부만 바뀐 문서를 다시 요약할 때 바뀐 chunk만 LLM 호출
+- 키 계산(정규화 / 단계 종류 / 출력 언어)은 summarize_service가 담당
+"""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.metrics import registry, stats_to_samples
+from app.models.summary_chunk import SummaryChunk
+
+def lookup_summaries(db, keys: list[str]) -> dict[str, str]:
+    """
+    저장된 chunk 요약 일괄 조회 {chunk_hash: summary}. 적중한 행은 hit_count / last_used_at 갱신
+    """
+    if not keys:
+        return {}
+
+    rows = db.execute(
+        select(SummaryChunk.chunk_id, SummaryChunk.chunk_hash, SummaryChunk.summary)
+        .where(SummaryChunk.chunk_hash.in_(set(keys)))
+    ).all()
+
+    if rows:
+        db.execute(
+            update(SummaryChunk)
+            .where(SummaryChunk.chunk_id.in_([row.chunk_id for row in rows]))
+            .values(hit_count=SummaryChunk.hit_count + 1, last_used_at=func.now())
+        )
+        db.commit()
+
+    return {row.chunk_hash: row.summary for row in rows}
+
+
+def save_summaries(db, summaries: dict[str, str], *, lang: Optional[str]) -> int:
+    """
+    새로 만든 chunk 요약 저장. 다른 요청이 먼저 저장한 chunk는 건너뜀. 저장한 행 수 반환
+    """
+    saved = 0
+    for key, summary in summaries.items():
+        if not summary or not summary.strip():
+            continue
+        try:
+            with db.begin_nested():
+                db.add(SummaryChunk(chunk_hash=key, lang=lang, summary=summary.strip(), hit_count=0))
+            saved += 1
+        except IntegrityError:
+            pass
+    db.commit()
+    return saved
+
+
+# -----------------------------
+# 통계 (워커 단위, 첫 단계(map) chunk 기준)
+# -----------------------------
+_stats = {"documents": 0, "chunks": 0, "reused": 0}
+_stats_lock = threading.Lock()
+
+
+def record_document(*, chunks: int, reused: int) -> None:
+    with _stats_lock:
+        _stats["documents"] += 1
+        _stats["chunks"] += chunks
+        _stats["reused"] += reused
+
+
+def get_summary_chunk_stats() -> dict:
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["reuse_ratio"] = round(stats["reused"] / stats["chunks"], 4) if stats["chunks"] else 0.0
+    return stats
+
+
+registry.register_collector(
+    "summary_chunks",
+    "Reused chunk summaries for long-document summarization in this worker",
+    lambda: stats_to_samples(get_summary_chunk_stats()),
+)
@@ -0,0 +1,88 @@
+"""
+용어 설명 요청의 context 분류 (LLM 없이 키워드 버킷)
+- context 안의 키워드 + context에 나온 사전 용어(그 용어의 저장된 설명을 같은 키워드로 분류한 버킷)를 세어 가장 많은 버킷을 고름
+  ('센팍에서 만나' -> 센팍 설명에 캠퍼스 키워드 -> campus)
+- 어느 버킷에도 걸리지 않으면 None -> 문맥 없는 기본 설명 사용
+- 분류 결과는 term_explanation_context의 키 (term_id, context_class)
+"""
+from __future__ import annotations
+
+import unicodedata
+from typing import Optional
+
+from app.services.term_index import AhoCorasick, TermEntry, get_term_index
+
+# 버킷 순서 = 동점일 때 우선순위
+CONTEXT_BUCKETS: dict[str, tuple[str, ...]] = {
+    "course": (
+        "수강", "강의", "수업", "과목", "전공", "교양", "학점", "시간표", "분반", "출석", "교수", "전필", "전선", "교필",
+        "course", "class", "lecture", "credit", "syllabus", "professor",
+    ),
+    "exam": (
+        "시험", "중간고사", "기말", "성적", "과제", "레포트", "리포트", "평가", "퀴즈",
+        "exam", "grade", "assignment", "quiz", "midterm", "final",
+    ),
+    "admin": (
+        "등록금", "장학", "휴학", "복학", "졸업", "증명서", "학적", "행정", "신청서", "수료", "비자", "외국인등록",
+        "tuition", "scholarship", "graduation", "certificate", "visa",
+    ),
+    "campus": (
+        "도서관", "열람실", "건물", "캠퍼스", "식당", "학식", "기숙사", "생활관", "정문", "후문", "쪽문", "주차", "셔틀",
+        "library", "dorm", "cafeteria", "building", "shuttle", "campus",
+    ),
+    "student_life": (
+        "동아리", "축제", "행사", "엠티", "학생회", "과방", "선배", "후배", "개강총회", "종강총회",
+        "club", "festival", "event",
+    ),
+}
+
+_KEYWORDS: list[tuple[str, str]] = [
+    (keyword, bucket) for bucket, keywords in CONTEXT_BUCKETS.items() for keyword in keywords
+]
+_AUTOMATON = AhoCorasick([keyword for keyword, _ in _KEYWORDS])
+_BUCKET_ORDER = {bucket: order for order, bucket in enumerate(CONTEXT_BUCKETS)}
+
+# term_id -> (분류한 설명, 버킷). 설명이 바뀌면 다시 분류
+_term_buckets: dict[int, tuple[str, Optional[str]]] = {}
+
+
+def _keyword_counts(text: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for _, _, index in _AUTOMATON.finditer(unicodedata.normalize("NFC", text).lower()):
+        bucket = _KEYWORDS[index][1]
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return counts
+
+
+def _best(counts: dict[str, int]) -> Optional[str]:
+    if not counts:
+        return None
+    return min(counts, key=lambda bucket: (-counts[bucket], _BUCKET_ORDER[bucket]))
+
+
+def _term_bucket(entry: TermEntry) -> Optional[str]:
+    if not entry.explanation:
+        return None
+    cached = _term_buckets.get(entry.term_id)
+    if cached is not None and cached[0] == entry.explanation:
+        return cached[1]
+    bucket = _best(_keyword_counts(entry.explanation))
+    _term_buckets[entry.term_id] = (entry.explanation, bucket)
+    return bucket
+
+
+def context_class(context: Optional[str]) -> Optional[str]:
+    """
+    context -> 버킷 이름 (없으면 None). 키워드 / 용어 탐색 모두 context 길이에 선형
+    """
+    if not context or not context.strip():
+        return None
+
+    counts = _keyword_counts(context)
+    index = get_term_index()
+    for match in index.find_all(context):
+        entry = index.by_name.get(match.term_name)
+        bucket = _term_bucket(entry) if entry is not None else None
+        if bucket is not None:
+            counts[bucket] = counts.get(bucket, 0) + 1
+    return _best(counts)
@@ -0,0 +1,506 @@
+"""
+메모리 용어 인덱스 (term / term_explanation / term_explanation_translation / term_explanation_context 전체를 한 번에 읽어 만든 불변 스냅샷)
+- 용어 이름 dict: 정확히 일치하는 용어 조회 (DB 왕복 없음)
+- Aho-Corasick 오토마톤: 임의 텍스트에서 알려진 용어(중도, 센팍, 쪽문 ...)를 한 번의 선형 탐색으로 모두 찾음
+- 자모 trigram 인덱스: 오타 / 띄어쓰기 차이 / 덜 입력한 한글('센 팍', '센파')을 가장 비슷한 용어로 보정
+- 갱신은 새 스냅샷을 만든 뒤 참조만 교체 (읽는 쪽은 락 없음)
+  - 이 워커의 용어 쓰기: 바뀐 항목만 현재 스냅샷 복사본에 반영 (백그라운드, DB 다시 읽지 않음)
+  - TERM_INDEX_REFRESH_SECONDS 주기로 DB 전체를 다시 읽음 (다른 워커의 쓰기 반영)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.config import TERM_INDEX_ENABLED, TERM_INDEX_REFRESH_SECONDS
+from app.core.metrics import registry, stats_to_samples
+from app.db.session import SessionLocal
+from app.models.term import Term
+from app.models.term_explanation import TermExplanation
+from app.models.term_explanation_context import TermExplanationContext
+from app.models.term_explanation_translation import TermExplanationTranslation
+
+logger = logging.getLogger("app")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def normalize_term(text: str) -> str:
+    # translation_memory.normalize_segment와 같은 규칙 (NFC + 공백 정리)
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def explanation_hash(term_name: str, explanation: str) -> str:
+    """
+    term_explanation_translation.source_hash (번역의 원문인 용어 + 한국어 설명)
+    """
+    return hashlib.sha256(f"{normalize_term(term_name)}\x1f{explanation.strip()}".encode("utf-8")).hexdigest()
+
+
+# 한글 음절 -> 호환 자모 (초성 / 중성 / 종성). 사용자가 덜 입력한 'ㅍ' 같은 호환 자모와 같은 문자로 맞춤
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+
+def fuzzy_key(text: str) -> str:
+    """
+    퍼지 조회용 키: NFC + 공백 제거 + 소문자 + 한글 음절을 자모로 분해
+    """
+    out: list[str] = []
+    for ch in _WHITESPACE_RE.sub("", unicodedata.normalize("NFC", text)).lower():
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHOSEONG[code // 588])
+            out.append(_JUNGSEONG[code % 588 // 28])
+            out.append(_JONGSEONG[code % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _trigrams(key: str) -> frozenset[str]:
+    # pg_trgm처럼 앞 2칸 / 뒤 1칸 패딩 (짧은 용어도 앞부분 일치가 점수에 반영되도록)
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class TermEntry:
+    term_id: int
+    term_name: str
+    explanation: Optional[str]
+    # 현재 설명 기준으로 유효한 번역 {lang: (translated_term, translated_explanation)}
+    translations: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # 문맥 분류별 설명 {context_class: explanation}
+    contexts: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TermMatch:
+    term_id: int
+    term_name: str
+    start: int   # 입력 텍스트(정규화 전) 기준 [start, end) 위치
+    end: int
+
+
+# -----------------------------
+# Aho-Corasick
+# -----------------------------
+class AhoCorasick:
+    """
+    생성 후 변경하지 않는 다중 패턴 매칭 오토마톤
+    - finditer: (start, end, pattern index)를 끝 위치 순서로 반환 (겹치는 매칭 포함)
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        self.patterns = patterns
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # 실패 링크 쪽에서 끝나는 (더 짧은) 패턴도 이 상태의 출력으로
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(o) for o in outputs]
+
+    def finditer(self, text: str):
+        goto, fail, outputs, patterns = self._goto, self._fail, self._outputs, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in outputs[state]:
+                yield i + 1 - len(patterns[index]), i + 1, index
+
+
+# -----------------------------
+# 스냅샷
+# -----------------------------
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+def _is_nfc_boundary(ch: str) -> bool:
+    # 앞 글자와 합쳐질 수 없는 글자 (결합 문자 / 한글 조합형 중성·종성이 아님) -> 여기서 나눠 정규화해도 결과가 같음
+    return unicodedata.combining(ch) == 0 and not 0x1160 <= ord(ch) <= 0x11FF
+
+
+def _nfc_with_offsets(text: str) -> tuple[str, Optional[list[tuple[int, int]]]]:
+    """
+    NFC 정규화한 텍스트와, 정규화한 글자별 원문 [start, end) 위치 (이미 NFC면 None -> 위치가 같음)
+    """
+    if unicodedata.is_normalized("NFC", text):
+        return text, None
+
+    parts: list[str] = []
+    offsets: list[tuple[int, int]] = []
+    start = 0
+    for i in range(1, len(text) + 1):
+        if i < len(text) and not _is_nfc_boundary(text[i]):
+            continue
+        piece = unicodedata.normalize("NFC", text[start:i])
+        parts.append(piece)
+        offsets.extend([(start, i)] * len(piece))
+        start = i
+    return "".join(parts), offsets
+
+
+@dataclass(frozen=True)
+class TermIndex:
+    by_name: dict[str, TermEntry] = field(default_factory=dict)
+    automaton: Optional[AhoCorasick] = None
+    entries: tuple[TermEntry, ...] = ()
+    loaded: bool = False           # DB에서 한 번이라도 읽었는지 (False면 호출 쪽이 DB로 조회)
+    built_at: float = 0.0
+    # 퍼지 조회: fuzzy_key -> 용어, trigram -> entries 위치, entries 위치별 trigram 수
+    by_key: dict[str, TermEntry] = field(default_factory=dict)
+    trigram_postings: dict[str, tuple[int, ...]] = field(default_factory=dict)
+    trigram_counts: tuple[int, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def get(self, term_name: str) -> Optional[TermEntry]:
+        return self.by_name.get(normalize_term(term_name))
+
+    def find_similar(self, term_name: str, threshold: float) -> Optional[tuple[TermEntry, float]]:
+        """
+        정확히 일치하는 용어가 없을 때 가장 비슷한 용어와 유사도
+        - 공백 / 대소문자만 다르면 유사도 1.0
+        - 아니면 자모 trigram Jaccard 유사도가 threshold 이상이고 1등이 하나일 때만 반환
+        """
+        key = fuzzy_key(term_name)
+        if len(key) < 2:
+            return None
+        entry = self.by_key.get(key)
+        if entry is not None:
+            return entry, 1.0
+
+        query = _trigrams(key)
+        shared: dict[int, int] = {}
+        for gram in query:
+            for index in self.trigram_postings.get(gram, ()):
+                shared[index] = shared.get(index, 0) + 1
+
+        best: Optional[int] = None
+        best_score = second_score = 0.0
+        for index, count in shared.items():
+            score = count / (len(query) + self.trigram_counts[index] - count)
+            if score > best_score:
+                best, best_score, second_score = index, score, best_score
+            elif score > second_score:
+                second_score = score
+        if best is None or best_score < threshold or second_score == best_score:
+            return None
+        return self.entries[best], round(best_score, 4)
+
+    def find_all(self, text: str) -> list[TermMatch]:
+        """
+        텍스트 안의 알려진 용어를 왼쪽부터, 겹치면 긴 것 우선으로 반환
+        - 매칭은 NFC 정규화한 텍스트에서, 위치는 입력 텍스트 기준으로 되돌려 반환 (조합형 한글 입력도 원문 위치)
+        - 용어 앞은 단어 경계여야 함 ('학교중도'처럼 앞에 글자가 붙은 경우는 제외)
+        - 라틴 문자 용어는 뒤에 라틴 문자/숫자가 이어지면 제외 (조사가 붙는 'LMS에서'는 허용, 한국어 용어는 뒤를 검사하지 않음)
+        """
+        if self.automaton is None or not text:
+            return []
+        text, offsets = _nfc_with_offsets(text)
+
+        candidates: list[tuple[int, int, int]] = []
+        for start, end, index in self.automaton.finditer(text):
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            entry = self.entries[index]
+            if entry.term_name[-1].isascii() and end < len(text) and text[end].isascii() and text[end].isalnum():
+                continue
+            candidates.append((start, end, index))
+
+        candidates.sort(key=lambda c: (c[0], -(c[1] - c[0])))
+        matches: list[TermMatch] = []
+        covered = 0
+        for start, end, index in candidates:
+            if start < covered:
+                continue
+            entry = self.entries[index]
+            covered = end
+            if offsets is not None:
+                start, end = offsets[start][0], offsets[end - 1][1]
+            matches.append(TermMatch(term_id=entry.term_id, term_name=entry.term_name, start=start, end=end))
+        return matches
+
+
+def build_term_index(entries: list[TermEntry]) -> TermIndex:
+    by_name: dict[str, TermEntry] = {}
+    for entry in entries:
+        key = normalize_term(entry.term_name)
+        if key:
+            by_name[key] = TermEntry(
+                term_id=entry.term_id,
+                term_name=key,
+                explanation=entry.explanation,
+                translations=entry.translations,
+                contexts=entry.contexts,
+            )
+    ordered = tuple(by_name.values())
+
+    by_key: dict[str, TermEntry] = {}
+    postings: dict[str, list[int]] = {}
+    counts: list[int] = []
+    for index, entry in enumerate(ordered):
+        key = fuzzy_key(entry.term_name)
+        by_key.setdefault(key, entry)
+        grams = _trigrams(key)
+        counts.append(len(grams))
+        for gram in grams:
+            postings.setdefault(gram, []).append(index)
+
+    return TermIndex(
+        by_name=by_name,
+        automaton=AhoCorasick([e.term_name for e in ordered]) if ordered else None,
+        entries=ordered,
+        loaded=True,
+        built_at=time.time(),
+        by_key=by_key,
+        trigram_postings={gram: tuple(indices) for gram, indices in postings.items()},
+        trigram_counts=tuple(counts),
+    )
+
+
+def _load_entries(db) -> list[TermEntry]:
+    rows = db.execute(
+        select(Term.term_id, Term.term_name, TermExplanation.explanation)
+        .outerjoin(TermExplanation, TermExplanation.term_id == Term.term_id)
+    ).all()
+
+    translations: dict[int, list] = {}
+    for t in db.execute(select(TermExplanationTranslation)).scalars():
+        translations.setdefault(t.term_id, []).append(t)
+
+    contexts: dict[int, dict[str, str]] = {}
+    for c in db.execute(select(TermExplanationContext)).scalars():
+        contexts.setdefault(c.term_id, {})[c.context_class] = c.explanation
+
+    entries = []
+    for r in rows:
+        valid = {}
+        if r.explanation:
+            current = explanation_hash(r.term_name, r.explanation)
+            valid = {
+                t.lang: (t.translated_term, t.translated_explanation)
+                for t in translations.get(r.term_id, [])
+                if t.source_hash == current
+            }
+        entries.append(TermEntry(
+            term_id=r.term_id,
+            term_name=r.term_name,
+            explanation=r.explanation,
+            translations=valid,
+            contexts=contexts.get(r.term_id, {}),
+        ))
+    return entries
+
+
+@dataclass(frozen=True)
+class TermUpdate:
+    """
+    이 워커가 DB에 쓴 용어 하나의 변경 (None인 항목은 그대로)
+    - translation: (lang, translated_term, translated_explanation, source_hash)
+    - context: (context_class, explanation)
+    """
+    term_id: int
+    term_name: Optional[str] = None
+    explanation: Optional[str] = None
+    translation: Optional[tuple[str, str, str, str]] = None
+    context: Optional[tuple[str, str]] = None
+
+
+def apply_term_updates(index: TermIndex, updates: list[TermUpdate]) -> TermIndex:
+    """
+    스냅샷 복사본에 변경만 반영한 새 스냅샷
+    - 이름이 그대로면 entries 순서가 같아 오토마톤 / trigram 인덱스를 그대로 재사용
+    - 새 용어가 있으면 오토마톤 / trigram만 다시 만듦 (DB는 읽지 않음)
+    - 인덱스에 없는 term_id인데 이름을 모르면 건너뜀 (주기 재구성에서 반영)
+    """
+    by_name = dict(index.by_name)
+    names = {entry.term_id: name for name, entry in by_name.items()}
+    added = False
+    for update in updates:
+        name = normalize_term(update.term_name) if update.term_name else names.get(update.term_id)
+        if not name:
+            continue
+        entry = by_name.get(name)
+        if entry is None:
+            entry = TermEntry(term_id=update.term_id, term_name=name, explanation=None)
+            names[update.term_id] = name
+            added = True
+
+        if update.explanation is not None and update.explanation != entry.explanation:
+            # 설명이 바뀌면 저장된 번역은 모두 무효 (upsert_explanation과 같은 규칙)
+            entry = replace(entry, explanation=update.explanation, translations={})
+        if update.translation is not None:
+            lang, translated_term, translated_explanation, source_hash = update.translation
+            if entry.explanation and source_hash == explanation_hash(entry.term_name, entry.explanation):
+                entry = replace(entry, translations={**entry.translations, lang: (translated_term, translated_explanation)})
+        if update.context is not None:
+            context_cls, explanation = update.context
+            entry = replace(entry, contexts={**entry.contexts, context_cls: explanation})
+        by_name[name] = entry
+
+    if added:
+        return replace(build_term_index(list(by_name.values())), built_at=index.built_at)
+    return replace(
+        index,
+        by_name=by_name,
+        entries=tuple(by_name[entry.term_name] for entry in index.entries),
+        by_key={key: by_name[entry.term_name] for key, entry in index.by_key.items()},
+    )
+
+
+# -----------------------------
+# 현재 인덱스 / 갱신
+# -----------------------------
+_index = TermIndex()
+_refresh_lock = threading.Lock()
+_pending_updates: list[TermUpdate] = []
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_stats = {"refreshes": 0, "refresh_errors": 0, "build_ms": 0.0, "updates": 0, "update_ms": 0.0}
+# _stats 전용 (이벤트 루프에서도 잡으므로 재구성 중에 오래 잡히는 _refresh_lock과 분리)
+_stats_lock = threading.Lock()
+
+
+def get_term_index() -> TermIndex:
+    return _index
+
+
+def refresh_term_index() -> TermIndex:
+    """
+    DB 전체를 읽어 새 스냅샷을 만들고 교체. 동시에 여러 번 불려도 재구성은 한 번에 하나
+    """
+    global _index
+    if not TERM_INDEX_ENABLED:
+        return _index
+
+    with _refresh_lock:
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            entries = _load_entries(db)
+        finally:
+            db.close()
+        index = build_term_index(entries)
+        _index = index
+        with _stats_lock:
+            _stats["refreshes"] += 1
+            _stats["build_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return index
+
+
+def _update_worker() -> None:
+    global _index, _worker
+    while True:
+        with _worker_lock:
+            updates = list(_pending_updates)
+            _pending_updates.clear()
+            if not updates:
+                _worker = None
+                return
+        try:
+            with _refresh_lock:
+                # 아직 한 번도 읽지 않았으면 처음 전체 읽기에 포함됨
+                if _index.loaded:
+                    started = time.perf_counter()
+                    _index = apply_term_updates(_index, updates)
+                    with _stats_lock:
+                        _stats["updates"] += len(updates)
+                        _stats["update_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        except Exception:
+            with _stats_lock:
+                _stats["refresh_errors"] += 1
+            logger.warning("term_index_update_failed", exc_info=True)
+
+
+def request_term_index_update(update: TermUpdate) -> None:
+    """
+    용어 / 설명 / 번역을 쓴 직후 호출. 백그라운드 스레드에서 현재 스냅샷에 반영 (연달아 불리면 한 번에)
+    """
+    global _worker
+    if not TERM_INDEX_ENABLED:
+        return
+    with _worker_lock:
+        _pending_updates.append(update)
+        if _worker is None:
+            _worker = threading.Thread(target=_update_worker, name="term-index-update", daemon=True)
+            _worker.start()
+
+
+async def run_term_index_refresh() -> None:
+    """
+    startup 훅에서 띄우는 루프. 처음 한 번 바로 읽고, 이후 TERM_INDEX_REFRESH_SECONDS마다 다시 읽음
+    """
+    while True:
+        try:
+            await asyncio.to_thread(refresh_term_index)
+        except Exception:
+            with _stats_lock:
+                _stats["refresh_errors"] += 1
+            logger.warning("term_index_refresh_failed", exc_info=True)
+        if TERM_INDEX_REFRESH_SECONDS <= 0:
+            return
+        await asyncio.sleep(TERM_INDEX_REFRESH_SECONDS)
+
+
+def get_term_index_stats() -> dict:
+    index = _index
+    with _stats_lock:
+        stats = dict(_stats)
+    return {
+        "terms": len(index),
+        "explained": sum(1 for e in index.entries if e.explanation),
+        "translations": sum(len(e.translations) for e in index.entries),
+        "contexts": sum(len(e.contexts) for e in index.entries),
+        "loaded": index.loaded,
+        "age_seconds": round(time.time() - index.built_at, 1) if index.loaded else None,
+        **stats,
+    }
+
+
+registry.register_collector(
+    "term_index",
+    "In-memory term dictionary in this worker",
+    lambda: stats_to_samples(get_term_index_stats()),
+)
@@ -1,17 +1,93 @@
-import uuid, openai
-from typing import Optional, Any
+import uuid, openai, logging, json, threading
+from dataclasses import dataclass
+from typing import Any, Generator, Optional
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.models.term import Term
 from app.models.term_explanation import TermExplanation
-from app.schemas.term import TermExplainData, TermExplainRequest, TermExplainResponse
+from app.models.term_explanation_translation import TermExplanationTranslation
+from app.models.term_explanation_context import TermExplanationContext
+from app.schemas.term import TermAnnotation, TermExplainData, TermExplainRequest, TermExplainResponse
 
 from app.models.enums import Source
+from app.core.config import (
+    TERM_ANNOTATION_ENABLED,
+    TERM_ANNOTATION_MAX_TERMS,
+    TERM_CONTEXT_CACHE_ENABLED,
+    TERM_EXPLAIN_FUSED,
+    TERM_FUZZY_ENABLED,
+    TERM_FUZZY_THRESHOLD,
+)
+from app.core.metrics import registry, stats_to_samples
+from app.db.session import engine
 
-from app.services.openai_service import call_llm
-from app.services.translate_service import translate_text
+from app.services.openai_service import call_llm, call_llm_async, OpenAIServiceError
+from app.services.translate_service import translate_many, translate_many_async
+from app.services.lang_detect import LANG_NAMES
+from app.services.term_context import context_class
+from app.services.term_index import TermEntry, TermUpdate, explanation_hash, get_term_index, request_term_index_update
 from app.exceptions.error import AppError, ErrorCode
 
+logger = logging.getLogger("app")
+
+
+@dataclass(frozen=True)
+class _Step:
+    """
+    설명 흐름(_explain_plan)이 요청하는 작업 하나
+    - kind: "db" (동기 DB 작업 -> async에서는 threadpool), "llm" (async에서는 같은 이름의 *_async 메서드),
+      "local" (메모리 작업, 어디서든 바로 실행)
+    """
+    kind: str
+    method: str
+    args: tuple
+
+
+# _Step을 yield하고 그 결과를 돌려받아 마지막에 응답을 반환하는 generator
+ExplainPlan = Generator[_Step, Any, Any]
+
+# 용어 조회 통계 (워커 단위). llm_calls_avoided: 퍼지 보정 덕분에 설명 생성(또는 fused) 호출을 건너뛴 수
+# context_hits / context_misses: 문맥별 설명 캐시 적중 / 생성
+_lookup_stats = {
+    "lookups": 0, "exact": 0, "fuzzy_resolved": 0, "misses": 0, "llm_calls_avoided": 0,
+    "context_hits": 0, "context_misses": 0,
+}
+# threadpool 스레드들이 함께 갱신
+_lookup_stats_lock = threading.Lock()
+# Postgres에 pg_trgm 확장 + trigram 인덱스가 준비됐는지 (ensure_term_trgm_index)
+_pg_trgm_ready = False
+
+
+def _count_lookup(name: str) -> None:
+    with _lookup_stats_lock:
+        _lookup_stats[name] += 1
+
+
+def ensure_term_trgm_index() -> bool:
+    """
+    startup 훅에서 호출. Postgres면 pg_trgm 확장과 공백 제거한 term_name의 GIN trigram 인덱스 생성
+    - 권한이 없거나 다른 DB면 건너뜀 (메모리 용어 인덱스의 퍼지 조회만 사용)
+    """
+    global _pg_trgm_ready
+    if not TERM_FUZZY_ENABLED or engine.dialect.name != "postgresql":
+        return False
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_term_name_trgm "
+                "ON term USING gin (replace(term_name, ' ', '') gin_trgm_ops)"
+            ))
+    except Exception:
+        logger.warning("term_trgm_index_unavailable", exc_info=True)
+        return False
+    _pg_trgm_ready = True
+    return True
+
+
 class TermService:
     # ---------- translate_text/call_llm -> str or dict -> 문자열만 반환 ----------
     
@@ -38,14 +114,76 @@ class TermService:
         db.add(term)
         db.commit()
         db.refresh(term)
+        request_term_index_update(TermUpdate(term_id=term.term_id, term_name=term.term_name))
         return term
 
+    def find_similar_term(self, db: Session, term_name: str) -> tuple[str, float] | None:
+        """
+        term 테이블에서 가장 비슷한 용어 (pg_trgm similarity, 공백 무시). pg_trgm이 없으면 None
+        """
+        if not _pg_trgm_ready:
+            return None
+        key = "".join(term_name.split())
+        compact = func.replace(Term.term_name, " ", "")
+        score = func.similarity(compact, key)
+        try:
+            rows = db.execute(
+                select(Term.term_name, score.label("score"))
+                .where(compact.op("%")(key), score >= TERM_FUZZY_THRESHOLD)
+                .order_by(score.desc())
+                .limit(2)
+            ).all()
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning("term_trgm_lookup_failed", exc_info=True)
+            return None
+
+        if not rows or (len(rows) > 1 and rows[1].score == rows[0].score):
+            return None
+        return rows[0].term_name, float(rows[0].score)
+
+    def resolve_term_name(self, db: Session, term_name: str) -> tuple[str, bool]:
+        """
+        입력을 기존 용어 이름으로 보정 -> (용어 이름, 보정 여부)
+        - 메모리 용어 인덱스를 읽었으면 인덱스만 (정확히 일치 -> 자모 trigram), 아니면 DB (정확히 일치 -> pg_trgm)
+        - 못 찾으면 입력 그대로 (새 용어)
+        """
+        _count_lookup("lookups")
+        index = get_term_index()
+        if index.loaded:
+            if index.get(term_name) is not None:
+                _count_lookup("exact")
+                return term_name, False
+            found = index.find_similar(term_name, TERM_FUZZY_THRESHOLD) if TERM_FUZZY_ENABLED else None
+            resolved = (found[0].term_name, found[1]) if found else None
+        else:
+            if self.find_term_by_name(db, term_name):
+                _count_lookup("exact")
+                return term_name, False
+            resolved = self.find_similar_term(db, term_name) if TERM_FUZZY_ENABLED else None
+
+        if resolved is None:
+            _count_lookup("misses")
+            return term_name, False
+
+        _count_lookup("fuzzy_resolved")
+        logger.info("term_fuzzy_resolved", extra={"term": term_name, "resolved": resolved[0], "similarity": resolved[1]})
+        return resolved[0], True
+
+    def find_indexed_term(self, term_name: str) -> TermEntry | None:
+        # 메모리 용어 인덱스에 설명까지 있으면 DB 조회 없이 사용
+        entry = get_term_index().get(term_name)
+        return entry if entry is not None and entry.explanation else None
+
     def find_explanation(self, db: Session, term_id: int) -> TermExplanation | None:
         return db.query(TermExplanation).filter(TermExplanation.term_id == term_id).first()
 
     def upsert_explanation(self, db: Session, term_id: int, explanation: str) -> TermExplanation:
         row = db.query(TermExplanation).filter(TermExplanation.term_id == term_id).first()
         if row:
+            if row.explanation != explanation:
+                # 원문 설명이 바뀌면 저장된 번역은 모두 무효
+                db.execute(delete(TermExplanationTranslation).where(TermExplanationTranslation.term_id == term_id))
             row.explanation = explanation
         else:
             row = TermExplanation(term_id=term_id, explanation=explanation)
@@ -53,129 +191,309 @@ class TermService:
 
         db.commit()
         db.refresh(row)
+        request_term_index_update(TermUpdate(term_id=term_id, explanation=explanation))
         return row
 
+    def find_translation(self, db: Session, term_id: int, lang: str, source_hash: str) -> tuple[str, str] | None:
+        row = db.get(TermExplanationTranslation, (term_id, lang))
+        if row is None or row.source_hash != source_hash:
+            return None
+        return row.translated_term, row.translated_explanation
+
+    def save_translation(
+        self,
+        db: Session,
+        term_id: int,
+        lang: str,
+        translated_term: str,
+        translated_explanation: str,
+        source_hash: str,
+    ) -> None:
+        """
+        용어 / 설명 번역 저장 (같은 (term_id, lang)은 덮어씀). 실패해도 응답에는 영향 없음
+        """
+        try:
+            db.merge(TermExplanationTranslation(
+                term_id=term_id,
+                lang=lang,
+                translated_term=translated_term,
+                translated_explanation=translated_explanation,
+                source_hash=source_hash,
+            ))
+            db.commit()
+        except IntegrityError:
+            # 동시에 들어온 같은 요청이 먼저 저장
+            db.rollback()
+            return
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning("term_translation_save_failed", exc_info=True)
+            return
+        request_term_index_update(TermUpdate(
+            term_id=term_id,
+            translation=(lang, translated_term, translated_explanation, source_hash),
+        ))
+
+    def find_context_explanation(self, db: Session, term_id: int, context_cls: str) -> str | None:
+        row = db.get(TermExplanationContext, (term_id, context_cls))
+        return row.explanation if row is not None else None
+
+    def save_context_explanation(self, db: Session, term_id: int, context_cls: str, explanation: str) -> None:
+        """
+        문맥별 설명 저장 (같은 (term_id, context_class)는 덮어씀). 실패해도 응답에는 영향 없음
+        """
+        try:
+            db.merge(TermExplanationContext(term_id=term_id, context_class=context_cls, explanation=explanation))
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning("term_context_explanation_save_failed", exc_info=True)
+            return
+        request_term_index_update(TermUpdate(term_id=term_id, context=(context_cls, explanation)))
+
+    # ---------- 용어 주석 ----------
+
+    def annotate_terms(self, text: str, target_lang: Any) -> list[TermAnnotation] | None:
+        """
+        텍스트 안의 알려진 용어와 저장된 설명 / target 언어 번역 (메모리 용어 인덱스만 사용, DB / LLM 호출 없음)
+        - 설명이 없는 용어는 제외, 같은 용어는 한 항목에 위치만 모음
+        - TERM_ANNOTATION_ENABLED가 꺼져 있거나 인덱스를 아직 읽지 않았으면 None
+        """
+        index = get_term_index()
+        if not TERM_ANNOTATION_ENABLED or not index.loaded:
+            return None
+
+        lang = getattr(target_lang, "value", target_lang)
+        annotations: dict[int, TermAnnotation] = {}
+        for match in index.find_all(text):
+            annotation = annotations.get(match.term_id)
+            if annotation is None:
+                entry = index.by_name.get(match.term_name)
+                if entry is None or not entry.explanation or len(annotations) >= TERM_ANNOTATION_MAX_TERMS:
+                    continue
+                if lang == "ko":
+                    translated_term, translated_explanation = entry.term_name, entry.explanation
+                else:
+                    translated_term, translated_explanation = entry.translations.get(lang, (None, None))
+                annotation = annotations[match.term_id] = TermAnnotation(
+                    term=entry.term_name,
+                    spans=[],
+                    explanation=entry.explanation,
+                    translated_term=translated_term,
+                    translated_explanation=translated_explanation,
+                )
+            annotation.spans.append((match.start, match.end))
+        return list(annotations.values())
+
     # ---------- LLM ----------
 
-    def explain_by_llm(
+    def _build_explain_prompts(
         self,
         term_text: str,
         context: Optional[str],
-    ) -> str:
+    ) -> tuple[str, str]:
+        system_prompt = "\n".join([
+            "You are a reliable assistant for Korean university students and international students.",
+            "Explain Korean university terms accurately and concisely.",
+            "You MUST follow the output rules exactly.",
+        ])
+
+        user_prompt = "\n".join([
+            "Task:",
+            "Explain the meaning of the given Korean university term in Korean.",
+            "",
+            f"Term: {term_text}",
+            f"Context: {context or ''}",
+            "",
+            "Output rules (MUST follow exactly):",
+            "- Output Korean only.",
+            "- Output ONLY the explanation text.",
+            "- Exactly 2 sentences.",
+            "- No quotes, no code blocks, no JSON, no labels, no headings.",
+            "- No line breaks (single line).",
+            "- Do NOT repeat the term itself in the explanation.",
+            "- Do NOT mention specific universities unless the context explicitly mentions them.",
+            "",
+            "Now write the explanation:",
+        ])
+
+        return system_prompt, user_prompt
+
+    def _build_fused_prompts(
+        self,
+        term_text: str,
+        context: Optional[str],
+        target_lang: str,
+    ) -> tuple[str, str]:
+        """
+        한국어 설명 + 용어 번역 + 설명 번역을 한 번에 받는 프롬프트 (JSON 응답)
+        """
+        system_prompt = "\n".join([
+            "You are a reliable assistant for Korean university students and international students.",
+            "Explain Korean university terms accurately and concisely, then translate them.",
+            "You MUST follow the output rules exactly.",
+        ])
+
+        target_name = LANG_NAMES.get(target_lang, target_lang)
+        user_prompt = "\n".join([
+            "Task:",
+            "1) Explain the meaning of the given Korean university term in Korean.",
+            f"2) Translate the term into {target_name}.",
+            f"3) Translate your Korean explanation into {target_name}.",
+            "",
+            f"Term: {term_text}",
+            f"Context: {context or ''}",
+            f"Target language: {target_lang}",
+            "",
+            "Rules for the Korean explanation:",
+            "- Exactly 2 sentences, single line.",
+            "- Do NOT repeat the term itself in the explanation.",
+            "- Do NOT mention specific universities unless the context explicitly mentions them.",
+            "",
+            "Output format (JSON only, no code blocks):",
+            '{"explanation":"<Korean explanation>","translated_term":"<translated term>",'
+            '"translated_explanation":"<translated explanation>"}',
+        ])
+
+        return system_prompt, user_prompt
+
+    def _parse_fused(self, raw: str) -> tuple[str, str, str] | None:
+        """
+        (설명, 용어 번역, 설명 번역). 형식이 맞지 않으면 None (-> 설명 / 번역을 따로 호출)
+        """
+        text = (raw or "").strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
         try:
-            system_prompt = "\n".join([
-                "You are a reliable assistant for Korean university students and international students.",
-                "Explain Korean university terms accurately and concisely.",
-                "You MUST follow the output rules exactly.",
-            ])
-
-            user_prompt = "\n".join([
-                "Task:",
-                "Explain the meaning of the given Korean university term in Korean.",
-                "",
-                f"Term: {term_text}",
-                f"Context: {context or ''}",
-                "",
-                "Output rules (MUST follow exactly):",
-                "- Output Korean only.",
-                "- Output ONLY the explanation text.",
-                "- Exactly 2 sentences.",
-                "- No quotes, no code blocks, no JSON, no labels, no headings.",
-                "- No line breaks (single line).",
-                "- Do NOT repeat the term itself in the explanation.",
-                "- Do NOT mention specific universities unless the context explicitly mentions them.",
-                "",
-                "Now write the explanation:",
-            ])
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            data = {}
 
-            return call_llm(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                model="gpt-4o-mini",
-                temperature=0.3,
-                max_tokens=512,
-            )
+        values = tuple(data.get(key) for key in ("explanation", "translated_term", "translated_explanation"))
+        if not all(isinstance(v, str) and v.strip() for v in values):
+            logger.warning("term_explain_fused_parse_failed", extra={"response_length": len(raw or "")})
+            return None
+        return tuple(v.strip() for v in values)
+
+    def _to_llm_error(self, e: Exception) -> AppError:
+        if isinstance(e, OpenAIServiceError):
+            if e.error_code == "RATE_LIMITED":
+                return AppError(error_code=ErrorCode.RATE_LIMITED, message=str(e))
+            if e.error_code == "DEADLINE_EXCEEDED":
+                return AppError(error_code=ErrorCode.REQUEST_TIMEOUT, message=str(e))
+            return AppError(error_code=ErrorCode.SERVICE_UNAVAILABLE, message=str(e))
 
-        except openai.RateLimitError as e:
-            raise AppError(
+        if isinstance(e, openai.RateLimitError):
+            return AppError(
                 error_code=ErrorCode.RATE_LIMITED,
                 message="Rate limit exceeded when calling OpenAI API.",
                 detail={"reason":str(e)}
             )
 
-        except (openai.APIConnectionError, openai.APIStatusError) as e:
-            raise AppError(
+        if isinstance(e, (openai.APIConnectionError, openai.APIStatusError)):
+            return AppError(
                 error_code=ErrorCode.SERVICE_UNAVAILABLE,
                 message="Upstream error occurred when calling OpenAI API.",
                 detail={"reason":str(e)}
             )
             
+        return AppError(
+            error_code=ErrorCode.INTERNAL_SERVER_ERROR,
+            detail={"reason":str(e)}
+        )
+
+    def explain_by_llm(
+        self,
+        term_text: str,
+        context: Optional[str],
+    ) -> str:
+        system_prompt, user_prompt = self._build_explain_prompts(term_text, context)
+        try:
+            return call_llm(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                feature="term",
+            )
         except Exception as e:
-            raise AppError(
-                error_code=ErrorCode.INTERNAL_SERVER_ERROR,
-                detail={"reason":str(e)}
+            raise self._to_llm_error(e)
+
+    async def explain_by_llm_async(
+        self,
+        term_text: str,
+        context: Optional[str],
+    ) -> str:
+        system_prompt, user_prompt = self._build_explain_prompts(term_text, context)
+        try:
+            return await call_llm_async(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                feature="term",
+            )
+        except Exception as e:
+            raise self._to_llm_error(e)
+
+    def explain_fused(
+        self,
+        term_text: str,
+        context: Optional[str],
+        target_lang: str,
+    ) -> tuple[str, str, str] | None:
+        system_prompt, user_prompt = self._build_fused_prompts(term_text, context, target_lang)
+        try:
+            raw = call_llm(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                feature="term",
+            )
+        except Exception as e:
+            raise self._to_llm_error(e)
+        return self._parse_fused(raw)
+
+    async def explain_fused_async(
+        self,
+        term_text: str,
+        context: Optional[str],
+        target_lang: str,
+    ) -> tuple[str, str, str] | None:
+        system_prompt, user_prompt = self._build_fused_prompts(term_text, context, target_lang)
+        try:
+            raw = await call_llm_async(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                feature="term",
             )
+        except Exception as e:
+            raise self._to_llm_error(e)
+        return self._parse_fused(raw)
 
     # ---------- Main Service ----------
 
-    def explain_term(
+    def _build_response(
         self,
-        db: Session,
         request: TermExplainRequest,
+        term_name: str,
+        source: Source,
+        explanation_text: str,
+        translated_term_raw: Any,
+        translated_explanation_raw: Any,
     ) -> TermExplainResponse:
-
-        term_row = self.find_term_by_name(db, request.term)
-        if not term_row:
-            term_row = self.create_term(db, request.term)
-
-        explanation_row = self.find_explanation(db, term_row.term_id)
-
-        if explanation_row:
-            explanation_text = explanation_row.explanation
-            source = Source.db
-        else:
-            # db에 없으면 LLM로 ko 설명 생성 후 db 저장
-            explanation_text = self.explain_by_llm(
-                term_text=request.term,
-                context=request.context,
-            ).strip()
-
-            self.upsert_explanation(db, term_row.term_id, explanation_text)
-            source = Source.ai_guess
-        
-        target_lang = getattr(request.target_lang, "value", request.target_lang)
-        
-        # 응답용, DB 저장 안 함
-        translated_term_raw = translate_text(
-            text=request.term,
-            source_lang="ko",
-            target_lang=target_lang,
-        )            
-        
         if translated_term_raw is None:
             raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR, message="translated term explain failed")
 
-        if target_lang == "ko":
-            translated_explanation_raw = explanation_text
-        else:
-            translated_explanation_raw = translate_text(
-                text=explanation_text,
-                source_lang="ko",
-                target_lang=target_lang,
-            )
-        
-        translated_term = self._to_text(translated_term_raw)
-        translated_explanation = self._to_text(translated_explanation_raw)
-    
         if translated_explanation_raw is None:
             raise AppError(error_code=ErrorCode.INTERNAL_SERVER_ERROR, message="translated explanation failed")
 
+        translated_term = self._to_text(translated_term_raw)
+        translated_explanation = self._to_text(translated_explanation_raw)
         
         return TermExplainResponse(
             request_id=None,
             success=True,
             data=TermExplainData(
-                term=request.term,
+                term=term_name,
+                input_term=request.term if term_name != request.term else None,
                 source=source,
                 translated_term=translated_term,
                 explanation=explanation_text,
@@ -183,5 +501,215 @@ class TermService:
             ),
         )
 
+    def _translate_pair(self, term_text: str, explanation_text: str, target_lang: str) -> tuple[str, str]:
+        # 용어 + 설명을 배치 번역 한 번으로
+        result = translate_many(
+            texts=[term_text, explanation_text],
+            source_lang="ko",
+            target_lang=target_lang,
+        )
+        translated_term, translated_explanation = (item["translated_text"] for item in result["items"])
+        return translated_term, translated_explanation
+
+    async def _translate_pair_async(self, term_text: str, explanation_text: str, target_lang: str) -> tuple[str, str]:
+        result = await translate_many_async(
+            texts=[term_text, explanation_text],
+            source_lang="ko",
+            target_lang=target_lang,
+        )
+        translated_term, translated_explanation = (item["translated_text"] for item in result["items"])
+        return translated_term, translated_explanation
+
+    # ---------- 설명 흐름 (동기 / async 공용) ----------
+
+    def _term_id_plan(self, db: Session, term_name: str) -> ExplainPlan:
+        term_row = yield _Step("db", "find_term_by_name", (db, term_name))
+        if not term_row:
+            term_row = yield _Step("db", "create_term", (db, term_name))
+        return term_row.term_id
+
+    def _context_plan(
+        self,
+        db: Session,
+        request: TermExplainRequest,
+        term_name: str,
+        context_cls: str,
+        target_lang: str,
+        corrected: bool,
+    ) -> ExplainPlan:
+        """
+        context가 분류된 요청: (term_id, context_class) 설명을 재사용, 없으면 context를 넣어 생성 후 저장
+        - 번역은 따로 저장하지 않고 항상 translate_many로 (같은 설명 문장은 번역 메모리가 LLM 없이 재사용)
+          그래서 fused 호출(번역이 번역 메모리에 남지 않음)은 쓰지 않음
+        """
+        entry = get_term_index().get(term_name)
+        if entry is not None:
+            term_id = entry.term_id
+            explanation_text = entry.contexts.get(context_cls)
+        else:
+            term_id = yield from self._term_id_plan(db, term_name)
+            explanation_text = None
+
+        if explanation_text is None:
+            # 다른 워커가 저장했지만 아직 인덱스에 반영되지 않은 설명
+            explanation_text = yield _Step("db", "find_context_explanation", (db, term_id, context_cls))
+
+        if explanation_text is not None:
+            source = Source.db
+            _count_lookup("context_hits")
+        else:
+            explanation_text = (yield _Step("llm", "explain_by_llm", (term_name, request.context))).strip()
+            yield _Step("db", "save_context_explanation", (db, term_id, context_cls, explanation_text))
+            source = Source.ai_guess
+            _count_lookup("context_misses")
+
+        if corrected and source == Source.db:
+            _count_lookup("llm_calls_avoided")
+
+        if target_lang == "ko":
+            translated_term_raw, translated_explanation_raw = term_name, explanation_text
+        else:
+            translated_term_raw, translated_explanation_raw = yield _Step(
+                "llm", "_translate_pair", (term_name, explanation_text, target_lang)
+            )
+
+        response = self._build_response(
+            request, term_name, source, explanation_text, translated_term_raw, translated_explanation_raw
+        )
+        response.data.context_class = context_cls
+        return response
+
+    def _explain_plan(self, db: Session, request: TermExplainRequest) -> ExplainPlan:
+        """
+        용어 설명 요청 처리 흐름. DB / LLM 작업은 _Step으로 yield하고 결과를 돌려받음 (실행은 explain_term / explain_term_async)
+        - 오타 / 띄어쓰기 차이는 기존 용어로 보정한 뒤 조회 (새 term 행 / LLM 설명 생성 방지)
+        - context가 분류되면 문맥별 설명 캐시 사용 (term_context.context_class)
+        - 메모리 용어 인덱스에 설명 / 번역이 있으면 DB 조회 생략
+        - 처음 보는 용어는 설명 + 번역을 LLM 1번으로 (TERM_EXPLAIN_FUSED), 아니면 용어 + 설명을 배치 번역 1번으로
+        """
+        target_lang = getattr(request.target_lang, "value", request.target_lang)
+        fused = None
+        # 인덱스를 읽었으면 DB 없이 메모리에서만 보정
+        term_name, corrected = yield _Step(
+            "local" if get_term_index().loaded else "db", "resolve_term_name", (db, request.term)
+        )
+
+        context_cls = context_class(request.context) if TERM_CONTEXT_CACHE_ENABLED else None
+        if context_cls is not None:
+            return (yield from self._context_plan(db, request, term_name, context_cls, target_lang, corrected))
+        # 분류되지 않는 context는 기본 설명에 남기지 않음
+        base_context = None if TERM_CONTEXT_CACHE_ENABLED else request.context
+
+        entry = self.find_indexed_term(term_name)
+        if entry is not None:
+            term_id = entry.term_id
+            explanation_text = entry.explanation
+            source = Source.db
+        else:
+            term_id = yield from self._term_id_plan(db, term_name)
+            explanation_row = yield _Step("db", "find_explanation", (db, term_id))
+
+            if explanation_row:
+                explanation_text = explanation_row.explanation
+                source = Source.db
+            else:
+                # db에 없으면 LLM로 ko 설명 생성 후 db 저장 (가능하면 번역까지 한 번에)
+                if TERM_EXPLAIN_FUSED and target_lang != "ko":
+                    fused = yield _Step("llm", "explain_fused", (term_name, base_context, target_lang))
+
+                if fused is not None:
+                    explanation_text = fused[0]
+                else:
+                    explanation_text = (yield _Step("llm", "explain_by_llm", (term_name, base_context))).strip()
+
+                yield _Step("db", "upsert_explanation", (db, term_id, explanation_text))
+                source = Source.ai_guess
+
+        if corrected and source == Source.db:
+            _count_lookup("llm_calls_avoided")
+        source_hash = explanation_hash(term_name, explanation_text)
+
+        if target_lang == "ko":
+            translated_term_raw, translated_explanation_raw = term_name, explanation_text
+        else:
+            if fused is not None:
+                cached = None
+            elif entry is not None:
+                cached = entry.translations.get(target_lang)
+            elif source == Source.db:
+                cached = yield _Step("db", "find_translation", (db, term_id, target_lang, source_hash))
+            else:
+                cached = None
+
+            if cached is not None:
+                translated_term_raw, translated_explanation_raw = cached
+            else:
+                # 처음 요청된 언어: 번역 후 term_explanation_translation에 저장
+                if fused is not None:
+                    translated_term_raw, translated_explanation_raw = fused[1], fused[2]
+                else:
+                    translated_term_raw, translated_explanation_raw = yield _Step(
+                        "llm", "_translate_pair", (term_name, explanation_text, target_lang)
+                    )
+                yield _Step("db", "save_translation", (
+                    db, term_id, target_lang,
+                    self._to_text(translated_term_raw), self._to_text(translated_explanation_raw), source_hash,
+                ))
+
+        return self._build_response(
+            request, term_name, source, explanation_text, translated_term_raw, translated_explanation_raw
+        )
+
+    def explain_term(
+        self,
+        db: Session,
+        request: TermExplainRequest,
+    ) -> TermExplainResponse:
+        plan = self._explain_plan(db, request)
+        result = None
+        while True:
+            try:
+                step = plan.send(result)
+            except StopIteration as done:
+                return done.value
+            result = getattr(self, step.method)(*step.args)
+
+    async def explain_term_async(
+        self,
+        db: Session,
+        request: TermExplainRequest,
+    ) -> TermExplainResponse:
+        """
+        explain_term의 async 버전
+        - LLM / 번역은 *_async 메서드로, DB 작업은 threadpool에서 실행해서 이벤트 루프를 막지 않음
+        """
+        plan = self._explain_plan(db, request)
+        result = None
+        while True:
+            try:
+                step = plan.send(result)
+            except StopIteration as done:
+                return done.value
+            if step.kind == "llm":
+                result = await getattr(self, f"{step.method}_async")(*step.args)
+            elif step.kind == "db":
+                result = await run_in_threadpool(getattr(self, step.method), *step.args)
+            else:
+                result = getattr(self, step.method)(*step.args)
 
 term_service = TermService()
+
+
+def get_term_lookup_stats() -> dict:
+    with _lookup_stats_lock:
+        stats = dict(_lookup_stats)
+    stats["fuzzy_ratio"] = round(stats["fuzzy_resolved"] / stats["lookups"], 4) if stats["lookups"] else 0.0
+    stats["pg_trgm"] = int(_pg_trgm_ready)
+    return stats
+
+
+registry.register_collector(
+    "term_lookup",
+    "Term name lookups (exact / fuzzy) in this worker",
+    lambda: stats_to_samples(get_term_lookup_stats()),
+)
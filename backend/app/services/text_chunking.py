@@ -0,0 +1,149 @@
+"""
+긴 텍스트를 LLM 입력 단위(chunk)로 분할
+- 문단(빈 줄) 경계 우선, 문단이 예산을 넘으면 문장 경계, 문장도 넘으면 공백 기준으로 자름
+- chunk 사이의 원문 구분자(줄바꿈 등)를 보존해서 결과를 원래 순서/모양대로 재조립
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.services.openai_service import estimate_text_tokens
+from app.services.translation_memory import split_segments
+
+_PARAGRAPH_SPLIT_RE = re.compile(r"(\n\s*\n)")
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    text: str
+    separator: str  # 이 chunk 뒤에 오는 원문 구분자
+
+
+def _fits(text: str, max_tokens: int, max_chars: int) -> bool:
+    return len(text) <= max_chars and estimate_text_tokens(text) <= max_tokens
+
+
+def _hard_split(text: str, max_tokens: int, max_chars: int) -> list[tuple[str, str]]:
+    """
+    문장 하나가 예산을 넘는 경우: 예산 안에서 마지막 공백 위치로 자름 (공백이 없으면 글자 수로).
+    (조각, 뒤 구분자) 목록 반환
+    """
+    pieces: list[tuple[str, str]] = []
+    rest = text
+    while rest and not _fits(rest, max_tokens, max_chars):
+        cut = min(len(rest), max_chars)
+        while cut > 1 and not _fits(rest[:cut], max_tokens, max_chars):
+            cut = cut * 3 // 4
+        space = rest.rfind(" ", 0, cut)
+        if space > cut // 2:
+            pieces.append((rest[:space], " "))
+            rest = rest[space:].lstrip()
+        else:
+            pieces.append((rest[:cut], ""))
+            rest = rest[cut:]
+    if rest:
+        pieces.append((rest, ""))
+    return pieces
+
+
+def _units(text: str, max_tokens: int, max_chars: int) -> list[tuple[str, str]]:
+    """
+    (단위 텍스트, 뒤 구분자) 목록. 각 단위는 예산 안에 들어감
+    """
+    units: list[tuple[str, str]] = []
+
+    def add_separator(sep: str) -> None:
+        if units:
+            units[-1] = (units[-1][0], units[-1][1] + sep)
+
+    parts = _PARAGRAPH_SPLIT_RE.split(text)
+    for i in range(0, len(parts), 2):
+        paragraph = parts[i]
+        paragraph_sep = parts[i + 1] if i + 1 < len(parts) else ""
+
+        if not paragraph.strip():
+            add_separator(paragraph + paragraph_sep)
+            continue
+
+        if _fits(paragraph, max_tokens, max_chars):
+            units.append((paragraph, paragraph_sep))
+            continue
+
+        segments, separators = split_segments(paragraph)
+        add_separator(separators[0])
+        for segment, sep in zip(segments, separators[1:]):
+            pieces = _hard_split(segment, max_tokens, max_chars)
+            for piece, piece_sep in pieces[:-1]:
+                units.append((piece, piece_sep))
+            units.append((pieces[-1][0], sep))
+        add_separator(paragraph_sep)
+
+    return units
+
+
+def chunk_text(text: str, *, max_tokens: int, max_chars: int) -> list[TextChunk]:
+    """
+    예산(max_tokens 추정 토큰, max_chars 글자) 안에서 단위를 최대한 묶어 chunk 목록 반환
+    - "".join(c.text + c.separator for c in chunks) 는 원문과 (앞 공백 제외) 같음
+    """
+    chunks: list[TextChunk] = []
+    buffer = ""
+    pending_sep = ""
+
+    for unit, sep in _units(text, max_tokens, max_chars):
+        candidate = buffer + pending_sep + unit if buffer else unit
+        if buffer and not _fits(candidate, max_tokens, max_chars):
+            chunks.append(TextChunk(text=buffer, separator=pending_sep))
+            buffer = unit
+        else:
+            buffer = candidate
+        pending_sep = sep
+
+    if buffer:
+        chunks.append(TextChunk(text=buffer, separator=pending_sep))
+    return chunks
+
+
+def _is_anchor(unit: str, target_tokens: int) -> bool:
+    """
+    unit 뒤에서 chunk를 끊을지. unit 내용의 해시로만 정함 (앞뒤 문맥 / 문서 전체와 무관)
+    - 끊을 확률 = unit 토큰 / target_tokens -> chunk 평균 크기가 target_tokens 근처
+    """
+    digest = hashlib.blake2b(" ".join(unit.split()).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64 < min(1.0, estimate_text_tokens(unit) / target_tokens)
+
+
+def chunk_text_by_content(
+    text: str,
+    *,
+    max_tokens: int,
+    max_chars: int,
+    target_tokens: int,
+    anchor_key: Optional[Callable[[str], str]] = None,
+) -> list[TextChunk]:
+    """
+    chunk_text와 같은 단위(문단 -> 문장 -> 공백)를 쓰되 경계를 내용으로 정하는 분할 (content-defined chunking)
+    - 각 단위 뒤에서 끊을지는 그 단위 내용만으로 결정, 예산(max_tokens / max_chars)을 넘을 때만 강제로 끊음
+    - 한 페이지/슬라이드를 고치거나 지워도 그 근처 chunk만 바뀌고 나머지 chunk는 내용이 그대로 (요약 재사용)
+    - anchor_key: 경계 판단에만 쓸 단위 정규화 (예: 위치 번호 제거). chunk 텍스트는 원문 그대로
+    """
+    chunks: list[TextChunk] = []
+    buffer = ""
+    pending_sep = ""
+
+    for unit, sep in _units(text, max_tokens, max_chars):
+        candidate = buffer + pending_sep + unit if buffer else unit
+        if buffer and not _fits(candidate, max_tokens, max_chars):
+            chunks.append(TextChunk(text=buffer, separator=pending_sep))
+            candidate = unit
+        buffer, pending_sep = candidate, sep
+        if _is_anchor(anchor_key(unit) if anchor_key else unit, target_tokens):
+            chunks.append(TextChunk(text=buffer, separator=pending_sep))
+            buffer, pending_sep = "", ""
+
+    if buffer:
+        chunks.append(TextChunk(text=buffer, separator=pending_sep))
+    return chunks
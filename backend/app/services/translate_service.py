@@ -1,16 +1,60 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Optional
+import logging
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Generator, Optional
 
 import openai
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.services.openai_service import call_llm
+from app.core.config import (
+    TRANSLATION_MEMORY_ENABLED,
+    TRANSLATE_CHUNK_TOKENS,
+    TRANSLATE_CHUNK_CONCURRENCY,
+    TRANSLATE_CHUNK_RETRIES,
+    TRANSLATE_CHUNK_CONTEXT_CHARS,
+    TRANSLATE_DOCUMENT_MAX_CHARS,
+    TRANSLATE_BATCH_MAX_TEXTS,
+    TRANSLATE_BATCH_TOKENS,
+    TRANSLATE_BATCH_MAX_ITEMS,
+    TRANSLATE_BATCH_RETRIES,
+    TRANSLATE_BATCH_CONCURRENCY,
+    LLM_ROUTES,
+)
+from app.core.deadline import remaining_seconds
+from app.db.session import SessionLocal
+from app.services.openai_service import (
+    call_llm,
+    call_llm_async,
+    estimate_text_tokens,
+    route_llm,
+    LLMRoute,
+    OpenAIServiceError,
+)
+from app.services.translation_memory import (
+    TMPlan,
+    item_plan,
+    lookup_plan,
+    plan_translation,
+    save_translations,
+    segment_hash,
+    segment_plan,
+)
+from app.services.text_chunking import TextChunk, chunk_text
+from app.services.lang_detect import LANG_NAMES, confident_lang, guess_lang
 from app.exceptions.error import AppError, ErrorCode
 from app.models.enums import Lang
 
+logger = logging.getLogger("app")
+
 MAX_TEXT_LENGTH = 1000
 
+# 문장 여러 개를 한 번에 번역할 때 문장당 JSON 포장({"i":..,"text":..}) 토큰
+_SEGMENT_TOKEN_OVERHEAD = 8
+
 def _to_lang_enum_or_none(v: Optional[str | Lang]) -> Optional[Lang]:
     """
     입력이 Lang이면 그대로, 문자열이면 Lang(...)로 변환.
@@ -24,23 +68,27 @@ def _to_lang_enum_or_none(v: Optional[str | Lang]) -> Optional[Lang]:
     return Lang(str(v))
 
 
-def translate_text(
+def _validate_translation(
   *,
   text: str,
-  source_lang: Optional[str | Lang] = None,
+  source_lang: Optional[str | Lang],
   target_lang: str,
-) -> dict:
-    # ------- 입력 검증 ------
+  max_length: int = MAX_TEXT_LENGTH,
+  too_long_error: ErrorCode = ErrorCode.INVALID_TEXT,
+) -> tuple[Optional[Lang], Lang]:
+    """
+    입력 검증. (src_enum, tgt_enum) 반환
+    """
     if not text or not text.strip():
         raise AppError(
             error_code=ErrorCode.INVALID_TEXT,
             message="Input text is empty."
         )
     
-    if len(text) > MAX_TEXT_LENGTH:
+    if len(text) > max_length:
         raise AppError(
-            error_code=ErrorCode.INVALID_TEXT,
-            message=f"Input text is too long. Max {MAX_TEXT_LENGTH} chars."
+            error_code=too_long_error,
+            message=f"Input text is too long. Max {max_length} chars."
         )
         
     try:
@@ -54,87 +102,985 @@ def translate_text(
             message="lang must be one of: ko, en, uz",
 
         )
-        
-    src_line = (
-        f"Source language: {src_enum.value}"
-        if src_enum is not None
-        else "Source language: auto-detect"
-    )
-    
-    # -------- 프롬프트 -------
+
+    return src_enum, tgt_enum
+
+
+def _resolve_source_lang(text: str, src_enum: Optional[Lang]) -> Optional[Lang]:
+    """
+    source_lang이 없으면 로컬 감지 결과가 충분히 확실할 때 그 언어를 사용 (아니면 None -> LLM auto-detect)
+    """
+    if src_enum is not None:
+        return src_enum
+    detected = confident_lang(text)
+    return Lang(detected) if detected is not None else None
+
+
+def _identity_result(text: str, src_enum: Lang) -> dict:
+    # 원문 언어 == 번역 언어: LLM 없이 그대로 반환
+    return {
+        "detected_lang": src_enum.value,
+        "translated_text": text.strip(),
+    }
+
+
+def _task_lines(src_enum: Optional[Lang], tgt_enum: Lang, what: str) -> list[str]:
+    if src_enum is None:
+        return [
+            f"Your job: detect the input language, then translate {what} accurately and naturally.",
+        ]
+    return [
+        f"Translate {what} from {LANG_NAMES[src_enum.value]} to {LANG_NAMES[tgt_enum.value]} accurately and naturally.",
+    ]
+
+
+def _language_lines(src_enum: Optional[Lang], tgt_enum: Lang) -> list[str]:
+    return [
+        f"Source language: {src_enum.value if src_enum is not None else 'auto-detect'}",
+        f"Target language: {tgt_enum.value}",
+    ]
+
+
+def _output_format(src_enum: Optional[Lang], body: str) -> str:
+    # 원문 언어를 이미 알면 detected_lang 출력 생략 (감지 지시와 함께 프롬프트/출력 토큰 절약)
+    if src_enum is None:
+        return '{"detected_lang":"<language_code>",' + body + "}"
+    return "{" + body + "}"
+
+
+def _context_lines(context: Optional[str]) -> list[str]:
+    # 긴 문서 chunk 번역: 앞 chunk 꼬리를 용어/문체 일관성용으로만 제공
+    if not context:
+        return []
+    return [
+        "Preceding context (for consistency only; do NOT translate or include it):",
+        context,
+        "",
+    ]
+
+
+def _build_prompts(
+  text: str,
+  src_enum: Optional[Lang],
+  tgt_enum: Lang,
+  context: Optional[str] = None,
+) -> tuple[str, str]:
+    """
+    문장 1개(또는 전체 텍스트) 번역 프롬프트. (system_prompt, user_prompt) 반환
+    """
     system_prompt = "\n".join([
-        "You are a professional translation engine."
-        "Your job: detect the input language, then translate accurately and naturally."
-        "Return JSON only. No markdown. No code fences. No extra text."
-        "Language codes must be one of: ko, en, uz."
+        "You are a professional translation engine.",
+        *_task_lines(src_enum, tgt_enum, "the text"),
+        "Return JSON only. No markdown. No code fences. No extra text.",
+        *(["Language codes must be one of: ko, en, uz."] if src_enum is None else []),
     ])
     
     user_prompt = "\n".join([
-        f"{src_line}"
-        f"Target language: {tgt_enum.value}"
-        ""
-        "Text to translate:"
-        
-        "Output format (JSON only):"
-            '{"detected_lang":"<language_code>","translated_text":"<translated_text>"}'
-        f"{text}"
+        *_language_lines(src_enum, tgt_enum),
+        "",
+        "Output format (JSON only):",
+        _output_format(src_enum, '"translated_text":"<translated_text>"'),
+        "",
+        *_context_lines(context),
+        "Text to translate:",
+        text,
+    ])
+
+    return system_prompt, user_prompt
+
+
+def _build_segment_prompts(
+  segments: dict[int, str],
+  src_enum: Optional[Lang],
+  tgt_enum: Lang,
+  context: Optional[str] = None,
+  independent: bool = False,
+) -> tuple[str, str]:
+    """
+    여러 segment를 한 번에 번역하는 프롬프트 (index로 대응)
+    - independent=False: 한 텍스트의 TM 미적중 문장들
+    - independent=True: 서로 무관한 짧은 텍스트들 (배치 번역)
+    """
+    system_prompt = "\n".join([
+        "You are a professional translation engine.",
+        *_task_lines(src_enum, tgt_enum, "each segment"),
+        (
+            "Segments are independent short texts (UI labels, messages, terms); translate each on its own."
+            if independent
+            else "Segments are consecutive sentences of one text; keep terminology consistent across them."
+        ),
+        "Return every index exactly once. Do not merge or split segments.",
+        "Return JSON only. No markdown. No code fences. No extra text.",
+        *(["Language codes must be one of: ko, en, uz."] if src_enum is None else []),
     ])
+
+    user_prompt = "\n".join([
+        *_language_lines(src_enum, tgt_enum),
+        "",
+        "Output format (JSON only):",
+        _output_format(src_enum, '"translations":[{"i":<index>,"text":"<translated_text>"}]'),
+        "",
+        *_context_lines(context),
+        "Segments (JSON):",
+        json.dumps([{"i": i, "text": t} for i, t in segments.items()], ensure_ascii=False),
+    ])
+
+    return system_prompt, user_prompt
+
+
+def _translation_route(text: str, src_enum: Optional[Lang], target_lang: str) -> LLMRoute:
+    # JSON 출력이 원문보다 길어질 수 있으므로 (예: ko -> uz) 원문 길이 x 언어 확장 비율로 max_tokens 계산
+    return route_llm(
+        "translate",
+        text=text,
+        source_lang=src_enum.value if src_enum is not None else None,
+        target_lang=str(target_lang),
+    )
+
+
+def _parse_translation(llm_result: str, src_enum: Optional[Lang]) -> dict:
+    parsed = json.loads(llm_result.strip())
     
-    try:
-        llm_result  = call_llm(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            model="gpt-4o-mini",
-            temperature=0.3,
-            max_tokens=512,
-        )
-        
-        parsed = json.loads(llm_result.strip())
-        
-        llm_detected = parsed.get("detected_lang")
-        translated_text = parsed.get("translated_text")
+    llm_detected = parsed.get("detected_lang")
+    translated_text = parsed.get("translated_text")
 
-        if not translated_text or not isinstance(translated_text, str):
-            raise ValueError("LLM response missing translated_text.")
+    if not translated_text or not isinstance(translated_text, str):
+        raise ValueError("LLM response missing translated_text.")
 
-        detected_lang = src_enum.value if src_enum is not None else llm_detected
+    return {
+        "detected_lang": _detected_lang(llm_detected, src_enum),
+        "translated_text": translated_text,
+    }
 
-        if detected_lang is not None:
-            try:
-                detected_lang = Lang(detected_lang).value
-            except ValueError:
-                detected_lang = None
 
-        return {
-            "detected_lang": detected_lang,
-            "translated_text": translated_text,
-        }
+def _detected_lang(llm_detected: Optional[str], src_enum: Optional[Lang]) -> Optional[str]:
+    detected_lang = src_enum.value if src_enum is not None else llm_detected
 
-    except json.JSONDecodeError as e:
-        raise AppError(
+    if detected_lang is not None:
+        try:
+            detected_lang = Lang(detected_lang).value
+        except ValueError:
+            detected_lang = None
+
+    return detected_lang
+
+
+def _parse_segments(llm_result: str, indices: list[int]) -> tuple[dict[int, str], Optional[str]]:
+    """
+    ({index: 번역}, detected_lang) 반환. 응답에 없는(또는 잘못된) index는 dict에서 빠짐
+    """
+    parsed = json.loads(llm_result.strip())
+    items = parsed.get("translations")
+    if not isinstance(items, list):
+        raise ValueError("LLM response missing translations.")
+
+    translated: dict[int, str] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        i, text = item.get("i"), item.get("text")
+        if isinstance(i, int) and i in indices and isinstance(text, str) and text.strip():
+            translated[i] = text
+
+    return translated, parsed.get("detected_lang")
+
+
+def _to_translate_error(e: Exception) -> AppError:
+    if isinstance(e, json.JSONDecodeError):
+        return AppError(
             error_code=ErrorCode.SERVICE_UNAVAILABLE,
             message="Failed to parse LLM response as JSON.",
             detail={"reason":str(e)}
         )
 
-    
-    except openai.RateLimitError as e:
-        raise AppError(
+    if isinstance(e, OpenAIServiceError):
+        # e.error_code: RATE_LIMITED / UPSTREAM_ERROR / OPENAI_ERROR / INTERNAL_ERROR
+        if e.error_code == "RATE_LIMITED":
+            return AppError(error_code=ErrorCode.RATE_LIMITED, message=str(e))
+        if e.error_code == "DEADLINE_EXCEEDED":
+            return AppError(error_code=ErrorCode.REQUEST_TIMEOUT, message=str(e))
+        return AppError(error_code=ErrorCode.SERVICE_UNAVAILABLE, message=str(e))
+
+    if isinstance(e, openai.RateLimitError):
+        return AppError(
             error_code=ErrorCode.RATE_LIMITED,
             message="Rate limit exceeded when calling OpenAI API.",
             detail={"reason":str(e)}
         )
 
-    except (openai.APIConnectionError, openai.APIStatusError) as e:
-        raise AppError(
+    if isinstance(e, (openai.APIConnectionError, openai.APIStatusError)):
+        return AppError(
             error_code=ErrorCode.SERVICE_UNAVAILABLE,
             message="Upstream error occurred when calling OpenAI API.",
             detail={"reason":str(e)}
         )
         
+    return AppError(
+        error_code=ErrorCode.INTERNAL_SERVER_ERROR,
+        message="An internal error occurred during translation.",
+        detail={"reason":str(e)}
+    )
+
+
+# -----------------------------
+# 번역 메모리 연동 (DB 작업은 async 경로에서 to_thread로 실행)
+# -----------------------------
+def _tm_plan(text: str, src_enum: Optional[Lang], tgt_enum: Lang) -> Optional[TMPlan]:
+    if not TRANSLATION_MEMORY_ENABLED:
+        return None
+    db = SessionLocal()
+    try:
+        return plan_translation(
+            db,
+            text=text,
+            source_lang=src_enum.value if src_enum is not None else guess_lang(text),
+            target_lang=tgt_enum.value,
+        )
+    except SQLAlchemyError:
+        # TM 장애는 번역 실패로 이어지지 않도록 전체 번역으로 진행
+        db.rollback()
+        logger.warning("translation_memory_lookup_failed", exc_info=True)
+        return None
+    finally:
+        db.close()
+
+
+def _tm_save(plan: TMPlan, translated: dict[int, str]) -> None:
+    if not translated or not TRANSLATION_MEMORY_ENABLED:
+        return
+    db = SessionLocal()
+    try:
+        save_translations(db, plan, translated)
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("translation_memory_save_failed", exc_info=True)
+    finally:
+        db.close()
+
+
+def _segment_route(segments: dict[int, str], src_enum: Optional[Lang], tgt_enum: Lang) -> LLMRoute:
+    route = _translation_route("\n".join(segments.values()), src_enum, tgt_enum.value)
+    # {"i":..,"text":..} 포장 토큰만큼 여유
+    return replace(route, max_tokens=route.max_tokens + _SEGMENT_TOKEN_OVERHEAD * len(segments))
+
+
+def _tm_result(plan: TMPlan, detected_lang: Optional[str], src_enum: Optional[Lang]) -> dict:
+    return {
+        "detected_lang": _detected_lang(detected_lang or plan.source_lang, src_enum),
+        "translated_text": plan.assemble(),
+        "translation_memory": plan.stats(),
+    }
+
+
+def _call_translate(system_prompt: str, user_prompt: str, route: LLMRoute) -> str:
+    return call_llm(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        model=route.model,
+        temperature=route.temperature,
+        max_tokens=route.max_tokens,
+        feature="translate",
+    )
+
+
+async def _call_translate_async(system_prompt: str, user_prompt: str, route: LLMRoute) -> str:
+    return await call_llm_async(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        model=route.model,
+        temperature=route.temperature,
+        max_tokens=route.max_tokens,
+        feature="translate",
+    )
+
+
+# -----------------------------
+# 번역 흐름 (동기 / async 공용)
+# -----------------------------
+@dataclass(frozen=True)
+class _Step:
+    """
+    번역 흐름(_text_plan / _many_plan)이 요청하는 작업 하나
+    - kind: "db" (fn(*args), async에서는 to_thread), "llm" (args = (system_prompt, user_prompt, route) 목록 -> 응답 list)
+    """
+    kind: str
+    args: tuple
+    fn: Optional[Callable] = None
+
+
+# _Step을 yield하고 그 결과를 돌려받아 마지막에 응답 dict를 반환하는 generator
+_TranslatePlan = Generator[_Step, Any, dict]
+
+
+def _llm_step(*calls: tuple[str, str, LLMRoute]) -> _Step:
+    return _Step("llm", calls)
+
+
+async def _call_translate_all_async(calls: tuple) -> list[str]:
+    # 묶음 여러 개는 최대 TRANSLATE_BATCH_CONCURRENCY개씩 동시에 (하나가 실패하면 나머지는 취소)
+    if len(calls) == 1:
+        return [await _call_translate_async(*calls[0])]
+
+    semaphore = asyncio.Semaphore(max(1, TRANSLATE_BATCH_CONCURRENCY))
+
+    async def run(call: tuple[str, str, LLMRoute]) -> str:
+        async with semaphore:
+            return await _call_translate_async(*call)
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def _run_plan(plan: _TranslatePlan) -> dict:
+    """
+    번역 흐름을 동기로 실행. 작업에서 난 예외는 흐름 안으로 돌려보냄 (에러 변환은 흐름이 담당)
+    """
+    result, error = None, None
+    while True:
+        try:
+            step = plan.send(result) if error is None else plan.throw(error)
+        except StopIteration as done:
+            return done.value
+        result, error = None, None
+        try:
+            if step.kind == "llm":
+                result = [_call_translate(*call) for call in step.args]
+            else:
+                result = step.fn(*step.args)
+        except Exception as e:
+            error = e
+
+
+async def _run_plan_async(plan: _TranslatePlan) -> dict:
+    """
+    _run_plan의 async 버전. LLM은 call_llm_async로, DB 작업은 to_thread로 실행
+    """
+    result, error = None, None
+    while True:
+        try:
+            step = plan.send(result) if error is None else plan.throw(error)
+        except StopIteration as done:
+            return done.value
+        result, error = None, None
+        try:
+            if step.kind == "llm":
+                result = await _call_translate_all_async(step.args)
+            else:
+                result = await asyncio.to_thread(step.fn, *step.args)
+        except Exception as e:
+            error = e
+
+
+def _text_plan(
+  text: str,
+  source_lang: Optional[str | Lang],
+  target_lang: str,
+  context: Optional[str],
+) -> _TranslatePlan:
+    """
+    텍스트 1개 번역 흐름
+    - TM이 꺼져 있거나 조회에 실패하면 전체를 한 번에
+    - TM에 없는 문장이 1개면 그 문장만, 여러 개면 index JSON으로 한 번에 (문장 대응이 깨지면 전체를 다시)
+    """
+    src_enum, tgt_enum = _validate_translation(
+        text=text,
+        source_lang=source_lang,
+        target_lang=target_lang,
+    )
+    src_enum = _resolve_source_lang(text, src_enum)
+    if src_enum == tgt_enum:
+        return _identity_result(text, src_enum)
+
+    plan = yield _Step("db", (text, src_enum, tgt_enum), _tm_plan)
+
+    try:
+        if plan is None:
+            system_prompt, user_prompt = _build_prompts(text, src_enum, tgt_enum, context)
+            route = _translation_route(text, src_enum, tgt_enum.value)
+            (llm_result,) = yield _llm_step((system_prompt, user_prompt, route))
+            return _parse_translation(llm_result, src_enum)
+
+        missing = {i: plan.segments[i] for i in plan.missing_indices()}
+        detected_lang = None
+
+        if len(missing) == 1:
+            (i, segment), = missing.items()
+            system_prompt, user_prompt = _build_prompts(segment, src_enum, tgt_enum, context)
+            route = _translation_route(segment, src_enum, tgt_enum.value)
+            (llm_result,) = yield _llm_step((system_prompt, user_prompt, route))
+            parsed = _parse_translation(llm_result, src_enum)
+            translated, detected_lang = {i: parsed["translated_text"]}, parsed["detected_lang"]
+
+        elif missing:
+            system_prompt, user_prompt = _build_segment_prompts(missing, src_enum, tgt_enum, context)
+            route = _segment_route(missing, src_enum, tgt_enum)
+            (llm_result,) = yield _llm_step((system_prompt, user_prompt, route))
+            translated, detected_lang = _parse_segments(llm_result, list(missing))
+            if len(translated) != len(missing):
+                # 문장 대응이 깨진 응답: TM에 저장하지 않고 전체 텍스트를 한 번에 번역
+                system_prompt, user_prompt = _build_prompts(text, src_enum, tgt_enum, context)
+                route = _translation_route(text, src_enum, tgt_enum.value)
+                (llm_result,) = yield _llm_step((system_prompt, user_prompt, route))
+                result = _parse_translation(llm_result, src_enum)
+                return {**result, "translation_memory": plan.stats()}
+
+        else:
+            translated = {}
+
+    except Exception as e:
+        raise _to_translate_error(e)
+
+    for i, translated_text in translated.items():
+        plan.translations[i] = translated_text
+    yield _Step("db", (plan, translated), _tm_save)
+    return _tm_result(plan, detected_lang, src_enum)
+
+
+def translate_text(
+  *,
+  text: str,
+  source_lang: Optional[str | Lang] = None,
+  target_lang: str,
+  context: Optional[str] = None,
+) -> dict:
+    return _run_plan(_text_plan(text, source_lang, target_lang, context))
+
+
+async def translate_text_async(
+  *,
+  text: str,
+  source_lang: Optional[str | Lang] = None,
+  target_lang: str,
+  context: Optional[str] = None,
+) -> dict:
+    """
+    translate_text의 async 버전 (async 라우트에서 사용)
+    - context: 번역하지 않고 참고만 하는 앞 문맥 (긴 문서 chunk 번역용)
+    """
+    return await _run_plan_async(_text_plan(text, source_lang, target_lang, context))
+
+
+# -----------------------------
+# 긴 문서 번역 (PDF / PPTX)
+# -----------------------------
+# chunk 단위로 다시 시도할 만한 에러 (LLM 응답 파싱 실패 / 일시적 upstream 장애 / rate limit)
+_RETRYABLE_CHUNK_ERRORS = frozenset({ErrorCode.SERVICE_UNAVAILABLE, ErrorCode.RATE_LIMITED})
+_CHUNK_RETRY_BACKOFF_SECONDS = 0.5
+
+
+def _chunk_context(chunks: list[TextChunk], index: int) -> Optional[str]:
+    """
+    앞 chunk의 마지막 TRANSLATE_CHUNK_CONTEXT_CHARS 글자 (단어 중간에서 시작하지 않도록 공백 뒤부터)
+    """
+    if index == 0 or TRANSLATE_CHUNK_CONTEXT_CHARS <= 0:
+        return None
+    tail = chunks[index - 1].text[-TRANSLATE_CHUNK_CONTEXT_CHARS:]
+    space = tail.find(" ")
+    if 0 <= space < len(tail) // 2:
+        tail = tail[space + 1:]
+    return tail.strip() or None
+
+
+async def _translate_chunk(
+  chunk: TextChunk,
+  *,
+  context: Optional[str],
+  source_lang: Optional[Lang],
+  target_lang: Lang,
+) -> dict:
+    """
+    chunk 1개 번역. 재시도 가능한 에러는 TRANSLATE_CHUNK_RETRIES번까지 다시 시도 (남은 deadline 안에서만)
+    """
+    attempt = 0
+    while True:
+        try:
+            return await translate_text_async(
+                text=chunk.text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                context=context,
+            )
+        except AppError as e:
+            if e.error_code not in _RETRYABLE_CHUNK_ERRORS or attempt >= TRANSLATE_CHUNK_RETRIES:
+                raise
+            backoff = _CHUNK_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+            remaining = remaining_seconds()
+            if remaining is not None and remaining <= backoff:
+                raise
+            attempt += 1
+            logger.warning(
+                "translate_chunk_retry",
+                extra={"attempt": attempt, "error_code": e.error_code, "chunk_length": len(chunk.text)},
+            )
+            await asyncio.sleep(backoff)
+
+
+def _majority_lang(results: list[dict]) -> Optional[str]:
+    langs = [r.get("detected_lang") for r in results if r.get("detected_lang")]
+    return Counter(langs).most_common(1)[0][0] if langs else None
+
+
+async def translate_document_async(
+  *,
+  text: str,
+  source_lang: Optional[str | Lang] = None,
+  target_lang: str,
+) -> dict:
+    """
+    MAX_TEXT_LENGTH보다 긴 텍스트(PDF / PPTX 추출 결과) 번역
+    - 문단/문장 경계로 TRANSLATE_CHUNK_TOKENS 예산의 chunk로 나눠 최대 TRANSLATE_CHUNK_CONCURRENCY개씩 병렬 번역
+    - 각 chunk는 앞 chunk 꼬리를 context로 받아 용어/문체를 맞춤
+    - 결과는 원문 순서/구분자대로 재조립. 한 chunk라도 최종 실패하면 나머지를 취소하고 그 에러를 그대로 올림
+    """
+    if isinstance(source_lang, str) and source_lang == "auto":
+        source_lang = None
+
+    src_enum, tgt_enum = _validate_translation(
+        text=text,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        max_length=TRANSLATE_DOCUMENT_MAX_CHARS,
+        too_long_error=ErrorCode.INPUT_TOO_LONG,
+    )
+    src_enum = _resolve_source_lang(text, src_enum)
+    if src_enum == tgt_enum:
+        return {**_identity_result(text, src_enum), "chunks": 0}
+
+    if len(text) <= MAX_TEXT_LENGTH:
+        result = await translate_text_async(text=text, source_lang=src_enum, target_lang=tgt_enum)
+        return {**result, "chunks": 1}
+
+    chunks = chunk_text(text, max_tokens=TRANSLATE_CHUNK_TOKENS, max_chars=MAX_TEXT_LENGTH)
+    semaphore = asyncio.Semaphore(max(1, TRANSLATE_CHUNK_CONCURRENCY))
+
+    async def run(index: int) -> dict:
+        async with semaphore:
+            return await _translate_chunk(
+                chunks[index],
+                context=_chunk_context(chunks, index),
+                source_lang=src_enum,
+                target_lang=tgt_enum,
+            )
+
+    tasks = [asyncio.ensure_future(run(i)) for i in range(len(chunks))]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    translated_text = "".join(
+        result["translated_text"] + chunk.separator
+        for chunk, result in zip(chunks, results)
+    ).strip()
+
+    segments = sum(r["translation_memory"]["segments"] for r in results if r.get("translation_memory"))
+    hits = sum(r["translation_memory"]["hits"] for r in results if r.get("translation_memory"))
+
+    return {
+        "detected_lang": src_enum.value if src_enum is not None else _majority_lang(results),
+        "translated_text": translated_text,
+        "chunks": len(chunks),
+        "translation_memory": {
+            "segments": segments,
+            "hits": hits,
+            "hit_ratio": round(hits / segments, 4) if segments else 0.0,
+            "term_match": False,
+        } if segments else None,
+    }
+
+
+# -----------------------------
+# 배치 번역 (짧은 텍스트 여러 개, 같은 target_lang)
+# -----------------------------
+def _validate_batch(
+  *,
+  texts: list[str],
+  source_lang: Optional[str | Lang],
+  target_lang: str,
+) -> tuple[Optional[Lang], Lang]:
+    if not texts:
+        raise AppError(error_code=ErrorCode.INVALID_TEXT, message="texts is empty.")
+
+    if len(texts) > TRANSLATE_BATCH_MAX_TEXTS:
+        raise AppError(
+            error_code=ErrorCode.INPUT_TOO_LONG,
+            message=f"Too many texts. Max {TRANSLATE_BATCH_MAX_TEXTS} per request.",
+        )
+
+    for i, text in enumerate(texts):
+        if len(text) > MAX_TEXT_LENGTH:
+            raise AppError(
+                error_code=ErrorCode.INVALID_TEXT,
+                message=f"Input text is too long. Max {MAX_TEXT_LENGTH} chars.",
+                detail={"index": i},
+            )
+
+    # 빈 항목은 번역 없이 그대로 돌려주므로 언어 검증만 (비어 있지 않은 임의 텍스트로)
+    return _validate_translation(text="-", source_lang=source_lang, target_lang=target_lang)
+
+
+def _batch_identity(texts: list[str], src_enum: Optional[Lang], tgt_enum: Lang) -> set[int]:
+    """
+    번역이 필요 없는 항목 index: 빈 항목, 원문 언어 == 번역 언어 (지정된 source_lang 또는 항목별 로컬 감지)
+    """
+    if src_enum == tgt_enum:
+        return set(range(len(texts)))
+    if src_enum is not None:
+        return {i for i, t in enumerate(texts) if not t.strip()}
+    return {
+        i for i, t in enumerate(texts)
+        if not t.strip() or confident_lang(t) == tgt_enum.value
+    }
+
+
+def _batch_source_lang(items: list[str], src_enum: Optional[Lang], tgt_enum: Lang) -> Optional[Lang]:
+    resolved = _resolve_source_lang(" ".join(items), src_enum)
+    # 항목들을 합쳐서 본 언어가 target과 같으면 (항목별로는 불확실) LLM 감지에 맡김
+    return None if resolved == tgt_enum else resolved
+
+
+def _batch_plan(items: list[str], src_enum: Optional[Lang], tgt_enum: Lang) -> TMPlan:
+    plan = item_plan(
+        items,
+        source_lang=src_enum.value if src_enum is not None else guess_lang(" ".join(items)),
+        target_lang=tgt_enum.value,
+    )
+    if not TRANSLATION_MEMORY_ENABLED or not plan.segments:
+        return plan
+
+    db = SessionLocal()
+    try:
+        return lookup_plan(db, plan)
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("translation_memory_lookup_failed", exc_info=True)
+        return plan
+    finally:
+        db.close()
+
+
+def _pack_batches(pending: dict[int, str]) -> list[dict[int, str]]:
+    """
+    입력 토큰 예산(TRANSLATE_BATCH_TOKENS)과 항목 수(TRANSLATE_BATCH_MAX_ITEMS) 안에서 순서대로 묶음
+    """
+    batches: list[dict[int, str]] = []
+    current: dict[int, str] = {}
+    current_tokens = 0
+    for i, text in pending.items():
+        tokens = estimate_text_tokens(text) + _SEGMENT_TOKEN_OVERHEAD
+        if current and (
+            current_tokens + tokens > TRANSLATE_BATCH_TOKENS or len(current) >= TRANSLATE_BATCH_MAX_ITEMS
+        ):
+            batches.append(current)
+            current, current_tokens = {}, 0
+        current[i] = text
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _batch_prompts(
+  batch: dict[int, str],
+  src_enum: Optional[Lang],
+  tgt_enum: Lang,
+) -> tuple[str, str, LLMRoute]:
+    if len(batch) == 1:
+        (text,) = batch.values()
+        system_prompt, user_prompt = _build_prompts(text, src_enum, tgt_enum)
+        return system_prompt, user_prompt, _translation_route(text, src_enum, tgt_enum.value)
+    system_prompt, user_prompt = _build_segment_prompts(batch, src_enum, tgt_enum, independent=True)
+    return system_prompt, user_prompt, _segment_route(batch, src_enum, tgt_enum)
+
+
+def _parse_batch(llm_result: str, batch: dict[int, str], src_enum: Optional[Lang]) -> tuple[dict[int, str], Optional[str]]:
+    """
+    파싱 실패는 해당 묶음 전체를 "빠진 항목"으로 취급해 다음 라운드에서 재시도
+    """
+    try:
+        if len(batch) == 1:
+            (i,) = batch
+            parsed = _parse_translation(llm_result, src_enum)
+            return {i: parsed["translated_text"]}, parsed["detected_lang"]
+        return _parse_segments(llm_result, list(batch))
+    except (ValueError, AttributeError):
+        return {}, None
+
+
+def _batch_result(
+  texts: list[str],
+  identity: set[int],
+  plan: TMPlan,
+  detected_lang: Optional[str],
+  src_enum: Optional[Lang],
+  llm_calls: int,
+) -> dict:
+    by_hash = dict(zip(plan.hashes, plan.translations))
+    items = [
+        {"index": i, "translated_text": text.strip() if i in identity else by_hash[segment_hash(text)]}
+        for i, text in enumerate(texts)
+    ]
+    # 모든 항목이 그대로 반환된 경우(원문 == 번역 언어)는 target 언어가 원문 언어
+    fallback_lang = plan.source_lang if plan.segments else plan.target_lang
+    return {
+        "detected_lang": _detected_lang(detected_lang or fallback_lang, src_enum),
+        "items": items,
+        "llm_calls": llm_calls,
+        "translation_memory": plan.stats(),
+    }
+
+
+def _incomplete_batch_error(pending: dict[int, str]) -> AppError:
+    return AppError(
+        error_code=ErrorCode.SERVICE_UNAVAILABLE,
+        message="Failed to translate every item in the batch.",
+        detail={"missing": len(pending)},
+    )
+
+
+def _many_plan(
+  texts: list[str],
+  source_lang: Optional[str | Lang],
+  target_lang: str,
+) -> _TranslatePlan:
+    """
+    배치 번역 흐름. 한 라운드의 묶음들은 한 번의 "llm" 작업으로 요청 (async에서는 동시에)
+    """
+    src_enum, tgt_enum = _validate_batch(texts=texts, source_lang=source_lang, target_lang=target_lang)
+    identity = _batch_identity(texts, src_enum, tgt_enum)
+    items = [t for i, t in enumerate(texts) if i not in identity]
+    src_enum = _batch_source_lang(items, src_enum, tgt_enum)
+    plan = yield _Step("db", (items, src_enum, tgt_enum), _batch_plan)
+    pending = {i: plan.segments[i] for i in plan.missing_indices()}
+    translated: dict[int, str] = {}
+    detected_lang = None
+    llm_calls = 0
+
+    try:
+        for _ in range(TRANSLATE_BATCH_RETRIES + 1):
+            if not pending:
+                break
+            batches = _pack_batches(pending)
+            results = yield _llm_step(*(_batch_prompts(batch, src_enum, tgt_enum) for batch in batches))
+            llm_calls += len(batches)
+            for batch, llm_result in zip(batches, results):
+                got, lang = _parse_batch(llm_result, batch, src_enum)
+                translated.update(got)
+                detected_lang = detected_lang or lang
+            pending = {i: t for i, t in pending.items() if i not in translated}
     except Exception as e:
+        raise _to_translate_error(e)
+
+    if pending:
+        raise _incomplete_batch_error(pending)
+
+    for i, translated_text in translated.items():
+        plan.translations[i] = translated_text
+    yield _Step("db", (plan, translated), _tm_save)
+    return _batch_result(texts, identity, plan, detected_lang, src_enum, llm_calls)
+
+
+def translate_many(
+  *,
+  texts: list[str],
+  source_lang: Optional[str | Lang] = None,
+  target_lang: str,
+) -> dict:
+    """
+    짧은 텍스트 여러 개를 같은 target_lang으로 번역
+    - 같은 텍스트는 한 번만, TM 적중 항목은 LLM 없이
+    - 나머지는 토큰 예산 안에서 index JSON 배열로 묶어 호출. 응답에서 빠진 항목만 다시 묶어 TRANSLATE_BATCH_RETRIES번까지 재요청
+    - 결과 items는 입력 순서 그대로 ({"index", "translated_text"})
+    """
+    return _run_plan(_many_plan(texts, source_lang, target_lang))
+
+
+async def translate_many_async(
+  *,
+  texts: list[str],
+  source_lang: Optional[str | Lang] = None,
+  target_lang: str,
+) -> dict:
+    """
+    translate_many의 async 버전. 한 라운드의 묶음들은 최대 TRANSLATE_BATCH_CONCURRENCY개씩 동시에 호출
+    """
+    return await _run_plan_async(_many_plan(texts, source_lang, target_lang))
+
+
+# -----------------------------
+# 다중 target 번역 (같은 원문 -> 여러 언어, 예: ko -> en, uz)
+# -----------------------------
+def _validate_targets(target_langs: list[str | Lang]) -> list[Lang]:
+    targets: list[Lang] = []
+    try:
+        for lang in target_langs:
+            tgt_enum = _to_lang_enum_or_none(lang)
+            if tgt_enum is not None and tgt_enum not in targets:
+                targets.append(tgt_enum)
+    except ValueError:
+        targets = []
+    if not targets:
         raise AppError(
-            error_code=ErrorCode.INTERNAL_SERVER_ERROR,
-            message="An internal error occurred during translation.",
-            detail={"reason":str(e)}
-        )
\ No newline at end of file
+            error_code=ErrorCode.INVALID_USER_LANG,
+            message="lang must be one of: ko, en, uz",
+        )
+    return targets
+
+
+def _build_multi_prompts(
+  segments: dict[int, str],
+  src_enum: Optional[Lang],
+  tgt_enums: list[Lang],
+) -> tuple[str, str]:
+    """
+    문장들을 여러 target 언어로 한 번에 번역하는 프롬프트 ({"i", "<lang>": ...} 배열)
+    """
+    names = ", ".join(LANG_NAMES[t.value] for t in tgt_enums)
+    task = (
+        f"Your job: detect the input language, then translate each segment into each target language ({names})."
+        if src_enum is None
+        else f"Translate each segment from {LANG_NAMES[src_enum.value]} into each target language ({names})."
+    )
+    system_prompt = "\n".join([
+        "You are a professional translation engine.",
+        task,
+        "Translate accurately and naturally; keep terminology consistent across segments and languages.",
+        "Return every index exactly once, with a translation for every target language code.",
+        "Return JSON only. No markdown. No code fences. No extra text.",
+        *(["Language codes must be one of: ko, en, uz."] if src_enum is None else []),
+    ])
+
+    item = ",".join(['"i":<index>'] + [f'"{t.value}":"<{LANG_NAMES[t.value]} translation>"' for t in tgt_enums])
+    user_prompt = "\n".join([
+        f"Source language: {src_enum.value if src_enum is not None else 'auto-detect'}",
+        f"Target languages: {', '.join(t.value for t in tgt_enums)}",
+        "",
+        "Output format (JSON only):",
+        _output_format(src_enum, '"translations":[{' + item + '}]'),
+        "",
+        "Segments (JSON):",
+        json.dumps([{"i": i, "text": t} for i, t in segments.items()], ensure_ascii=False),
+    ])
+
+    return system_prompt, user_prompt
+
+
+def _parse_multi(
+  llm_result: str,
+  indices: list[int],
+  tgt_enums: list[Lang],
+) -> tuple[dict[Lang, dict[int, str]], Optional[str]]:
+    """
+    ({target: {index: 번역}}, detected_lang). 빠진 (index, 언어)는 결과에서 빠짐
+    """
+    try:
+        parsed = json.loads(llm_result.strip())
+        items = parsed.get("translations")
+    except (ValueError, AttributeError):
+        return {t: {} for t in tgt_enums}, None
+    if not isinstance(items, list):
+        return {t: {} for t in tgt_enums}, None
+
+    translated: dict[Lang, dict[int, str]] = {t: {} for t in tgt_enums}
+    for item in items:
+        if not isinstance(item, dict) or item.get("i") not in indices:
+            continue
+        for t in tgt_enums:
+            text = item.get(t.value)
+            if isinstance(text, str) and text.strip():
+                translated[t][item["i"]] = text
+    return translated, parsed.get("detected_lang")
+
+
+def _multi_plan(text: str, src_enum: Optional[Lang], tgt_enum: Lang) -> TMPlan:
+    # TM이 꺼져 있어도 문장 단위 계획은 필요 (한 번의 호출로 모든 target을 받기 위해)
+    return _tm_plan(text, src_enum, tgt_enum) or segment_plan(
+        text,
+        source_lang=src_enum.value if src_enum is not None else guess_lang(text),
+        target_lang=tgt_enum.value,
+    )
+
+
+async def translate_multi_async(
+  *,
+  text: str,
+  source_lang: Optional[str | Lang] = None,
+  target_langs: list[str | Lang],
+) -> dict:
+    """
+    같은 원문을 여러 target 언어로 번역. {"detected_lang", "translations": {lang: text}, "fused"} 반환
+    - 원문 언어와 같은 target은 그대로, TM에서 모두 찾은 target은 LLM 없이
+    - 나머지 target들의 출력 토큰 합이 translate 기능의 max_tokens 안이면 LLM 1번으로 전부 번역 (fused),
+      넘거나 응답에서 빠진 target은 target별로 동시에 translate_text_async
+    """
+    tgt_enums = _validate_targets(target_langs)
+    src_enum, _ = _validate_translation(text=text, source_lang=source_lang, target_lang=tgt_enums[0])
+    src_enum = _resolve_source_lang(text, src_enum)
+
+    translations: dict[str, str] = {}
+    detected_lang: Optional[str] = None
+    pending = [t for t in tgt_enums if t != src_enum]
+    for t in tgt_enums:
+        if t == src_enum:
+            translations[t.value] = text.strip()
+
+    plans = dict(zip(pending, await asyncio.gather(
+        *(asyncio.to_thread(_multi_plan, text, src_enum, t) for t in pending)
+    )))
+    for t, plan in plans.items():
+        if not plan.missing_indices():
+            translations[t.value] = plan.assemble()
+    needed = [t for t in pending if t.value not in translations]
+
+    fused = False
+    if len(needed) >= 2:
+        missing = sorted({i for t in needed for i in plans[t].missing_indices()})
+        segments = {i: plans[needed[0]].segments[i] for i in missing}
+        routes = [_segment_route(segments, src_enum, t) for t in needed]
+        max_tokens = sum(r.max_tokens for r in routes)
+
+        if max_tokens <= LLM_ROUTES["translate"]["max_tokens"]:
+            system_prompt, user_prompt = _build_multi_prompts(segments, src_enum, needed)
+            route = replace(routes[0], max_tokens=max_tokens)
+            try:
+                llm_result = await _call_translate_async(system_prompt, user_prompt, route)
+            except Exception as e:
+                raise _to_translate_error(e)
+            by_target, detected_lang = _parse_multi(llm_result, missing, needed)
+
+            saves = []
+            for t in needed:
+                plan = plans[t]
+                new = {i: by_target[t][i] for i in plan.missing_indices() if i in by_target[t]}
+                if len(new) != len(plan.missing_indices()):
+                    continue  # 빠진 문장이 있는 target은 아래에서 따로 번역
+                for i, translated_text in new.items():
+                    plan.translations[i] = translated_text
+                translations[t.value] = plan.assemble()
+                saves.append(asyncio.to_thread(_tm_save, plan, new))
+            await asyncio.gather(*saves)
+            fused = bool(saves)
+
+    rest = [t for t in needed if t.value not in translations]
+    results = await asyncio.gather(*(
+        translate_text_async(text=text, source_lang=src_enum, target_lang=t) for t in rest
+    ))
+    for t, result in zip(rest, results):
+        translations[t.value] = result["translated_text"]
+        detected_lang = detected_lang or result.get("detected_lang")
+
+    if src_enum is None and detected_lang is None and plans:
+        detected_lang = next(iter(plans.values())).source_lang
+
+    return {
+        "detected_lang": _detected_lang(detected_lang, src_enum),
+        "translations": {t.value: translations[t.value] for t in tgt_enums},
+        "fused": fused,
+    }
@@ -0,0 +1,278 @@
+"""
+문장 단위 번역 메모리 (translation memory, TM)
+- 원문을 문장으로 나누고 (정규화 해시, source_lang, target_lang)로 translation_memory 테이블 조회
+- 적중한 문장은 저장된 번역을 그대로 쓰고, 못 찾은 문장만 LLM으로 번역한 뒤 다시 저장
+- 입력 전체가 term 테이블의 용어와 정확히 일치하면 문장 분할 없이 한 단위로 처리 (저장된 용어 번역이 있으면 그대로 사용)
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.metrics import registry, stats_to_samples
+from app.models.term import Term
+from app.models.term_explanation import TermExplanation
+from app.models.term_explanation_translation import TermExplanationTranslation
+from app.models.translation_memory import TranslationMemory
+from app.services.term_index import explanation_hash, get_term_index
+
+# 문장 끝(. ! ? 。 ？ ！) 뒤 공백 또는 줄바꿈에서 분리. 구분자는 재조립을 위해 보존
+_SEGMENT_SPLIT_RE = re.compile(r"((?<=[.!?。？！])\s+|\n+)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_segment(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def segment_hash(text: str) -> str:
+    return hashlib.sha256(normalize_segment(text).encode("utf-8")).hexdigest()
+
+
+def split_segments(text: str) -> tuple[list[str], list[str]]:
+    """
+    (문장 목록, 구분자 목록) 반환. 앞뒤 공백은 구분자로 취급
+    - len(separators) == len(segments) + 1 (첫 문장 앞 / 문장 사이 / 마지막 문장 뒤)
+    """
+    parts = _SEGMENT_SPLIT_RE.split(text)
+    segments: list[str] = []
+    separators: list[str] = [""]
+    for i, part in enumerate(parts):
+        if i % 2:
+            separators[-1] += part
+            continue
+        stripped = part.strip()
+        if not stripped:
+            separators[-1] += part
+            continue
+        leading = part[: len(part) - len(part.lstrip())]
+        trailing = part[len(part.rstrip()):]
+        separators[-1] += leading
+        segments.append(stripped)
+        separators.append(trailing)
+    return segments, separators
+
+
+# -----------------------------
+# 요청 1건의 번역 계획
+# -----------------------------
+@dataclass
+class TMPlan:
+    source_lang: str
+    target_lang: str
+    segments: list[str]
+    separators: list[str]
+    translations: list[Optional[str]]
+    hashes: list[str] = field(default_factory=list)
+    term_match: bool = False
+    lookup_hits: int = 0
+
+    @property
+    def hits(self) -> int:
+        return sum(1 for t in self.translations if t is not None)
+
+    def missing_indices(self) -> list[int]:
+        return [i for i, t in enumerate(self.translations) if t is None]
+
+    def assemble(self) -> str:
+        out = [self.separators[0]]
+        for translated, sep in zip(self.translations, self.separators[1:]):
+            out.append(translated or "")
+            out.append(sep)
+        return "".join(out).strip()
+
+    def stats(self) -> dict:
+        total = len(self.segments)
+        return {
+            "segments": total,
+            "hits": self.lookup_hits,
+            "hit_ratio": round(self.lookup_hits / total, 4) if total else 0.0,
+            "term_match": self.term_match,
+        }
+
+
+def _match_term(db, text: str, target_lang: str) -> tuple[bool, Optional[str]]:
+    """
+    (입력 전체가 용어인지, 저장된 용어 번역) 반환
+    - 번역은 term_explanation_translation에서 현재 설명 기준으로 유효한 것만 사용
+    """
+    normalized = normalize_segment(text)
+    if not normalized or len(normalized) > 100:
+        return False, None
+    # 메모리 용어 인덱스가 올라와 있으면 DB 조회 생략
+    index = get_term_index()
+    if index.loaded:
+        entry = index.get(normalized)
+        if entry is None:
+            return False, None
+        translated_term, _ = entry.translations.get(target_lang, (None, None))
+        return True, translated_term
+    row = db.execute(
+        select(Term.term_name, TermExplanation.explanation, TermExplanationTranslation)
+        .outerjoin(TermExplanation, TermExplanation.term_id == Term.term_id)
+        .outerjoin(
+            TermExplanationTranslation,
+            (TermExplanationTranslation.term_id == Term.term_id) & (TermExplanationTranslation.lang == target_lang),
+        )
+        .where(Term.term_name == normalized)
+        .limit(1)
+    ).first()
+    if row is None:
+        return False, None
+    stored = row.TermExplanationTranslation
+    if stored is None or not row.explanation or stored.source_hash != explanation_hash(row.term_name, row.explanation):
+        return True, None
+    return True, stored.translated_term
+
+
+def segment_plan(text: str, *, source_lang: str, target_lang: str, whole: bool = False) -> TMPlan:
+    """
+    DB 조회 없이 문장 분할만 한 계획 (whole=True면 분할하지 않음)
+    """
+    if whole:
+        segments, separators = [text.strip()], ["", ""]
+    else:
+        segments, separators = split_segments(text)
+    return TMPlan(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        segments=segments,
+        separators=separators,
+        translations=[None] * len(segments),
+        hashes=[segment_hash(s) for s in segments],
+        term_match=whole,
+    )
+
+
+def plan_translation(db, *, text: str, source_lang: str, target_lang: str) -> TMPlan:
+    """
+    문장 분할 + TM 일괄 조회. 적중한 행은 hit_count / last_used_at 갱신
+    - 입력 전체가 용어이고 저장된 용어 번역이 있으면 그 번역으로 채움
+    """
+    is_term, translated_term = _match_term(db, text, target_lang)
+    plan = segment_plan(text, source_lang=source_lang, target_lang=target_lang, whole=is_term)
+    if translated_term:
+        # 용어 번역이 이미 저장되어 있으면 TM 조회 / LLM 호출 없이 그대로 사용
+        plan.translations[0] = translated_term
+        plan.lookup_hits = plan.hits
+        _record(plan)
+        return plan
+    return lookup_plan(db, plan)
+
+
+def item_plan(items: list[str], *, source_lang: str, target_lang: str) -> TMPlan:
+    """
+    독립된 짧은 텍스트 여러 개(배치 번역)용 계획. 문장 분할 없이 항목 하나가 segment 하나
+    - 같은 텍스트(정규화 기준)는 한 번만 포함
+    """
+    segments: list[str] = []
+    hashes: list[str] = []
+    for item in items:
+        h = segment_hash(item)
+        if h not in hashes:
+            segments.append(item.strip())
+            hashes.append(h)
+    return TMPlan(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        segments=segments,
+        separators=[""] * (len(segments) + 1),
+        translations=[None] * len(segments),
+        hashes=hashes,
+    )
+
+
+def lookup_plan(db, plan: TMPlan) -> TMPlan:
+    """
+    plan의 segment를 TM에서 일괄 조회해 translations를 채움
+    """
+    if not plan.segments:
+        return plan
+
+    rows = db.execute(
+        select(TranslationMemory.tm_id, TranslationMemory.source_hash, TranslationMemory.translated_text)
+        .where(
+            TranslationMemory.source_hash.in_(set(plan.hashes)),
+            TranslationMemory.source_lang == plan.source_lang,
+            TranslationMemory.target_lang == plan.target_lang,
+        )
+    ).all()
+    found = {row.source_hash: row.translated_text for row in rows}
+    for i, h in enumerate(plan.hashes):
+        plan.translations[i] = found.get(h)
+    plan.lookup_hits = plan.hits
+
+    if rows:
+        db.execute(
+            update(TranslationMemory)
+            .where(TranslationMemory.tm_id.in_([row.tm_id for row in rows]))
+            .values(hit_count=TranslationMemory.hit_count + 1, last_used_at=func.now())
+        )
+        db.commit()
+
+    _record(plan)
+    return plan
+
+
+def save_translations(db, plan: TMPlan, translated: dict[int, str]) -> int:
+    """
+    새로 번역한 문장을 TM에 저장. 다른 요청이 먼저 저장한 문장은 건너뜀. 저장한 행 수 반환
+    """
+    saved = 0
+    seen: set[str] = set()
+    for i, translated_text in translated.items():
+        h = plan.hashes[i]
+        if h in seen or not translated_text or not translated_text.strip():
+            continue
+        seen.add(h)
+        try:
+            with db.begin_nested():
+                db.add(TranslationMemory(
+                    source_hash=h,
+                    source_lang=plan.source_lang,
+                    target_lang=plan.target_lang,
+                    source_text=normalize_segment(plan.segments[i]),
+                    translated_text=translated_text.strip(),
+                    hit_count=0,
+                ))
+            saved += 1
+        except IntegrityError:
+            pass
+    db.commit()
+    return saved
+
+
+# -----------------------------
+# 통계 (워커 단위)
+# -----------------------------
+_stats = {"requests": 0, "segments": 0, "hits": 0, "term_matches": 0}
+_stats_lock = threading.Lock()
+
+
+def _record(plan: TMPlan) -> None:
+    with _stats_lock:
+        _stats["requests"] += 1
+        _stats["segments"] += len(plan.segments)
+        _stats["hits"] += plan.hits
+        _stats["term_matches"] += 1 if plan.term_match else 0
+
+
+def get_translation_memory_stats() -> dict:
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["hit_ratio"] = round(stats["hits"] / stats["segments"], 4) if stats["segments"] else 0.0
+    return stats
+
+
+registry.register_collector(
+    "translation_memory",
+    "Sentence-level translation memory lookups in this worker",
+    lambda: stats_to_samples(get_translation_memory_stats()),
+)
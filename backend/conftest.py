@@ -0,0 +1,23 @@
+"""
+pytest 공통 설정
+- app 모듈은 import 시점에 DATABASE_URL을 읽으므로 테스트용 in-memory SQLite 기본값을 둠
+- 같은 폴더의 기존 test_*.py 중 서버 / DB에 바로 요청하는 수동 점검 스크립트는 수집하지 않음
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+collect_ignore = [
+    "test_api.py",
+    "test_auto_title.py",
+    "test_chat_tables.py",
+    "test_complete_flow.py",
+    "test_endpoints.py",
+    "test_general_chat.py",
+    "test_openai.py",
+    "test_raw_sql.py",
+    "test_real_user.py",
+    "test_repro_db.py",
+    "test_title_gen.py",
+    "simple_test.py",
+]
@@ -0,0 +1,50 @@
+"""
+lang_detect 로컬 언어 감지 (ko / en / uz, 섞인 텍스트)
+"""
+import pytest
+
+from app.services.lang_detect import confident_lang, detect_lang, guess_lang
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        ("안녕하세요, 오늘 수업은 어디서 하나요?", "ko"),
+        ("오늘 LMS에서 과제를 제출해야 합니다", "ko"),
+        ("Where is the library and when does it open?", "en"),
+        ("dog's toy is on the table", "en"),
+        ("Salom, bugun dars qayerda boʻladi? Men kutubxonaga bormoqchiman.", "uz"),
+        ("Bu kitob juda yaxshi va foydali", "uz"),
+        ("Привет, как дела", "uz"),
+    ],
+)
+def test_detects_single_language(text, lang):
+    detection = detect_lang(text)
+    assert detection.lang == lang
+    assert detection.confident
+    assert not detection.mixed
+    assert confident_lang(text) == lang
+
+
+def test_mixed_text_is_not_confident():
+    text = "이번 학기 수업은 정말 어렵네요. The midterm exam is next week and I am not ready at all."
+    detection = detect_lang(text)
+    assert detection.mixed
+    assert set(detection.scores) == {"ko", "en", "uz"}
+    assert detection.scores["ko"] >= 0.2 and detection.scores["en"] >= 0.2
+    assert confident_lang(text) is None
+    assert guess_lang(text) in ("ko", "en")
+
+
+@pytest.mark.parametrize("text", ["", "12345 !!!"])
+def test_no_letters(text):
+    detection = detect_lang(text)
+    assert detection.lang is None
+    assert detection.confidence == 0.0
+    assert confident_lang(text) is None
+    assert guess_lang(text) == "en"
+
+
+def test_short_latin_text_is_left_to_the_llm():
+    assert detect_lang("ok").lang == "en"
+    assert confident_lang("ok") is None
@@ -0,0 +1,51 @@
+"""
+TermIndex.find_all 위치가 입력 텍스트(NFC 정규화 전) 기준인지 확인
+"""
+import unicodedata
+
+import pytest
+
+from app.services.term_index import TermEntry, build_term_index
+
+
+@pytest.fixture(scope="module")
+def index():
+    return build_term_index([
+        TermEntry(term_id=1, term_name="중도", explanation=None),
+        TermEntry(term_id=2, term_name="중앙도서관", explanation=None),
+        TermEntry(term_id=3, term_name="LMS", explanation=None),
+        TermEntry(term_id=4, term_name="쪽문", explanation=None),
+    ])
+
+
+def _found(index, text):
+    return [(m.term_name, text[m.start:m.end]) for m in index.find_all(text)]
+
+
+def test_nfc_offsets_are_identity(index):
+    text = "오늘 중도에서 LMS 보고 쪽문"
+    matches = index.find_all(text)
+    assert [(m.term_name, m.start, m.end) for m in matches] == [("중도", 3, 5), ("LMS", 8, 11), ("쪽문", 15, 17)]
+
+
+def test_nfd_offsets_map_back_to_input(index):
+    text = unicodedata.normalize("NFD", "오늘 중도에서 LMS 보고 쪽문")
+    matches = index.find_all(text)
+    assert [m.term_name for m in matches] == ["중도", "LMS", "쪽문"]
+    for m in matches:
+        assert unicodedata.normalize("NFC", text[m.start:m.end]) == m.term_name
+    # 조합형 한글은 한 글자가 자모 2~3개
+    assert matches[0].end - matches[0].start == len(unicodedata.normalize("NFD", "중도"))
+
+
+def test_mixed_normalization_prefers_longest(index):
+    text = unicodedata.normalize("NFD", "중앙도서관") + " 중도"
+    assert [(name, unicodedata.normalize("NFC", span)) for name, span in _found(index, text)] == [
+        ("중앙도서관", "중앙도서관"),
+        ("중도", "중도"),
+    ]
+
+
+def test_word_boundaries(index):
+    assert _found(index, "학교중도") == []
+    assert _found(index, "LMSX LMS에서") == [("LMS", "LMS")]
@@ -0,0 +1,69 @@
+"""
+text_chunking 분할 결과를 이어 붙이면 원문이 그대로 나오는지 확인
+"""
+import pytest
+
+from app.services.text_chunking import chunk_text, chunk_text_by_content
+
+MAX_TOKENS = 50
+MAX_CHARS = 300
+
+TEXTS = [
+    "",
+    "one",
+    "첫 문단입니다. 둘째 문장!\n\n둘째 문단\n\n\n셋째   문단 끝.  ",
+    "  leading\n\n" + "가나다라 " * 500 + "\n\nend",
+    "x" * 3000,
+    "Sentence number one is here. " * 200,
+    "\n".join(f"[Slide {i}] 슬라이드 {i}의 내용입니다." for i in range(1, 60)),
+]
+
+
+def _chunkers():
+    return [
+        lambda text: chunk_text(text, max_tokens=MAX_TOKENS, max_chars=MAX_CHARS),
+        lambda text: chunk_text_by_content(
+            text, max_tokens=MAX_TOKENS, max_chars=MAX_CHARS, target_tokens=MAX_TOKENS // 2
+        ),
+    ]
+
+
+@pytest.mark.parametrize("chunker", _chunkers(), ids=["chunk_text", "chunk_text_by_content"])
+@pytest.mark.parametrize("text", TEXTS)
+def test_round_trip(chunker, text):
+    chunks = chunker(text)
+    assert "".join(c.text + c.separator for c in chunks) == text
+    assert all(c.text for c in chunks)
+    assert all(len(c.text) <= MAX_CHARS for c in chunks)
+
+
+def test_content_defined_boundaries_survive_an_edit():
+    paragraphs = [f"{i}번 문단은 강의 내용 중 중요한 개념을 설명합니다. " * 3 for i in range(60)]
+    before = chunk_text_by_content(
+        "\n\n".join(paragraphs), max_tokens=MAX_TOKENS, max_chars=MAX_CHARS, target_tokens=MAX_TOKENS // 2
+    )
+    paragraphs[30] = paragraphs[30].replace("중요한", "새로 추가된")
+    after = chunk_text_by_content(
+        "\n\n".join(paragraphs), max_tokens=MAX_TOKENS, max_chars=MAX_CHARS, target_tokens=MAX_TOKENS // 2
+    )
+    unchanged = {c.text for c in before} & {c.text for c in after}
+    assert len(unchanged) >= len(before) - 3
+
+
+def test_anchor_key_ignores_position_numbers():
+    def deck(first):
+        slides = ([first] if first else []) + [f"주제 {chr(0xAC00 + k * 37)} 설명." for k in range(80)]
+        return "\n\n".join(f"[Slide {i}] {body}" for i, body in enumerate(slides, 1))
+
+    def strip(unit):
+        return unit.split("] ", 1)[-1]
+
+    def bodies(text):
+        chunks = chunk_text_by_content(
+            text, max_tokens=MAX_TOKENS, max_chars=MAX_CHARS, target_tokens=MAX_TOKENS // 2, anchor_key=strip
+        )
+        return {"\n\n".join(strip(p) for p in c.text.split("\n\n")) for c in chunks}
+
+    before, after = bodies(deck(None)), bodies(deck("새 슬라이드입니다."))
+    # 슬라이드 하나를 앞에 끼워 넣어도 첫 chunk 말고는 그대로
+    assert len(before & after) >= len(before) - 1
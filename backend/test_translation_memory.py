@@ -0,0 +1,60 @@
+"""
+번역 메모리 문장 분할 / 해시 / 재조립 순서
+"""
+import unicodedata
+
+import pytest
+
+from app.services.translation_memory import item_plan, segment_hash, segment_plan, split_segments
+
+TEXTS = [
+    "첫 문장. 둘째 문장!\n\n셋째?  넷째",
+    "  앞 공백. 끝 ",
+    "no split here",
+    "One. Two.\nThree! 넷。다섯",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_split_segments_round_trip(text):
+    segments, separators = split_segments(text)
+    assert len(separators) == len(segments) + 1
+    assert all(s and s == s.strip() for s in segments)
+    rebuilt = separators[0] + "".join(s + sep for s, sep in zip(segments, separators[1:]))
+    assert rebuilt == text
+
+
+def test_assemble_keeps_segment_order_and_separators():
+    plan = segment_plan("A one. B two.\nC three.", source_lang="en", target_lang="ko")
+    assert plan.segments == ["A one.", "B two.", "C three."]
+    assert plan.missing_indices() == [0, 1, 2]
+
+    # 번역이 어떤 순서로 채워져도 원래 자리에 들어감
+    for i, translated in reversed(list(enumerate(["가.", "나.", "다."]))):
+        plan.translations[i] = translated
+    assert plan.assemble() == "가. 나.\n다."
+
+
+def test_whole_plan_is_one_segment():
+    plan = segment_plan(" 중도. 쪽문 ", source_lang="ko", target_lang="en", whole=True)
+    assert plan.segments == ["중도. 쪽문"]
+    assert plan.term_match
+
+
+def test_segment_hash_normalizes_whitespace_and_nfc():
+    assert segment_hash("  a   b\n") == segment_hash("a b")
+    assert segment_hash(unicodedata.normalize("NFD", "중도")) == segment_hash("중도")
+    assert segment_hash("a b") != segment_hash("ab")
+
+
+def test_plan_hashes_follow_segments():
+    plan = segment_plan("하나. 둘. 하나.", source_lang="ko", target_lang="en")
+    assert plan.hashes == [segment_hash(s) for s in plan.segments]
+    assert plan.hashes[0] == plan.hashes[2]
+
+
+def test_item_plan_dedupes_in_first_seen_order():
+    plan = item_plan(["y", " x ", "y", "x"], source_lang="en", target_lang="ko")
+    assert plan.segments == ["y", "x"]
+    assert plan.hashes == [segment_hash("y"), segment_hash("x")]
@@ -0,0 +1,114 @@
+"""
+용어 설명 번역 일괄 채우기 (term_explanation_translation)
+
+설명이 있는 모든 용어를 지정한 언어로 미리 번역해서 저장
+- 이미 현재 설명 기준으로 번역된 (term_id, lang)은 건너뜀 (--force면 다시 번역)
+- 설명이 없는 용어는 건너뜀 (/term/explain 첫 요청 때 설명과 번역이 함께 채워짐)
+- 실행 중인 서버 워커는 TERM_INDEX_REFRESH_SECONDS 주기로 새 번역을 읽음
+
+실행 (backend 디렉터리에서, 서버와 같은 DATABASE_URL / OPENAI_API_KEY 환경):
+    python -m tools.backfill_term_translations
+    python -m tools.backfill_term_translations --langs en,uz --concurrency 4 --dry-run
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+
+import app.db.base  # noqa: F401  (모든 모델 등록)
+from app.db.session import SessionLocal
+from app.exceptions.error import AppError
+from app.models.enums import Lang
+from app.models.term import Term
+from app.models.term_explanation import TermExplanation
+from app.models.term_explanation_translation import TermExplanationTranslation
+from app.services.term_index import explanation_hash
+from app.services.term_service import term_service
+from app.services.translate_service import translate_text_async
+
+
+def _pending(langs: list[str], force: bool, limit: int | None) -> tuple[list[tuple[int, str, str, str]], int]:
+    """
+    번역할 (term_id, 용어, 설명, lang) 목록과 설명 없는 용어 수
+    """
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Term.term_id, Term.term_name, TermExplanation.explanation)
+            .outerjoin(TermExplanation, TermExplanation.term_id == Term.term_id)
+            .order_by(Term.term_id)
+        ).all()
+        existing = {
+            (t.term_id, t.lang): t.source_hash
+            for t in db.execute(select(TermExplanationTranslation)).scalars()
+        }
+
+    todo: list[tuple[int, str, str, str]] = []
+    unexplained = 0
+    for row in rows:
+        if not row.explanation:
+            unexplained += 1
+            continue
+        current = explanation_hash(row.term_name, row.explanation)
+        for lang in langs:
+            if force or existing.get((row.term_id, lang)) != current:
+                todo.append((row.term_id, row.term_name, row.explanation, lang))
+    return (todo[:limit] if limit else todo), unexplained
+
+
+async def _translate_one(item: tuple[int, str, str, str], semaphore: asyncio.Semaphore) -> bool:
+    term_id, term_name, explanation, lang = item
+    async with semaphore:
+        try:
+            translated_term, translated_explanation = await asyncio.gather(
+                translate_text_async(text=term_name, source_lang="ko", target_lang=lang),
+                translate_text_async(text=explanation, source_lang="ko", target_lang=lang),
+            )
+        except AppError as e:
+            print(f"  [failed] term_id={term_id} lang={lang} {e.error_code}: {e.message}")
+            return False
+
+    def save() -> None:
+        with SessionLocal() as db:
+            term_service.save_translation(
+                db, term_id, lang,
+                term_service._to_text(translated_term),
+                term_service._to_text(translated_explanation),
+                explanation_hash(term_name, explanation),
+            )
+
+    await asyncio.to_thread(save)
+    return True
+
+
+async def _run(args: argparse.Namespace) -> None:
+    langs = [lang.strip() for lang in args.langs.split(",") if lang.strip()]
+    for lang in langs:
+        Lang(lang)  # 지원하지 않는 언어면 ValueError
+
+    todo, unexplained = _pending([lang for lang in langs if lang != Lang.ko.value], args.force, args.limit)
+    print(f"pending translations {len(todo)}  (terms without explanation skipped: {unexplained})")
+    if args.dry_run or not todo:
+        return
+
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+    results = await asyncio.gather(*(_translate_one(item, semaphore) for item in todo))
+    done = sum(results)
+    print(f"translated {done}/{len(todo)}  failed {len(todo) - done}  in {time.perf_counter() - started:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-translate term explanations into term_explanation_translation")
+    parser.add_argument("--langs", default="en,uz", help="comma separated target languages (default: en,uz)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=None, help="translate at most N (term, lang) pairs")
+    parser.add_argument("--force", action="store_true", help="re-translate even if an up-to-date translation exists")
+    parser.add_argument("--dry-run", action="store_true", help="only count pending translations")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
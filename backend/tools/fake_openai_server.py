@@ -0,0 +1,447 @@
+"""
+부하 테스트용 가짜 OpenAI 서버 (chat completions / audio transcriptions)
+
+실제 OpenAI 비용/rate limit 없이 노트북에서 AI 라우트 처리량을 측정하기 위한 stand-in.
+- 응답 내용은 프롬프트 hash 기반으로 결정적 (같은 입력 -> 같은 출력)
+- 번역 프롬프트에는 translate_text가 기대하는 {"detected_lang","translated_text"} JSON (문장 여러 개는 {"translations":[...]})으로 응답
+- 용어 설명 + 번역 프롬프트에는 {"explanation","translated_term","translated_explanation"} JSON으로 응답
+- 지연 분포 / 429 비율 / 5xx 비율을 환경변수, CLI 인자, 실행 중 POST /_fake/config 로 조정
+
+실행 (backend 디렉터리에서):
+    python -m tools.fake_openai_server --port 8100 --latency-ms 800 --rate-429 0.02
+
+백엔드를 가짜 서버로 연결:
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=fake uvicorn app.main:app
+
+환경변수 (CLI 인자가 우선):
+    FAKE_OPENAI_LATENCY_DIST     fixed / uniform / normal / lognormal (기본 lognormal)
+    FAKE_OPENAI_LATENCY_MS       첫 토큰까지 지연의 중앙값 (기본 600)
+    FAKE_OPENAI_LATENCY_JITTER   lognormal은 sigma, uniform/normal은 중앙값 대비 비율 (기본 0.5)
+    FAKE_OPENAI_TOKEN_MS         출력 토큰 1개당 지연 (기본 15, 스트리밍 chunk 간격)
+    FAKE_OPENAI_RATE_429         429 응답 비율 0~1 (기본 0)
+    FAKE_OPENAI_RATE_5XX         500/502/503 응답 비율 0~1 (기본 0)
+    FAKE_OPENAI_RETRY_AFTER_MS   429 응답의 retry-after-ms 헤더 (기본 500)
+    FAKE_OPENAI_RESPONSE_TOKENS  일반 응답 길이(단어 수) 상한 (기본 80, 요청 max_tokens가 더 작으면 그 값)
+    FAKE_OPENAI_SEED             지연/에러 주입 난수 seed (기본 없음)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, asdict, fields
+from typing import Optional
+
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+# -----------------------------
+# 설정
+# -----------------------------
+@dataclass
+class FakeConfig:
+    latency_dist: str = "lognormal"
+    latency_ms: float = 600.0
+    latency_jitter: float = 0.5
+    token_ms: float = 15.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    retry_after_ms: int = 500
+    response_tokens: int = 80
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "FakeConfig":
+        config = cls()
+        for f in fields(cls):
+            value = os.getenv(f"FAKE_OPENAI_{f.name.upper()}")
+            if value:
+                setattr(config, f.name, _coerce(f.name, value))
+        return config
+
+    def update(self, values: dict) -> None:
+        names = {f.name for f in fields(self)}
+        for name, value in values.items():
+            if name in names and value is not None:
+                setattr(self, name, _coerce(name, value))
+
+
+def _coerce(name: str, value):
+    if name == "latency_dist":
+        value = str(value).lower()
+        if value not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"unknown latency_dist: {value}")
+        return value
+    if name in ("retry_after_ms", "response_tokens", "seed"):
+        return int(value)
+    return float(value)
+
+
+config = FakeConfig.from_env()
+_rng = random.Random(config.seed)
+
+_stats = {
+    "requests": 0,
+    "chat_completions": 0,
+    "streams": 0,
+    "transcriptions": 0,
+    "errors_429": 0,
+    "errors_5xx": 0,
+    "in_flight": 0,
+    "max_in_flight": 0,
+}
+
+
+def _sample_latency() -> float:
+    """
+    첫 토큰까지 지연(초)
+    """
+    median = config.latency_ms
+    jitter = config.latency_jitter
+    if config.latency_dist == "fixed" or median <= 0:
+        ms = median
+    elif config.latency_dist == "uniform":
+        ms = _rng.uniform(median * (1 - jitter), median * (1 + jitter))
+    elif config.latency_dist == "normal":
+        ms = _rng.gauss(median, median * jitter)
+    else:
+        ms = median * math.exp(_rng.gauss(0.0, jitter))
+    return max(0.0, ms) / 1000.0
+
+
+def _injected_error() -> Optional[JSONResponse]:
+    roll = _rng.random()
+    if roll < config.rate_429:
+        _stats["errors_429"] += 1
+        return JSONResponse(
+            status_code=429,
+            headers={"retry-after-ms": str(config.retry_after_ms)},
+            content=_error_body("Rate limit reached (fake server)", "rate_limit_exceeded", "requests"),
+        )
+    if roll < config.rate_429 + config.rate_5xx:
+        _stats["errors_5xx"] += 1
+        status = _rng.choice((500, 502, 503))
+        return JSONResponse(
+            status_code=status,
+            content=_error_body("The server had an error (fake server)", "server_error", None),
+        )
+    return None
+
+
+def _error_body(message: str, type_: str, code: Optional[str]) -> dict:
+    return {"error": {"message": message, "type": type_, "param": None, "code": code}}
+
+
+# -----------------------------
+# 결정적 응답 생성
+# -----------------------------
+_EN_WORDS = (
+    "the lecture covers key concepts and examples students should review before the exam "
+    "assignment deadline notice campus library course registration schedule professor "
+    "summary includes main points background method result and conclusion for each section"
+).split()
+_KO_WORDS = (
+    "이번 강의는 핵심 개념과 예제를 다루며 시험 전에 복습해야 할 내용을 정리합니다 "
+    "과제 마감 공지 수강 신청 도서관 일정 교수님 요약 주요 내용 배경 방법 결과 결론"
+).split()
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+_CYRILLIC_RE = re.compile(r"[Ѐ-ӿ]")
+_UZ_LATIN_RE = re.compile(r"(o['ʻ‘’]|g['ʻ‘’]|\bva\b|\bbu\b|\buchun\b|\bemas\b)", re.IGNORECASE)
+_TARGET_RE = re.compile(r"Target language:\s*([a-z]{2})")
+_TRANSLATE_TEXT_RE = re.compile(r"Text to translate:\s*(.*)$", re.DOTALL)
+_TARGETS_RE = re.compile(r"Target languages:\s*([a-z, ]+)")
+_TERM_RE = re.compile(r"^Term:\s*(.*)$", re.MULTILINE)
+_SEGMENTS_RE = re.compile(r"Segments \(JSON\):\s*(\[.*\])\s*$", re.DOTALL)
+
+
+def _seed_of(*parts: str) -> int:
+    digest = hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+    return int(digest[:16], 16)
+
+
+def _detect_lang(text: str) -> str:
+    if _HANGUL_RE.search(text):
+        return "ko"
+    if _CYRILLIC_RE.search(text) or _UZ_LATIN_RE.search(text):
+        return "uz"
+    return "en"
+
+
+def _approx_tokens(text: str) -> int:
+    return max(1, len(text) // 3)
+
+
+def _fake_words(seed_text: str, count: int, lang: str) -> str:
+    words = _KO_WORDS if lang == "ko" else _EN_WORDS
+    rng = random.Random(_seed_of(seed_text))
+    return " ".join(rng.choice(words) for _ in range(max(1, count)))
+
+
+def _chat_content(messages: list[dict], max_tokens: int) -> str:
+    system = "\n".join(m.get("content") or "" for m in messages if m.get("role") == "system")
+    user = "\n".join(m.get("content") or "" for m in messages if m.get("role") != "system")
+    prompt = system + "\n" + user
+
+    # translate_text (문장 여러 개): {"translations":[{"i","text"}]} 계약
+    segments = _SEGMENTS_RE.search(user) if '"translations"' in prompt else None
+    targets = _TARGETS_RE.search(user)
+
+    # 다중 target: {"translations":[{"i", "<lang>": ...}]} 계약
+    if segments and targets:
+        langs = [t.strip() for t in targets.group(1).split(",") if t.strip()]
+        items = json.loads(segments.group(1))
+        return json.dumps(
+            {
+                "detected_lang": _detect_lang(" ".join(item["text"] for item in items)),
+                "translations": [
+                    {"i": item["i"], **{lang: f"[{lang}] {item['text']}" for lang in langs}}
+                    for item in items
+                ],
+            },
+            ensure_ascii=False,
+        )
+
+    if segments:
+        target = _TARGET_RE.search(prompt)
+        target_lang = target.group(1) if target else "en"
+        items = json.loads(segments.group(1))
+        return json.dumps(
+            {
+                "detected_lang": _detect_lang(" ".join(item["text"] for item in items)),
+                "translations": [{"i": item["i"], "text": f"[{target_lang}] {item['text']}"} for item in items],
+            },
+            ensure_ascii=False,
+        )
+
+    # 용어 설명 + 번역 한 번에 (term_service fused): JSON 계약
+    if '"translated_explanation"' in prompt:
+        target = _TARGET_RE.search(prompt)
+        target_lang = target.group(1) if target else "en"
+        match = _TERM_RE.search(user)
+        term = match.group(1).strip() if match else ""
+        explanation = _fake_words(prompt, 12, "ko")
+        return json.dumps(
+            {
+                "explanation": explanation,
+                "translated_term": f"[{target_lang}] {term}",
+                "translated_explanation": f"[{target_lang}] {explanation}",
+            },
+            ensure_ascii=False,
+        )
+
+    # translate_text: JSON 계약
+    if "translated_text" in prompt:
+        target = _TARGET_RE.search(prompt)
+        target_lang = target.group(1) if target else "en"
+        match = _TRANSLATE_TEXT_RE.search(user)
+        source = (match.group(1) if match else user).strip()
+        return json.dumps(
+            {"detected_lang": _detect_lang(source), "translated_text": f"[{target_lang}] {source}"},
+            ensure_ascii=False,
+        )
+
+    limit = min(config.response_tokens, max_tokens or config.response_tokens)
+    lang = _detect_lang(user)
+
+    # 채팅 제목: 짧게
+    if "title" in system.lower():
+        return _fake_words(prompt, min(4, limit), lang)
+
+    return _fake_words(prompt, limit, lang)
+
+
+def _split_tokens(content: str) -> list[str]:
+    # 공백 포함 단어 단위로 쪼개서 스트리밍 (JSON 응답도 그대로 이어붙이면 원문이 됨)
+    return re.findall(r"\s*\S+", content) or [content]
+
+
+# -----------------------------
+# 앱
+# -----------------------------
+app = FastAPI(title="Fake OpenAI", version="0.1.0")
+
+
+@app.middleware("http")
+async def _count_in_flight(request: Request, call_next):
+    _stats["requests"] += 1
+    _stats["in_flight"] += 1
+    _stats["max_in_flight"] = max(_stats["max_in_flight"], _stats["in_flight"])
+    try:
+        return await call_next(request)
+    finally:
+        _stats["in_flight"] -= 1
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model") or "gpt-4o-mini"
+    messages = body.get("messages") or []
+    max_tokens = int(body.get("max_tokens") or body.get("max_completion_tokens") or config.response_tokens)
+
+    await asyncio.sleep(_sample_latency())
+    error = _injected_error()
+    if error is not None:
+        return error
+
+    content = _chat_content(messages, max_tokens)
+    tokens = _split_tokens(content)
+    usage = {
+        "prompt_tokens": sum(_approx_tokens(m.get("content") or "") for m in messages),
+        "completion_tokens": len(tokens),
+    }
+    usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+    completion_id = f"chatcmpl-fake-{uuid.uuid4().hex[:12]}"
+    created = int(time.time())
+
+    if body.get("stream"):
+        _stats["streams"] += 1
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        return StreamingResponse(
+            _stream_chunks(completion_id, created, model, tokens, usage if include_usage else None),
+            media_type="text/event-stream",
+        )
+
+    _stats["chat_completions"] += 1
+    await asyncio.sleep(len(tokens) * config.token_ms / 1000.0)
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": usage,
+    }
+
+
+async def _stream_chunks(completion_id: str, created: int, model: str, tokens: list[str], usage: Optional[dict]):
+    def chunk(delta: dict, finish_reason: Optional[str] = None) -> str:
+        data = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    yield chunk({"role": "assistant", "content": ""})
+    for token in tokens:
+        yield chunk({"content": token})
+        await asyncio.sleep(config.token_ms / 1000.0)
+    yield chunk({}, "stop")
+
+    if usage is not None:
+        data = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [],
+            "usage": usage,
+        }
+        yield f"data: {json.dumps(data)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+@app.post("/v1/audio/transcriptions")
+async def audio_transcriptions(
+    file: UploadFile = File(...),
+    model: str = Form("gpt-4o-mini-transcribe"),
+    language: Optional[str] = Form(None),
+):
+    audio = await file.read()
+    await asyncio.sleep(_sample_latency())
+    error = _injected_error()
+    if error is not None:
+        return error
+
+    _stats["transcriptions"] += 1
+    words = max(3, min(config.response_tokens, len(audio) // 2000))
+    text = _fake_words(hashlib.sha256(audio).hexdigest(), words, language or "en")
+    await asyncio.sleep(words * config.token_ms / 1000.0)
+    input_tokens = max(1, len(audio) // 1000)
+    return {
+        "text": text,
+        "usage": {
+            "type": "tokens",
+            "input_tokens": input_tokens,
+            "output_tokens": words,
+            "total_tokens": input_tokens + words,
+        },
+    }
+
+
+@app.get("/_fake/config")
+def get_config():
+    return asdict(config)
+
+
+@app.post("/_fake/config")
+async def set_config(request: Request):
+    # 실행 중 지연/에러율 변경 (예: {"rate_429": 0.2})
+    global _rng
+    values = await request.json()
+    try:
+        config.update(values)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"detail": str(e)})
+    if "seed" in values:
+        _rng = random.Random(config.seed)
+    return asdict(config)
+
+
+@app.get("/_fake/stats")
+def get_stats():
+    return dict(_stats)
+
+
+@app.post("/_fake/stats/reset")
+def reset_stats():
+    for name in _stats:
+        if name != "in_flight":
+            _stats[name] = 0
+    return dict(_stats)
+
+
+def main() -> None:
+    global _rng
+    parser = argparse.ArgumentParser(description="Fake OpenAI server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-dist", choices=("fixed", "uniform", "normal", "lognormal"))
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--latency-jitter", type=float)
+    parser.add_argument("--token-ms", type=float)
+    parser.add_argument("--rate-429", type=float)
+    parser.add_argument("--rate-5xx", type=float)
+    parser.add_argument("--retry-after-ms", type=int)
+    parser.add_argument("--response-tokens", type=int)
+    parser.add_argument("--seed", type=int)
+    args = vars(parser.parse_args())
+
+    host, port = args.pop("host"), args.pop("port")
+    config.update(args)
+    _rng = random.Random(config.seed)
+
+    import uvicorn
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+용어 사전(term / term_explanation) 일괄 가져오기 / 내보내기
+
+- import: CSV(term,explanation 헤더) 또는 JSONL({"term", "explanation"})을 읽어 upsert
+  - 용어 이름은 NFC + 공백 정리, 파일 안에서 같은 용어가 여러 번 나오면 마지막 행 사용
+  - 띄어쓰기 / 대소문자만 다른 이름(fuzzy_key가 같은 이름)은 기존 용어(없으면 파일에서 먼저 나온 이름)로 합침
+    (' 센  팍 ' -> 기존 '센팍', 새 '센 팍' 행을 만들지 않음). 합친 이름은 결과에 출력
+  - explanation이 비어 있으면 용어만 추가하고 기존 설명은 건드리지 않음
+  - 설명이 바뀐 용어는 저장된 번역(term_explanation_translation)을 지움
+  - 같은 파일을 다시 넣으면 모두 unchanged (멱등)
+  - Postgres: 임시 스테이징 테이블에 COPY -> 집합 단위 INSERT ... ON CONFLICT
+    그 외(SQLite 등): 한 트랜잭션에서 executemany
+- export: 현재 사전을 CSV / JSONL로 (설명 없는 용어는 explanation 빈 값)
+- seed: app/db/seeds/*.sql의 VALUES 목록을 읽어 import와 같은 방식으로 적재 (손으로 SQL 실행하던 것 대체)
+- 실행 중인 서버 워커는 TERM_INDEX_REFRESH_SECONDS 주기로 바뀐 사전을 읽음
+
+실행 (backend 디렉터리에서, 서버와 같은 DATABASE_URL 환경):
+    python -m tools.glossary import terms.csv
+    python -m tools.glossary import terms.jsonl --dry-run
+    python -m tools.glossary export --format jsonl --out terms.jsonl
+    python -m tools.glossary seed
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import bindparam, delete, insert, select, update
+
+import app.db.base  # noqa: F401  (모든 모델 등록)
+from app.db.session import engine
+from app.models.term import Term
+from app.models.term_explanation import TermExplanation
+from app.models.term_explanation_translation import TermExplanationTranslation
+from app.services.term_index import fuzzy_key, normalize_term
+
+_TERM_NAME_MAX = Term.__table__.c.term_name.type.length
+# SQLite 바인드 변수 개수 제한 안에서 나눠 삭제
+_DELETE_BATCH = 500
+_SEEDS_DIR = Path(__file__).resolve().parent.parent / "app" / "db" / "seeds"
+# ('용어') 또는 ('용어', '설명') ('' 는 작은따옴표 escape)
+_SEED_ROW_RE = re.compile(r"\(\s*'((?:[^']|'')*)'\s*(?:,\s*'((?:[^']|'')*)'\s*)?\)")
+# 결과에 보여줄 합친 이름 수
+_MERGED_SHOWN = 20
+
+
+# -----------------------------
+# 입력
+# -----------------------------
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    suffix = Path(path).suffix.lower()
+    if suffix in (".csv", ".jsonl"):
+        return suffix[1:]
+    raise SystemExit(f"cannot tell the format of {path!r}; pass --format csv or --format jsonl")
+
+
+def _read_rows(path: str, fmt: str) -> Iterator[tuple[str, Optional[str]]]:
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            for record in csv.DictReader(stream):
+                yield record.get("term") or record.get("term_name") or "", record.get("explanation")
+        else:
+            for line in stream:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record.get("term") or record.get("term_name") or "", record.get("explanation")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _read_seeds() -> Iterator[tuple[str, Optional[str]]]:
+    for path in sorted(_SEEDS_DIR.glob("*.sql")):
+        for term_name, explanation in _SEED_ROW_RE.findall(path.read_text(encoding="utf-8")):
+            yield term_name.replace("''", "'"), (explanation.replace("''", "'") or None)
+
+
+def _prepare(rows: Iterable[tuple[str, Optional[str]]]) -> tuple[dict[str, Optional[str]], int]:
+    """
+    {정규화한 용어: 설명 또는 None}과 건너뛴 행 수 (빈 용어 / 너무 긴 용어)
+    - 같은 용어는 마지막 행, 단 설명이 있던 용어를 설명 없는 행이 지우지는 않음
+    """
+    glossary: dict[str, Optional[str]] = {}
+    skipped = 0
+    for term_name, explanation in rows:
+        name = normalize_term(term_name or "")
+        if not name or len(name) > _TERM_NAME_MAX:
+            skipped += 1
+            continue
+        explanation = (explanation or "").strip() or None
+        if explanation is not None or name not in glossary:
+            glossary[name] = explanation
+    return glossary, skipped
+
+
+def _merge_near_duplicates(glossary: dict[str, Optional[str]]) -> tuple[dict[str, Optional[str]], list[tuple[str, str]]]:
+    """
+    fuzzy_key가 같은 이름을 한 용어로 -> (합친 사전, [(입력 이름, 합쳐진 이름)])
+    - 기존 용어가 우선, 그다음 파일에서 먼저 나온 이름
+    - 설명은 _prepare와 같은 규칙 (설명 없는 행이 설명을 지우지 않음)
+    """
+    with engine.connect() as conn:
+        existing = conn.execute(select(Term.term_name)).scalars().all()
+    canonical: dict[str, str] = {}
+    for name in existing:
+        canonical.setdefault(fuzzy_key(name), name)
+    existing_names = set(existing)
+
+    merged_glossary: dict[str, Optional[str]] = {}
+    merged: list[tuple[str, str]] = []
+    for name, explanation in glossary.items():
+        if name not in existing_names:
+            target = canonical.setdefault(fuzzy_key(name), name)
+            if target != name:
+                merged.append((name, target))
+                name = target
+        if explanation is not None or name not in merged_glossary:
+            merged_glossary[name] = explanation
+    return merged_glossary, merged
+
+
+# -----------------------------
+# 적재
+# -----------------------------
+def _upsert_postgres(glossary: dict[str, Optional[str]], dry_run: bool) -> dict:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for name, explanation in glossary.items():
+        writer.writerow((name, explanation if explanation is not None else r"\N"))
+    buffer.seek(0)
+
+    raw = engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        cur.execute("CREATE TEMP TABLE glossary_stage (term_name text PRIMARY KEY, explanation text) ON COMMIT DROP")
+        cur.copy_expert(r"COPY glossary_stage (term_name, explanation) FROM STDIN WITH (FORMAT csv, NULL '\N')", buffer)
+
+        cur.execute(
+            "INSERT INTO term (term_name) SELECT term_name FROM glossary_stage "
+            "ON CONFLICT (term_name) DO NOTHING"
+        )
+        terms_inserted = cur.rowcount
+
+        # xmax = 0 -> 새로 INSERT된 행, 아니면 UPDATE. 설명이 같으면 WHERE에서 걸러져 반환되지 않음 (unchanged)
+        cur.execute(
+            "INSERT INTO term_explanation (term_id, explanation) "
+            "SELECT t.term_id, s.explanation FROM glossary_stage s JOIN term t ON t.term_name = s.term_name "
+            "WHERE s.explanation IS NOT NULL "
+            "ON CONFLICT (term_id) DO UPDATE SET explanation = EXCLUDED.explanation "
+            "WHERE term_explanation.explanation IS DISTINCT FROM EXCLUDED.explanation "
+            "RETURNING term_id, (xmax = 0) AS inserted"
+        )
+        changed = cur.fetchall()
+        updated_ids = [term_id for term_id, inserted in changed if not inserted]
+        if updated_ids:
+            cur.execute("DELETE FROM term_explanation_translation WHERE term_id = ANY(%s)", (updated_ids,))
+
+        if dry_run:
+            raw.rollback()
+        else:
+            raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    explained = sum(1 for explanation in glossary.values() if explanation is not None)
+    inserted = len(changed) - len(updated_ids)
+    return {
+        "terms_inserted": terms_inserted,
+        "explanations_inserted": inserted,
+        "explanations_updated": len(updated_ids),
+        "explanations_unchanged": explained - len(changed),
+    }
+
+
+def _upsert_generic(glossary: dict[str, Optional[str]], dry_run: bool) -> dict:
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            ids = dict(conn.execute(select(Term.term_name, Term.term_id)).all())
+            new_terms = [name for name in glossary if name not in ids]
+            if new_terms:
+                conn.execute(insert(Term), [{"term_name": name} for name in new_terms])
+                ids = dict(conn.execute(select(Term.term_name, Term.term_id)).all())
+
+            current = dict(conn.execute(select(TermExplanation.term_id, TermExplanation.explanation)).all())
+            inserts: list[dict] = []
+            updates: list[dict] = []
+            unchanged = 0
+            for name, explanation in glossary.items():
+                if explanation is None:
+                    continue
+                term_id = ids[name]
+                if term_id not in current:
+                    inserts.append({"term_id": term_id, "explanation": explanation})
+                elif current[term_id] != explanation:
+                    updates.append({"b_term_id": term_id, "b_explanation": explanation})
+                else:
+                    unchanged += 1
+
+            if inserts:
+                conn.execute(insert(TermExplanation), inserts)
+            if updates:
+                conn.execute(
+                    update(TermExplanation)
+                    .where(TermExplanation.term_id == bindparam("b_term_id"))
+                    .values(explanation=bindparam("b_explanation")),
+                    updates,
+                )
+                updated_ids = [u["b_term_id"] for u in updates]
+                for i in range(0, len(updated_ids), _DELETE_BATCH):
+                    conn.execute(
+                        delete(TermExplanationTranslation)
+                        .where(TermExplanationTranslation.term_id.in_(updated_ids[i:i + _DELETE_BATCH]))
+                    )
+
+            if dry_run:
+                trans.rollback()
+            else:
+                trans.commit()
+        except Exception:
+            trans.rollback()
+            raise
+
+    return {
+        "terms_inserted": len(new_terms),
+        "explanations_inserted": len(inserts),
+        "explanations_updated": len(updates),
+        "explanations_unchanged": unchanged,
+    }
+
+
+def load_glossary(rows: Iterable[tuple[str, Optional[str]]], *, dry_run: bool = False) -> dict:
+    """
+    (용어, 설명) 목록을 사전에 upsert하고 건수 반환
+    """
+    glossary, skipped = _prepare(rows)
+    glossary, merged = _merge_near_duplicates(glossary) if glossary else (glossary, [])
+    if not glossary:
+        stats = {"terms_inserted": 0, "explanations_inserted": 0, "explanations_updated": 0, "explanations_unchanged": 0}
+    elif engine.dialect.name == "postgresql":
+        stats = _upsert_postgres(glossary, dry_run)
+    else:
+        stats = _upsert_generic(glossary, dry_run)
+    return {"rows": len(glossary), "skipped": skipped, "merged": merged, **stats}
+
+
+# -----------------------------
+# 내보내기
+# -----------------------------
+def export_glossary(out, fmt: str) -> int:
+    query = (
+        select(Term.term_name, TermExplanation.explanation)
+        .outerjoin(TermExplanation, TermExplanation.term_id == Term.term_id)
+        .order_by(Term.term_id)
+    )
+    writer = csv.writer(out) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(("term", "explanation"))
+
+    count = 0
+    with engine.connect() as conn:
+        for term_name, explanation in conn.execution_options(yield_per=5000).execute(query):
+            if writer is not None:
+                writer.writerow((term_name, explanation or ""))
+            else:
+                out.write(json.dumps({"term": term_name, "explanation": explanation}, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def _print_stats(stats: dict, started: float, dry_run: bool) -> None:
+    merged = stats["merged"]
+    for name, target in merged[:_MERGED_SHOWN]:
+        print(f"merged {name!r} -> {target!r}", file=sys.stderr)
+    if len(merged) > _MERGED_SHOWN:
+        print(f"... and {len(merged) - _MERGED_SHOWN} more", file=sys.stderr)
+    print(
+        f"{'[dry-run] ' if dry_run else ''}rows {stats['rows']} (skipped {stats['skipped']}, merged {len(merged)})  "
+        f"terms inserted {stats['terms_inserted']}  "
+        f"explanations inserted {stats['explanations_inserted']} / updated {stats['explanations_updated']} / "
+        f"unchanged {stats['explanations_unchanged']}  in {time.perf_counter() - started:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import / export the term glossary (term + term_explanation)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p_import = commands.add_parser("import", help="upsert terms from a CSV / JSONL file ('-' for stdin)")
+    p_import.add_argument("path")
+    p_import.add_argument("--format", choices=("csv", "jsonl"), default=None, help="default: from the file extension")
+    p_import.add_argument("--dry-run", action="store_true", help="report counts and roll back")
+
+    p_export = commands.add_parser("export", help="write the glossary as CSV / JSONL")
+    p_export.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    p_export.add_argument("--out", default="-", help="output file (default: stdout)")
+
+    p_seed = commands.add_parser("seed", help="load app/db/seeds/*.sql")
+    p_seed.add_argument("--dry-run", action="store_true", help="report counts and roll back")
+
+    args = parser.parse_args()
+    started = time.perf_counter()
+
+    if args.command == "export":
+        out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8", newline="")
+        try:
+            count = export_glossary(out, args.format)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"exported {count} terms in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+        return
+
+    if args.command == "seed":
+        rows = _read_seeds()
+    else:
+        rows = _read_rows(args.path, _detect_format(args.path, args.format))
+    _print_stats(load_glossary(rows, dry_run=args.dry_run), started, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
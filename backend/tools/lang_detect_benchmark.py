@@ -0,0 +1,118 @@
+"""
+로컬 언어 감지(app/services/lang_detect.py) 정확도 / 속도 벤치마크
+
+라벨이 붙은 샘플(ko / en / uz 라틴 / uz 키릴 / 섞인 텍스트 / 짧은 UI 문구)로
+- 전체 정확도, confident(LANG_DETECT_MIN_CONFIDENCE 이상)로 판정된 비율과 그 정확도
+  (confident가 아니면 서비스는 LLM auto-detect로 넘김)
+- 호출당 시간 (짧은 문구 / 4000자 문서)
+을 출력
+
+실행 (backend 디렉터리에서):
+    python -m tools.lang_detect_benchmark
+    python -m tools.lang_detect_benchmark --verbose --iterations 20000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from collections import defaultdict
+
+from app.services.lang_detect import detect_lang
+
+# (기대 언어, 텍스트, 분류)
+SAMPLES: list[tuple[str, str, str]] = [
+    # ko
+    ("ko", "중도", "short"),
+    ("ko", "센팍에서 만나자", "short"),
+    ("ko", "이번 주 과제 마감이 언제인가요?", "sentence"),
+    ("ko", "교수님께서 다음 강의는 온라인으로 진행한다고 공지하셨습니다.", "sentence"),
+    ("ko", "수강 신청 기간에는 학사 시스템 접속이 느려질 수 있으니 미리 장바구니를 확인하세요.", "sentence"),
+    ("ko", "오늘 수업은 REST API 설계와 HTTP 상태 코드를 다룹니다.", "mixed"),
+    ("ko", "중간고사 범위는 Chapter 1부터 5까지이고 quiz는 없습니다.", "mixed"),
+    ("ko", "도서관 열람실 좌석 예약은 앱에서 할 수 있어요.", "sentence"),
+    # en
+    ("en", "Hello", "short"),
+    ("en", "Settings", "short"),
+    ("en", "Please submit the assignment before the deadline.", "sentence"),
+    ("en", "The professor announced that the next lecture will be held online.", "sentence"),
+    ("en", "What time does the library open on weekends?", "sentence"),
+    ("en", "This course covers the basics of machine learning and its applications.", "sentence"),
+    ("en", "The meeting began with a long agenda and many planning items.", "sentence"),
+    ("en", "Registration for the spring semester opens next Monday.", "sentence"),
+    ("en", "I was running in the morning with my roommate.", "sentence"),
+    # uz (라틴)
+    ("uz", "Salom", "short"),
+    ("uz", "Rahmat", "short"),
+    ("uz", "Bu kitob juda yaxshi va oʻqish uchun qulay.", "sentence"),
+    ("uz", "Talabalar imtihonga tayyorlanmoqda.", "sentence"),
+    ("uz", "Men bugun universitetga bordim.", "sentence"),
+    ("uz", "Qanday yordam bera olaman?", "sentence"),
+    ("uz", "Dars jadvali keyingi haftada oʻzgaradi.", "sentence"),
+    ("uz", "Kutubxona shanba kunlari soat toʻqqizda ochiladi.", "sentence"),
+    ("uz", "Professor keyingi ma'ruza onlayn boʻlishini aytdi.", "sentence"),
+    ("uz", "Bu dars juda muhim, lekin vazifa ham bor.", "sentence"),
+    ("uz", "Biz machine learning kursini olishimiz kerak.", "mixed"),
+    # uz (키릴)
+    ("uz", "Ўзбекистон пойтахти Тошкент", "sentence"),
+    ("uz", "Талабалар имтиҳонга тайёрланмоқда.", "sentence"),
+    ("uz", "Салом", "short"),
+]
+
+_LONG_DOC = (
+    "교수님께서 다음 강의는 온라인으로 진행한다고 공지하셨습니다. "
+    "This course covers the basics of machine learning. "
+) * 60
+
+
+def _evaluate(verbose: bool) -> None:
+    by_kind: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    total = correct = confident = confident_correct = 0
+
+    for expected, text, kind in SAMPLES:
+        detection = detect_lang(text)
+        ok = detection.lang == expected
+        total += 1
+        correct += ok
+        by_kind[kind][0] += ok
+        by_kind[kind][1] += 1
+        if detection.confident:
+            confident += 1
+            confident_correct += ok
+        if verbose and (not ok or not detection.confident):
+            mark = "WRONG" if not ok else "low"
+            print(f"  [{mark}] expected={expected} got={detection.lang} "
+                  f"confidence={detection.confidence:.2f} mixed={detection.mixed} {text!r}")
+
+    print(f"accuracy            {correct}/{total} ({correct / total:.1%})")
+    print(f"confident coverage  {confident}/{total} ({confident / total:.1%})  "
+          f"- the rest falls back to LLM auto-detect")
+    if confident:
+        print(f"confident accuracy  {confident_correct}/{confident} ({confident_correct / confident:.1%})")
+    for kind, (ok, n) in sorted(by_kind.items()):
+        print(f"  {kind:<9} {ok}/{n}")
+
+
+def _timeit(text: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        detect_lang(text)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark local language detection")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--verbose", action="store_true", help="print wrong / low-confidence samples")
+    args = parser.parse_args()
+
+    _evaluate(args.verbose)
+
+    short = _timeit("이번 주 과제 마감이 언제인가요?", args.iterations)
+    sentence = _timeit("The professor announced that the next lecture will be held online.", args.iterations)
+    long_doc = _timeit(_LONG_DOC, max(1, args.iterations // 10))
+    print(f"latency per call    short={short:.1f}us  sentence={sentence:.1f}us  "
+          f"{min(len(_LONG_DOC), 4000)}-char doc={long_doc:.1f}us")
+
+
+if __name__ == "__main__":
+    main()